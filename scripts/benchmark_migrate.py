@@ -0,0 +1,613 @@
+import datetime
+import io
+import json
+import multiprocessing
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+import uuid
+from decimal import Decimal
+from typing import Callable, Dict, Iterator, List
+
+import django
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.core.management.color import no_style
+from django.db import connections
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.functions import Mod
+from django.utils import timezone
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'conf.settings')
+django.setup()
+
+from scripts.migrate_db import ColumnPlan, DatabaseMigrator, JsonReportSink  # noqa: E402
+
+
+def get_peak_rss_mb() -> float:
+    """현재 프로세스와 종료된 자식 프로세스(마이그레이션 워커) 중 가장 큰 최대 RSS (MB)"""
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss 는 Linux 에서 KB, macOS 에서 바이트 단위
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def run_in_process(function: Callable, *args) -> tuple:
+    """함수를 포크한 프로세스에서 실행하고 (결과, 최대 RSS MB) 반환
+
+    측정마다 새 프로세스를 사용해 최대 RSS 가 이전 측정이나 데이터 생성의 영향을 받지 않도록 한다.
+    """
+    # 자식 프로세스는 전용 연결을 새로 맺도록 포크 전에 연결을 모두 닫음
+    connections.close_all()
+    sys.stdout.flush()
+    context = multiprocessing.get_context('fork')
+    receiver, sender = context.Pipe(duplex=False)
+
+    def target():
+        try:
+            sender.send(('ok', function(*args), get_peak_rss_mb()))
+        except Exception as e:
+            sender.send(('error', f"{type(e).__name__}: {e}", get_peak_rss_mb()))
+        finally:
+            sys.stdout.flush()
+            connections.close_all()
+
+    process = context.Process(target=target)
+    process.start()
+    sender.close()
+    try:
+        message = receiver.recv()
+    except EOFError:
+        message = None
+    process.join()
+
+    if message is None:
+        raise RuntimeError(f"Benchmark process exited with code {process.exitcode}")
+    status, value, peak_rss = message
+    if status == 'error':
+        raise RuntimeError(value)
+    return value, peak_rss
+
+
+class SyntheticDataGenerator:
+    """FK 를 지키는 합성 데이터를 old_db 에 생성
+
+    scale 1 이면 가장 큰 테이블(LoginLog, NaverAdvertisementLog)이 1만 행, 5000 이면 5천만 행이 된다.
+    PK 는 1부터 순서대로 부여하고 외래키는 이미 생성한 부모 PK 범위에서 고르며, 같은 seed 는 같은 데이터를 만든다.
+    """
+
+    BASE_ROWS = 10000
+
+    # scale 에 비례하는 모델별 행 수 비율 (Profile 은 User 와 1:1)
+    ROW_RATIOS = {
+        'auth.user': 0.1,
+        'member.profile': 0.1,
+        'member.loginlog': 1.0,
+        'shop.voucher': 0.8,
+        'shop.order': 0.4,
+        'shop.orderproduct': 0.6,
+        'shop.naveradvertisementlog': 1.0,
+    }
+
+    # scale 과 무관한 기준 데이터 행 수
+    FIXED_ROWS = {
+        'rakmai.menuitem': 20,
+        'shop.store': 1,
+        'shop.category': 30,
+        'shop.product': 300,
+    }
+
+    # 생성 순서 (참조되는 모델 먼저)
+    MODELS = [
+        'auth.user',
+        'member.profile',
+        'member.loginlog',
+        'rakmai.menuitem',
+        'shop.store',
+        'shop.category',
+        'shop.product',
+        'shop.voucher',
+        'shop.order',
+        'shop.orderproduct',
+        'shop.naveradvertisementlog',
+    ]
+
+    FIRST_NAMES = ['민준', '서연', '도윤', '지우', '하준', '서윤', '시우', '하은', '지호', '민서']
+    LAST_NAMES = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임']
+    KEYWORDS = ['문화상품권', '컬쳐랜드', '해피머니', '구글기프트카드', '넥슨카드', '틴캐시', '도서문화상품권', '에그머니']
+    USER_AGENTS = [
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+        'Chrome/129.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (iPhone; CPU iPhone OS 17_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) '
+        'Version/17.6 Mobile/15E148 Safari/604.1',
+        'Mozilla/5.0 (Linux; Android 14; SM-S918N) AppleWebKit/537.36 (KHTML, like Gecko) '
+        'Chrome/129.0.0.0 Mobile Safari/537.36 NAVER(inapp; search; 2000; 12.8.3)',
+        'Mozilla/5.0 (Linux; Android 13; SM-A536N) AppleWebKit/537.36 (KHTML, like Gecko) '
+        'SamsungBrowser/26.0 Chrome/122.0.0.0 Mobile Safari/537.36',
+    ]
+    # 실제 해시와 길이만 같은 고정 비밀번호 문자열 (행마다 해시를 계산하지 않음)
+    PASSWORD = 'pbkdf2_sha256$870000$benchmarksalt00000000$' + 'A' * 43 + '='
+
+    def __init__(self, using='old_db', scale: float = 1, seed=0, batch_size=10000, days=3 * 365):
+        self.using = using
+        self.scale = scale
+        self.seed = seed
+        self.batch_size = batch_size
+        self.models: List[Model] = [apps.get_model(label) for label in self.MODELS]
+        self.counts: Dict[str, int] = {
+            label: max(1, int(self.BASE_ROWS * scale * ratio)) for label, ratio in self.ROW_RATIOS.items()
+        }
+        self.counts.update(self.FIXED_ROWS)
+        # 생성 시각은 PK 순서대로 지난 days 일에 고르게 분포
+        self.ended = timezone.now().replace(microsecond=0)
+        self.span_seconds = days * 24 * 60 * 60
+        # COPY 텍스트 인코딩과 시퀀스 조정은 마이그레이터의 로직을 그대로 사용
+        self.encoder = DatabaseMigrator(app_labels=[])
+
+    def generate(self) -> Dict[str, int]:
+        """old_db 의 대상 테이블을 비우고 모델별 합성 행을 생성"""
+        print(f"Generating synthetic data in {self.using} (scale {self.scale}, seed {self.seed})")
+        self.clear()
+
+        for model in self.models:
+            start_time = time.time()
+            total_count = self.load_rows(model, self.iter_batches(model))
+            duration = time.time() - start_time
+            print(f"Generated {total_count} {model._meta.label} rows in {duration:.2f}s "
+                  f"({total_count / duration if duration else 0:.0f} rows/s)")
+
+        self.encoder.reset_sequences(self.models, using=self.using)
+        self.analyze()
+        return dict(self.counts)
+
+    def clear(self, using: str = None):
+        """대상 테이블 비우기 (이 테이블을 참조하는 테이블도 함께 비워짐)"""
+        connection = connections[using or self.using]
+        tables = [model._meta.db_table for model in self.models]
+        sql_list = connection.ops.sql_flush(no_style(), tables, reset_sequences=True, allow_cascade=True)
+        connection.ops.execute_sql_flush(sql_list)
+
+    def analyze(self):
+        """생성한 테이블의 통계 갱신 (PostgreSQL 은 힌트 비트까지 기록해 첫 시나리오만 느려지지 않도록 VACUUM)"""
+        connection = connections[self.using]
+        quote_name = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            for model in self.models:
+                table = quote_name(model._meta.db_table)
+                if connection.vendor == 'postgresql':
+                    cursor.execute(f"VACUUM ANALYZE {table}")
+                elif connection.vendor == 'mysql':
+                    cursor.execute(f"ANALYZE TABLE {table}")
+                    cursor.fetchall()
+            if connection.vendor == 'sqlite':
+                cursor.execute("ANALYZE")
+
+    def touch_rows(self, fraction: float) -> int:
+        """delta 시나리오용으로 modified 가 있는 모델의 일부 행을 방금 수정된 것으로 표시"""
+        step = max(1, round(1 / fraction))
+        now = timezone.now()
+        touched = 0
+        for model in self.models:
+            if not any(field.name == 'modified' for field in model._meta.concrete_fields):
+                continue
+            touched += model._base_manager.using(self.using) \
+                .alias(bucket=Mod('pk', step)).filter(bucket=0).update(modified=now)
+        print(f"Marked {touched} {self.using} rows as modified for the delta scenario")
+        return touched
+
+    def iter_batches(self, model) -> Iterator[list]:
+        """모델의 합성 행 튜플(concrete_fields 순서)을 batch_size 단위로 생성"""
+        label = model._meta.label_lower
+        count = self.counts[label]
+        rng = random.Random(f"{self.seed}:{label}")
+        make_row = getattr(self, f"make_{model._meta.model_name}")
+        fields = model._meta.concrete_fields
+        field_names = {field.attname for field in fields}
+        timestamped = 'created' in field_names and 'modified' in field_names
+        started = self.ended - datetime.timedelta(seconds=self.span_seconds)
+
+        batch = []
+        for pk in range(1, count + 1):
+            created = started + datetime.timedelta(seconds=self.span_seconds * pk // count)
+            values = make_row(pk, rng, created)
+            values[model._meta.pk.attname] = pk
+            if timestamped:
+                values.setdefault('created', created)
+                values.setdefault('modified', created)
+            # 지정하지 않은 필드는 모델 기본값 사용
+            batch.append([values[field.attname] if field.attname in values else field.get_default()
+                          for field in fields])
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def load_rows(self, model, batches: Iterator[list]) -> int:
+        """PostgreSQL 은 COPY FROM STDIN, 그 외에는 executemany 로 배치마다 커밋하며 적재"""
+        connection = connections[self.using]
+        ops = connection.ops
+        count = self.counts[model._meta.label_lower]
+        if connection.vendor == 'postgresql':
+            converters = self.encoder.get_copy_converters(model, 'postgresql')
+            sql = (f"COPY {ops.quote_name(model._meta.db_table)} "
+                   f"({', '.join(ops.quote_name(field.column) for field in model._meta.concrete_fields)}) "
+                   f"FROM STDIN")
+        else:
+            plan = ColumnPlan(model, None, self.using)
+
+        total_count = 0
+        for rows in batches:
+            with transaction.atomic(using=self.using), connection.cursor() as cursor:
+                if connection.vendor == 'postgresql':
+                    cursor.copy_expert(sql, io.BytesIO(self.encoder.encode_copy_rows(rows, converters)))
+                else:
+                    cursor.executemany(plan.insert_sql(1), plan.convert(rows))
+            total_count += len(rows)
+            print(f"{total_count}/{count} {model._meta.label} rows generated")
+        return total_count
+
+    @staticmethod
+    def make_ip_address(rng: random.Random) -> str:
+        return f"{rng.randint(1, 223)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}"
+
+    @staticmethod
+    def get_choices(choices) -> list:
+        return [value for value, _ in choices]
+
+    def make_user(self, pk: int, rng: random.Random, created: datetime.datetime) -> dict:
+        return {
+            'password': self.PASSWORD,
+            'last_login': created + datetime.timedelta(days=rng.randint(0, 365)) if rng.random() < 0.8 else None,
+            'username': f"user{pk}",
+            'first_name': rng.choice(self.FIRST_NAMES),
+            'last_name': rng.choice(self.LAST_NAMES),
+            'email': f"user{pk}@example.com",
+            'is_active': rng.random() < 0.98,
+            'date_joined': created,
+        }
+
+    def make_profile(self, pk: int, rng: random.Random, created: datetime.datetime) -> dict:
+        order_count = rng.randint(0, 50)
+        return {
+            'user_id': pk,
+            'phone': f"010{rng.randint(10000000, 99999999)}",
+            'phone_verified': order_count > 0,
+            'total_order_count': order_count,
+            'last_purchased': created + datetime.timedelta(days=rng.randint(0, 365)) if order_count else None,
+            'gender': rng.randint(0, 1),
+        }
+
+    def make_loginlog(self, pk: int, rng: random.Random, created: datetime.datetime) -> dict:
+        return {
+            'user_id': rng.randint(1, self.counts['auth.user']) if rng.random() < 0.97 else None,
+            'ip_address': self.make_ip_address(rng),
+        }
+
+    def make_menuitem(self, pk: int, rng: random.Random, created: datetime.datetime) -> dict:
+        # 모두 루트 노드로 생성 (트리 값은 마이그레이터의 rebuild_trees 로 다시 계산 가능)
+        return {
+            'parent_id': None,
+            'title': f"Menu {pk}",
+            'url': f"/menu/{pk}/",
+            'lft': 1,
+            'rght': 2,
+            'tree_id': pk,
+            'level': 0,
+        }
+
+    def make_store(self, pk: int, rng: random.Random, created: datetime.datetime) -> dict:
+        return {
+            'name': 'Pincoin' if pk == 1 else f"Store {pk}",
+            'code': 'default' if pk == 1 else f"store-{pk}",
+        }
+
+    def make_category(self, pk: int, rng: random.Random, created: datetime.datetime) -> dict:
+        return {
+            'parent_id': None,
+            'title': rng.choice(self.KEYWORDS),
+            'slug': f"category-{pk}",
+            'lft': 1,
+            'rght': 2,
+            'tree_id': pk,
+            'level': 0,
+            'store_id': rng.randint(1, self.counts['shop.store']),
+            'discount_rate': Decimal(rng.randint(0, 10)) / 100,
+        }
+
+    def make_product(self, pk: int, rng: random.Random, created: datetime.datetime) -> dict:
+        list_price = rng.randint(1, 50) * 10000
+        return {
+            'name': f"{rng.choice(self.KEYWORDS)} {list_price // 10000}만원",
+            'code': f"product-{pk}",
+            'list_price': Decimal(list_price),
+            'selling_price': Decimal(list_price - list_price // 20),
+            'store_id': rng.randint(1, self.counts['shop.store']),
+            'category_id': (pk - 1) % self.counts['shop.category'] + 1,
+            'position': pk,
+            'status': 0,
+        }
+
+    def make_voucher(self, pk: int, rng: random.Random, created: datetime.datetime) -> dict:
+        # PK 를 앞에 붙여 (product, code) 유니크 제약을 지킴
+        return {
+            'product_id': rng.randint(1, self.counts['shop.product']),
+            'code': f"{pk:010d}{rng.randint(0, 999999):06d}",
+            'status': 1 if rng.random() < 0.85 else rng.choice([0, 2]),
+            'is_removed': rng.random() < 0.01,
+        }
+
+    def make_order(self, pk: int, rng: random.Random, created: datetime.datetime) -> dict:
+        list_price = rng.randint(1, 50) * 10000
+        return {
+            'order_no': uuid.UUID(int=rng.getrandbits(128), version=4),
+            'user_id': rng.randint(1, self.counts['auth.user']) if rng.random() < 0.95 else None,
+            'fullname': rng.choice(self.LAST_NAMES) + rng.choice(self.FIRST_NAMES),
+            'user_agent': rng.choice(self.USER_AGENTS),
+            'accept_language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+            'ip_address': self.make_ip_address(rng),
+            'payment_method': rng.choice(self.get_choices(apps.get_model('shop.order').PAYMENT_METHOD_CHOICES)),
+            'transaction_id': uuid.UUID(int=rng.getrandbits(128)).hex if rng.random() < 0.3 else '',
+            'status': rng.choice(self.get_choices(apps.get_model('shop.order').STATUS_CHOICES)),
+            'total_list_price': Decimal(list_price),
+            'total_selling_price': Decimal(list_price - list_price // 20),
+            'message': '입금자명이 다릅니다' if rng.random() < 0.05 else '',
+            'is_removed': rng.random() < 0.01,
+        }
+
+    def make_orderproduct(self, pk: int, rng: random.Random, created: datetime.datetime) -> dict:
+        # 모든 주문이 최소 한 개의 주문 상품을 갖도록 주문 PK 를 순서대로 배정
+        list_price = rng.randint(1, 50) * 10000
+        return {
+            'order_id': (pk - 1) % self.counts['shop.order'] + 1,
+            'name': f"{rng.choice(self.KEYWORDS)} {list_price // 10000}만원",
+            'code': f"product-{rng.randint(1, self.counts['shop.product'])}",
+            'list_price': Decimal(list_price),
+            'selling_price': Decimal(list_price - list_price // 20),
+            'quantity': rng.randint(1, 5),
+        }
+
+    def make_naveradvertisementlog(self, pk: int, rng: random.Random, created: datetime.datetime) -> dict:
+        model = apps.get_model('shop.naveradvertisementlog')
+        keyword = rng.choice(self.KEYWORDS)
+        return {
+            'ip_address': self.make_ip_address(rng),
+            'campaign_type': rng.choice(self.get_choices(model.CAMPAIGN_TYPE_CHOICES)),
+            'media': rng.choice(self.get_choices(model.MEDIA_CHOICES)),
+            'query': keyword,
+            'rank': rng.randint(1, 15),
+            'ad_group': f"grp-a001-01-{rng.randint(1, 999):015d}",
+            'ad': f"nad-a001-01-{rng.randint(1, 9999):015d}",
+            'keyword_id': f"nkw-a001-01-{rng.randint(1, 9999):015d}",
+            'keyword': keyword,
+            'user_agent': rng.choice(self.USER_AGENTS),
+        }
+
+
+class MigrationBenchmark:
+    """합성 데이터가 채워진 old_db 에서 시나리오(엔진/모드 조합)별로 마이그레이션을 실행하고 결과를 기록
+
+    시나리오마다 포크한 프로세스에서 실행해 최대 RSS 가 다른 시나리오나 데이터 생성의 영향을 받지 않도록 하고,
+    실행 결과(커밋, 규모, 시나리오별 처리 행 수, 행/초, 최대 RSS, 전체 시간)를 JSON Lines 파일에 한 줄씩 추가해
+    커밋 간에 비교할 수 있도록 한다.
+    """
+
+    APP_LABELS = ['auth', 'rakmai', 'member', 'shop']
+    LOCAL_HOSTS = ('', 'localhost', '127.0.0.1', '::1')
+
+    def __init__(self, generator: SyntheticDataGenerator, scenarios: List[dict], results_file: str,
+                 work_dir='migrate_benchmark', batch_size=5000):
+        self.generator = generator
+        self.scenarios = scenarios
+        self.results_file = results_file
+        self.work_dir = work_dir
+        self.batch_size = batch_size
+        # full 시나리오가 기록한 워터마크를 delta 시나리오가 사용
+        self.delta_state_file = os.path.join(work_dir, 'delta.json')
+
+    def run(self, generate=True, create_schema=True) -> dict:
+        """데이터 생성 후 모든 시나리오를 실행하고 결과 파일에 기록"""
+        self.check_databases()
+        os.makedirs(self.work_dir, exist_ok=True)
+
+        if create_schema:
+            for alias in ('old_db', 'new_db'):
+                print(f"Creating schema in {alias}")
+                call_command('migrate', database=alias, interactive=False, verbosity=0)
+
+        record = {
+            'commit': self.get_commit(),
+            'started': timezone.now().isoformat(),
+            'scale': self.generator.scale,
+            'seed': self.generator.seed,
+            'old_db': connections['old_db'].vendor,
+            'new_db': connections['new_db'].vendor,
+            'python': sys.version.split()[0],
+            'django': django.get_version(),
+            'generation': None,
+            'rows': None,
+            'scenarios': [],
+        }
+
+        if generate:
+            start_time = time.time()
+            _, peak_rss = run_in_process(self.generator.generate)
+            record['generation'] = {'seconds': round(time.time() - start_time, 3), 'peak_rss_mb': peak_rss}
+        record['rows'] = self.count_rows('old_db')
+
+        for scenario in self.scenarios:
+            record['scenarios'].append(self.run_scenario(scenario, record['rows']))
+
+        self.save(record)
+        self.print_summary(record)
+        return record
+
+    def check_databases(self):
+        """벤치마크는 테이블을 비우므로 SQLite 파일이나 로컬 서버의 서로 다른 데이터베이스에서만 실행"""
+        identities = []
+        for alias in ('old_db', 'new_db'):
+            connection = connections[alias]
+            settings_dict = connection.settings_dict
+            if connection.vendor == 'sqlite':
+                # 포크한 프로세스 간에 공유되지 않음
+                if connection.is_in_memory_db():
+                    raise ImproperlyConfigured(f"Benchmark needs a file database for {alias}, not in-memory SQLite")
+            elif settings_dict['HOST'] not in self.LOCAL_HOSTS:
+                raise ImproperlyConfigured(f"Benchmark truncates tables and only runs against SQLite or a local "
+                                           f"server, but {alias} is on {settings_dict['HOST']}")
+            identities.append((connection.vendor, settings_dict['HOST'], str(settings_dict['PORT']),
+                               str(settings_dict['NAME'])))
+
+        if identities[0] == identities[1]:
+            raise ImproperlyConfigured("old_db and new_db must be different databases")
+
+    @staticmethod
+    def get_commit():
+        """결과를 비교할 수 있도록 현재 git 커밋 (git 이 없으면 None)"""
+        try:
+            return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                  check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def get_excluded_models(self) -> List[str]:
+        """합성 데이터를 만들지 않은 모델은 마이그레이션에서 제외"""
+        generated = {model._meta.label_lower for model in self.generator.models}
+        return [
+            model._meta.label_lower
+            for app_label in self.APP_LABELS
+            for model in apps.get_app_config(app_label).get_models()
+            if model._meta.label_lower not in generated
+        ]
+
+    def count_rows(self, using: str) -> Dict[str, int]:
+        return {model._meta.label_lower: model._base_manager.using(using).count() for model in self.generator.models}
+
+    def run_scenario(self, scenario: dict, source_rows: Dict[str, int]) -> dict:
+        """시나리오 하나를 new_db 를 비운 뒤(keep_target 이면 그대로) 실행하고 측정값 반환"""
+        name = scenario['name']
+        options = scenario.get('options', {})
+        result = {'name': name, 'options': options, 'status': 'ok'}
+        print(f"\n=== Benchmark scenario {name} ===")
+
+        if options.get('default_engine') == 'copy' and connections['new_db'].vendor not in ('postgresql', 'mysql'):
+            print(f"Skipping {name}: COPY engine does not support {connections['new_db'].vendor} target")
+            return {**result, 'status': 'skipped'}
+
+        if not scenario.get('keep_target'):
+            self.generator.clear('new_db')
+        if scenario.get('touch_fraction'):
+            result['touched_rows'] = self.generator.touch_rows(scenario['touch_fraction'])
+
+        try:
+            measured, peak_rss = run_in_process(self.migrate, name, options)
+        except RuntimeError as e:
+            print(f"Scenario {name} failed: {e}")
+            return {**result, 'status': 'failed', 'error': str(e)}
+
+        target_rows = self.count_rows('new_db')
+        seconds = measured['seconds']
+        rows = sum(stats['rows'] for stats in measured['models'].values())
+        return {
+            **result,
+            'rows': rows,
+            'seconds': round(seconds, 3),
+            'rows_per_second': round(rows / seconds, 1) if seconds else None,
+            'peak_rss_mb': peak_rss,
+            # new_db 행 수가 old_db 와 같은지 (delta 는 변경분만 반영하므로 이전 시나리오 결과에 따라 다름)
+            'complete': target_rows == source_rows,
+            'models': measured['models'],
+            'errors': measured['errors'],
+        }
+
+    def migrate(self, name: str, options: dict) -> dict:
+        """포크한 프로세스에서 마이그레이션을 실행하고 실행 보고서의 모델별 행 수/시간 반환"""
+        sink = JsonReportSink(os.path.join(self.work_dir, f"{name}.report.json"))
+        migrator = DatabaseMigrator(app_labels=self.APP_LABELS, batch_size=self.batch_size,
+                                    exclude_models=self.get_excluded_models(),
+                                    delta_state_file=self.delta_state_file, telemetry_sinks=[sink], **options)
+        start_time = time.time()
+        migrator.run_migration()
+        seconds = time.time() - start_time
+
+        report = sink.build()
+        models = {}
+        for label, stats in report['models'].items():
+            models[label] = {
+                'engine': stats['engine'],
+                'rows': stats['rows'],
+                'seconds': round(stats['seconds'], 3),
+                'rows_per_second': round(stats['rows'] / stats['seconds'], 1) if stats['seconds'] else None,
+            }
+        return {'seconds': seconds, 'models': models, 'errors': report['errors']}
+
+    def save(self, record: dict):
+        with open(self.results_file, 'a') as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        print(f"\nAppended benchmark results to {self.results_file}")
+
+    def print_summary(self, record: dict):
+        print(f"\nBenchmark summary (commit {record['commit']}, scale {record['scale']}, "
+              f"{record['old_db']} -> {record['new_db']}):")
+        if record['generation']:
+            print(f"Data generation: {record['generation']['seconds']:.2f}s, "
+                  f"peak RSS {record['generation']['peak_rss_mb']} MB")
+        print(f"{'scenario':<24} {'status':<8} {'rows':>12} {'seconds':>10} {'rows/s':>12} {'peak MB':>10}")
+        for scenario in record['scenarios']:
+            if scenario['status'] != 'ok':
+                print(f"{scenario['name']:<24} {scenario['status']:<8}")
+                continue
+            print(f"{scenario['name']:<24} {scenario['status']:<8} {scenario['rows']:>12} "
+                  f"{scenario['seconds']:>10.2f} {scenario['rows_per_second'] or 0:>12.1f} "
+                  f"{scenario['peak_rss_mb']:>10.1f}")
+
+
+# 합성 데이터 규모 (1 = 가장 큰 테이블 1만 행, 5000 = 5천만 행) 및 난수 시드
+scale = 1
+seed = 0
+
+# False 면 이미 생성된 old_db 데이터를 그대로 사용 (같은 scale 로 반복 측정할 때)
+generate_data = True
+
+# True 면 old_db/new_db 에 현재 모델 스키마 생성 (manage.py migrate --database)
+create_schema = True
+
+merge_keys = {
+    'shop.voucher': ['product', 'code'],
+    'shop.order': ['order_no'],
+    'shop.store': ['code'],
+}
+
+# 순서대로 실행하는 시나리오 (options 는 DatabaseMigrator 인자, keep_target 이면 new_db 를 비우지 않고 실행,
+# touch_fraction 이면 실행 전 old_db 행 일부를 수정된 것으로 표시)
+scenarios = [
+    {'name': 'orm', 'options': {'default_engine': 'orm'}},
+    {'name': 'stream', 'options': {'default_engine': 'stream'}},
+    {'name': 'stream-pipelined', 'options': {'default_engine': 'stream', 'pipeline_depth': 4,
+                                             'pipeline_writers': 2}},
+    {'name': 'stream-adaptive', 'options': {'default_engine': 'stream', 'adaptive_batches': True}},
+    {'name': 'copy', 'options': {'default_engine': 'copy'}},
+    # 적재 세션 프로파일 및 PostgreSQL UNLOGGED 적재
+    {'name': 'stream-bulk', 'options': {'default_engine': 'stream', 'load_profile': 'bulk', 'unlogged_tables': True}},
+    {'name': 'merge', 'options': {'mode': 'merge', 'merge_keys': merge_keys}},
+    # 적재된 new_db 에 다시 merge (대부분 변경 없음 행)
+    {'name': 'merge-rerun', 'options': {'mode': 'merge', 'merge_keys': merge_keys}, 'keep_target': True},
+    # old_db 행의 1% 를 수정한 뒤 변경분만 반영
+    {'name': 'delta', 'options': {'mode': 'delta'}, 'keep_target': True, 'touch_fraction': 0.01},
+    # 병렬 워커는 SQLite new_db 에서 쓰기 잠금이 충돌하므로 PostgreSQL/MySQL 에서만 사용
+    # {'name': 'stream-sharded', 'options': {'default_engine': 'stream', 'workers': 4, 'shards': {
+    #     'shop.naveradvertisementlog': 4, 'member.loginlog': 4, 'shop.voucher': 4}}},
+]
+
+# 실행마다 한 줄씩 추가되는 결과 파일 및 시나리오별 실행 보고서/워터마크 디렉터리
+results_file = 'migrate_benchmark.jsonl'
+work_dir = 'migrate_benchmark'
+
+generator = SyntheticDataGenerator(scale=scale, seed=seed)
+benchmark = MigrationBenchmark(generator, scenarios, results_file, work_dir=work_dir)
+benchmark.run(generate=generate_data, create_schema=create_schema)
@@ -1,25 +1,1461 @@
+import abc
+import contextlib
+import datetime
+import functools
+import hashlib
+import io
+import json
+import multiprocessing
 import os
+import queue
+import sys
+import tempfile
+import threading
 import time
+import uuid
 from collections import defaultdict
-from typing import List, Set
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from decimal import Decimal
+from typing import Callable, Dict, Iterator, List, Set
 
 import django
 from django.apps import apps
-from django.db import connections
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, connections
 from django.db import transaction
-from django.db.models import Model
+from django.db.models import FileField, Max, Min, Model, Q
+from django.db.backends.signals import connection_created
+from django.db.models.constants import OnConflict
+from django.utils import timezone
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'conf.settings')
 django.setup()
 
 
+class PrefixedStream:
+    """워커 프로세스 출력 각 줄 앞에 워커 이름을 붙이는 스트림 래퍼"""
+
+    def __init__(self, stream, prefix: str):
+        self.stream = stream
+        self.prefix = prefix
+        self.at_line_start = True
+
+    def write(self, text):
+        for line in text.splitlines(keepends=True):
+            if self.at_line_start:
+                self.stream.write(self.prefix)
+            self.stream.write(line)
+            self.at_line_start = line.endswith('\n')
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+# 워커 프로세스에서 사용할 마이그레이터 (fork 시 상속)
+_worker_migrator = None
+
+
+def _init_migration_worker(migrator, worker_counter, worker_name='worker'):
+    """워커 프로세스 초기화: 워커 번호 부여 및 전용 DB 연결 준비"""
+    global _worker_migrator
+    _worker_migrator = migrator
+
+    with worker_counter.get_lock():
+        worker_counter.value += 1
+        worker_number = worker_counter.value
+
+    # 부모 프로세스는 fork 전에 연결을 모두 닫으므로 워커는 전용 old_db/new_db 연결을 새로 맺음
+    sys.stdout = PrefixedStream(sys.stdout, f"[{worker_name}-{worker_number}] ")
+
+    # 텔레메트리 이벤트는 모아 두었다가 결과와 함께 부모 프로세스의 싱크로 전달
+    migrator.telemetry.buffering = True
+
+
+def _migrate_model_in_worker(model_label: str) -> tuple:
+    """워커 프로세스에서 단일 모델 마이그레이션 실행 후 결과와 텔레메트리 이벤트를 부모 프로세스로 반환"""
+    model = apps.get_model(model_label)
+    result_offset = len(_worker_migrator.results)
+    try:
+        _worker_migrator.migrate_model(model)
+    except Exception as e:
+        # 예외 속성은 피클링되어 부모 프로세스로 함께 전달됨
+        e.telemetry_events = _worker_migrator.telemetry.drain()
+        raise
+    finally:
+        sys.stdout.flush()
+        connections.close_all()
+    return _worker_migrator.results[result_offset:], _worker_migrator.telemetry.drain()
+
+
+def _migrate_shard_in_worker(model_label: str, shard: int, pk_range: tuple) -> tuple:
+    """워커 프로세스에서 모델의 PK 범위 하나를 마이그레이션"""
+    model = apps.get_model(model_label)
+    result_offset = len(_worker_migrator.results)
+    try:
+        _worker_migrator.migrate_model_range(model, pk_range, shard)
+    except Exception as e:
+        e.telemetry_events = _worker_migrator.telemetry.drain()
+        raise
+    finally:
+        sys.stdout.flush()
+        connections.close_all()
+    return _worker_migrator.results[result_offset:], _worker_migrator.telemetry.drain()
+
+
+class ColumnPlan:
+    """모델별로 한 번만 컴파일하는 컬럼 매핑 (SELECT/INSERT SQL 및 값 변환기)"""
+
+    # 드라이버가 반환한 값을 변환 없이 그대로 넘겨도 되는 필드 타입
+    PASSTHROUGH_TYPES = {
+        'AutoField', 'BigAutoField', 'SmallAutoField', 'IntegerField', 'BigIntegerField',
+        'SmallIntegerField', 'PositiveIntegerField', 'PositiveBigIntegerField',
+        'PositiveSmallIntegerField', 'CharField', 'TextField', 'SlugField', 'EmailField',
+        'URLField', 'FileField', 'ImageField', 'GenericIPAddressField',
+    }
+    # psycopg2 가 항상 Decimal 로 반환하는 경우에만 그대로 넘기는 필드 타입
+    # (SQLite 와 일부 MySQL 드라이버 설정은 float 를 반환하므로 DB 컨버터로 Decimal 변환이 필요)
+    POSTGRESQL_PASSTHROUGH_TYPES = {'DecimalField'}
+
+    def __init__(self, model, source: str, target: str, deferred_fields: List[str] = (), merge_keys: List[str] = None):
+        self.model = model
+        # 지연 필드는 읽지 않고 기본값으로 INSERT 한 뒤 별도 단계에서 채움
+        self.fields = [field for field in model._meta.concrete_fields if field.name not in deferred_fields]
+        self.deferred = [field for field in model._meta.concrete_fields if field.name in deferred_fields]
+        self.attnames = [field.attname for field in self.fields]
+        self.columns = [field.column for field in self.fields]
+        self.insert_columns = self.columns + [field.column for field in self.deferred]
+
+        # source 가 None 이면 행이 이미 파이썬 값(스풀 파일)이고, target 이 None 이면 파이썬 값까지만 변환
+        source_connection = connections[source] if source else None
+        target_connection = connections[target] if target else None
+
+        self.pk_index = self.columns.index(model._meta.pk.column)
+        if source_connection:
+            source_ops = source_connection.ops
+            self.pk_column = source_ops.quote_name(model._meta.pk.column)
+            self.select_sql = (f"SELECT {', '.join(source_ops.quote_name(column) for column in self.columns)} "
+                               f"FROM {source_ops.quote_name(model._meta.db_table)}")
+
+        self.deferred_defaults = []
+        if target_connection:
+            target_ops = target_connection.ops
+            # merge 모드(merge_keys 가 None 이 아님)는 항상 복사하는 PK 로 충돌을 판단하고, 지연 필드와 PK 를 제외한
+            # 컬럼(유니크 키 포함)을 갱신해 같은 PK 의 키 값이 바뀐 행도 반영한다 (갱신할 컬럼이 없으면 무시).
+            # PK 가 아닌 merge_keys 는 upsert 전에 같은 키를 다른 PK 의 행이 이미 쓰고 있는지 확인하는 데 사용
+            on_conflict = OnConflict.IGNORE
+            self.merge_columns = None
+            self.key_columns = []
+            update_columns = []
+            if merge_keys is not None:
+                self.merge_columns = [model._meta.pk.column]
+                key_columns = [model._meta.get_field(name).column for name in merge_keys]
+                if key_columns != self.merge_columns:
+                    self.key_columns = key_columns
+                update_columns = [field.column for field in self.fields if not field.primary_key]
+                if update_columns:
+                    on_conflict = OnConflict.UPDATE
+
+            table = target_ops.quote_name(model._meta.db_table)
+            self.insert_prefix = (f"{target_ops.insert_statement(on_conflict=on_conflict)} {table} "
+                                  f"({', '.join(target_ops.quote_name(column) for column in self.insert_columns)}) "
+                                  f"VALUES ")
+            self.insert_suffix = target_ops.on_conflict_suffix_sql(self.fields, on_conflict, update_columns,
+                                                                   self.merge_columns)
+            if merge_keys is not None and target_connection.vendor == 'postgresql':
+                # 값이 같은 행은 갱신하지 않고, 삽입/갱신된 행만 (xmax = 0 이면 삽입) 반환
+                if update_columns:
+                    current = ', '.join(f"{table}.{target_ops.quote_name(column)}" for column in update_columns)
+                    incoming = ', '.join(f"EXCLUDED.{target_ops.quote_name(column)}" for column in update_columns)
+                    self.insert_suffix += f" WHERE ({current}) IS DISTINCT FROM ({incoming})"
+                self.insert_suffix += " RETURNING (xmax = 0)"
+            self.row_placeholder = f"({', '.join(['%s'] * len(self.insert_columns))})"
+            self.deferred_defaults = [
+                field.get_db_prep_save(field.get_default(), connection=target_connection) for field in self.deferred
+            ]
+
+        # 변환이 필요한 컬럼만 (인덱스, 변환 함수 목록) 으로 보관
+        same_vendor = bool(source_connection and target_connection) and \
+            source_connection.vendor == target_connection.vendor
+        self.conversions = []
+        source_postgresql = bool(source_connection) and source_connection.vendor == 'postgresql'
+        for index, field in enumerate(self.fields):
+            internal_type = field.get_internal_type()
+            if internal_type in self.PASSTHROUGH_TYPES or (field.is_relation and same_vendor):
+                continue
+            if internal_type in self.POSTGRESQL_PASSTHROUGH_TYPES and source_postgresql:
+                continue
+
+            steps = []
+            if source_connection:
+                expression = field.get_col(model._meta.db_table)
+                steps += [
+                    functools.partial(self.apply_db_converter, converter, expression, source_connection)
+                    for converter in source_connection.ops.get_db_converters(expression) + field.get_db_converters(
+                        source_connection)
+                ]
+                if internal_type in self.POSTGRESQL_PASSTHROUGH_TYPES:
+                    # MySQL 은 DecimalField 컨버터가 없으므로 드라이버가 float 를 반환해도 Decimal 로 변환
+                    steps.append(field.to_python)
+            if target_connection:
+                steps.append(functools.partial(field.get_db_prep_save, connection=target_connection))
+            if steps:
+                self.conversions.append((index, steps))
+
+    @staticmethod
+    def apply_db_converter(converter, expression, connection, value):
+        return converter(value, expression, connection)
+
+    def convert(self, rows) -> List[list]:
+        """old_db 행 튜플을 new_db INSERT 파라미터로 변환"""
+        if not self.conversions and not self.deferred_defaults:
+            return rows
+
+        converted = []
+        for row in rows:
+            row = list(row)
+            for index, steps in self.conversions:
+                value = row[index]
+                if value is not None:
+                    for step in steps:
+                        value = step(value)
+                    row[index] = value
+            converted.append(row + self.deferred_defaults)
+        return converted
+
+    def insert_sql(self, row_count: int) -> str:
+        """row_count 행을 한 번에 넣는 다중 행 INSERT 문"""
+        sql = self.insert_prefix + ', '.join([self.row_placeholder] * row_count)
+        if self.insert_suffix:
+            sql += f" {self.insert_suffix}"
+        return sql
+
+
+class MigrationCheckpoint:
+    """모델별 마지막 커밋 PK 를 기록하는 체크포인트 (모델마다 별도 JSON 파일이라 병렬 워커에서도 안전)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def get_path(self, model, shard: int = None) -> str:
+        name = model._meta.label_lower if shard is None else f"{model._meta.label_lower}.shard{shard}"
+        return os.path.join(self.directory, f"{name}.json")
+
+    def load(self, model, shard: int = None) -> dict:
+        try:
+            with open(self.get_path(model, shard)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def write(self, model, state: dict, shard: int = None):
+        # 임시 파일에 쓴 뒤 교체하여 중간에 중단되어도 파일이 깨지지 않도록 함
+        path = self.get_path(model, shard)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(temp_path, path)
+
+    def get_last_pk(self, model, shard: int = None):
+        return self.load(model, shard).get('last_pk')
+
+    def is_done(self, model) -> bool:
+        return self.load(model).get('done', False)
+
+    def save(self, model, last_pk, shard: int = None):
+        last_pk = last_pk.hex if isinstance(last_pk, uuid.UUID) else last_pk
+        # 모델 체크포인트에 함께 저장한 샤드 범위는 유지
+        state = self.load(model, shard)
+        state.update(last_pk=last_pk, done=False)
+        self.write(model, state, shard)
+
+    def get_pk_ranges(self, model) -> tuple:
+        """첫 실행에서 저장한 (샤드 수, PK 범위 목록), 없으면 (None, None)"""
+        state = self.load(model)
+        if 'pk_ranges' not in state:
+            return None, None
+        return state['shard_count'], [tuple(pk_range) for pk_range in state['pk_ranges']]
+
+    def save_pk_ranges(self, model, shard_count: int, pk_ranges: List[tuple]):
+        state = self.load(model)
+        state.update(shard_count=shard_count, pk_ranges=[list(pk_range) for pk_range in pk_ranges])
+        self.write(model, state)
+
+    def mark_done(self, model):
+        state = self.load(model)
+        state['done'] = True
+        self.write(model, state)
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.directory, name))
+
+
+class DeltaWatermarks:
+    """모델별 하이 워터마크(이전 실행 시작 시각)를 기록하는 JSON 파일"""
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with open(path) as f:
+                self.marks = json.load(f)
+        except FileNotFoundError:
+            self.marks = {}
+
+    def get(self, model):
+        mark = self.marks.get(model._meta.label_lower)
+        return datetime.datetime.fromisoformat(mark) if mark else None
+
+    def update(self, models: List[Model], mark: datetime.datetime):
+        for model in models:
+            self.marks[model._meta.label_lower] = mark.isoformat()
+
+    def save(self):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(self.marks, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+class ThroughputHistory:
+    """이전 실행에서 측정한 모델별 처리 속도(records/second)와 최종 배치 크기를 보관하는 JSON 파일"""
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with open(path) as f:
+                history = json.load(f)
+        except FileNotFoundError:
+            history = {}
+        self.rates = history.get('rates', {})
+        self.batch_sizes = history.get('batch_sizes', {})
+
+    def get_batch_size(self, model):
+        """이전 실행에서 적응형 조정으로 정해진 배치 크기"""
+        return self.batch_sizes.get(model._meta.label_lower)
+
+    def get_rate(self, model):
+        """모델의 측정 속도, 없으면 측정된 모든 모델 속도의 중앙값"""
+        rate = self.rates.get(model._meta.label_lower)
+        if rate or not self.rates:
+            return rate
+        rates = sorted(self.rates.values())
+        return rates[len(rates) // 2]
+
+    def update(self, results: List[dict]):
+        # 샤드 결과는 모델 단위로 합산 (샤드는 동시에 실행되므로 가장 오래 걸린 샤드 시간을 사용)
+        totals = defaultdict(lambda: [0, 0.0])
+        for result in results:
+            # 지연 컬럼 단계와 트리 재계산은 행 수가 겹치고, 스풀 단계는 old_db → new_db 전송이 아니므로 제외
+            if result['engine'] in ('heavy', 'tree', 'export', 'import'):
+                continue
+            label = result['model'].split('#')[0].lower()
+            totals[label][0] += result['records']
+            totals[label][1] = max(totals[label][1], result['seconds'])
+            if result['metrics'].get('batch_size_final'):
+                self.batch_sizes[label] = result['metrics']['batch_size_final']
+
+        for label, (records, seconds) in totals.items():
+            if records and seconds:
+                self.rates[label] = records / seconds
+
+    def save(self):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({'rates': self.rates, 'batch_sizes': self.batch_sizes}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+class AdaptiveBatchSizer:
+    """배치마다 측정한 행당 메모리와 쓰기 지연으로 다음 배치 크기를 조정
+
+    배치 메모리는 memory_budget, 배치 쓰기 시간은 target_seconds 이내가 되도록 하되
+    한 번에 2배 이상 늘리거나 절반 이하로 줄이지 않는다.
+    """
+
+    # 행당 바이트를 추정할 때 살펴보는 표본 행 수
+    SAMPLE_ROWS = 20
+
+    def __init__(self, initial: int, adaptive=True, min_size=100, max_size=50000,
+                 memory_budget=64 * 1024 * 1024, target_seconds=2.0):
+        self.size = initial
+        self.initial = initial
+        self.adaptive = adaptive
+        self.min_size = min_size
+        self.max_size = max_size
+        self.memory_budget = memory_budget
+        self.target_seconds = target_seconds
+        self.bytes_per_row = None
+        self.seconds_per_row = None
+        self.sizes = [initial]
+        self.lock = threading.Lock()
+
+    @classmethod
+    def estimate_batch_bytes(cls, batch) -> int:
+        """표본 행의 파이썬 객체 크기로 배치 전체의 메모리 사용량 추정"""
+        sample = batch[:cls.SAMPLE_ROWS]
+        sample_bytes = 0
+        for row in sample:
+            values = [v for k, v in row.__dict__.items() if k != '_state'] if isinstance(row, Model) else row
+            sample_bytes += sum(sys.getsizeof(value) for value in values)
+        return sample_bytes * len(batch) // len(sample)
+
+    def observe(self, batch, seconds: float):
+        if not self.adaptive or not batch:
+            return
+
+        row_count = len(batch)
+        bytes_per_row = self.estimate_batch_bytes(batch) / row_count
+        seconds_per_row = seconds / row_count
+
+        with self.lock:
+            # 지수 이동 평균으로 배치 간 편차를 완화
+            if self.bytes_per_row is None:
+                self.bytes_per_row, self.seconds_per_row = bytes_per_row, seconds_per_row
+            else:
+                self.bytes_per_row = 0.7 * self.bytes_per_row + 0.3 * bytes_per_row
+                self.seconds_per_row = 0.7 * self.seconds_per_row + 0.3 * seconds_per_row
+
+            target = self.memory_budget / max(self.bytes_per_row, 1)
+            if self.seconds_per_row > 0:
+                target = min(target, self.target_seconds / self.seconds_per_row)
+
+            size = int(max(self.size / 2, min(self.size * 2, target)))
+            size = max(self.min_size, min(self.max_size, size))
+            if size != self.size:
+                self.size = size
+                self.sizes.append(size)
+
+    def summary(self) -> dict:
+        return {
+            'batch_size_initial': self.initial,
+            'batch_size_final': self.size,
+            'batch_size_min': min(self.sizes),
+            'batch_size_max': max(self.sizes),
+            'bytes_per_row': round(self.bytes_per_row or 0, 1),
+            'seconds_per_row': self.seconds_per_row or 0,
+        }
+
+
+class ColumnarSpool:
+    """old_db 데이터를 모델별 Parquet 파일로 보관하는 로컬 스풀 (pyarrow 필요)
+
+    모델마다 {label}.parquet 파일 하나에 청크를 row group 하나씩 기록하고, 컬럼 스키마/행 수/청크별 마지막 PK 는
+    {label}.json 매니페스트에 저장한다. 모델별 파일이라 병렬 워커에서도 안전하며, 전체 목록은 manifest.json 에 모은다.
+    """
+
+    INTEGER_TYPES = {
+        'AutoField', 'BigAutoField', 'SmallAutoField', 'IntegerField', 'BigIntegerField', 'SmallIntegerField',
+        'PositiveIntegerField', 'PositiveBigIntegerField', 'PositiveSmallIntegerField',
+    }
+
+    def __init__(self, directory: str, compression='zstd'):
+        # 내보내기/적재를 시작한 뒤가 아니라 스풀 단계를 설정할 때 pyarrow 가 없음을 알림
+        self.import_pyarrow()
+        self.directory = directory
+        self.compression = compression
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def import_pyarrow():
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImproperlyConfigured("The columnar spool requires pyarrow (pip install pyarrow)")
+        return pyarrow, pyarrow.parquet
+
+    def get_path(self, model, extension: str) -> str:
+        return os.path.join(self.directory, f"{model._meta.label_lower}.{extension}")
+
+    def load_manifest(self, model) -> dict:
+        try:
+            with open(self.get_path(model, 'json')) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def has_model(self, model) -> bool:
+        return self.load_manifest(model).get('done', False)
+
+    def get_arrow_type(self, field):
+        """Django 필드에 대응하는 Arrow 타입 (대응하는 타입이 없으면 문자열)"""
+        pa, _ = self.import_pyarrow()
+        internal_type = (field.target_field if field.is_relation else field).get_internal_type()
+        if internal_type in self.INTEGER_TYPES:
+            return pa.int64()
+        if internal_type == 'BooleanField':
+            return pa.bool_()
+        if internal_type == 'FloatField':
+            return pa.float64()
+        if internal_type == 'DecimalField':
+            return pa.decimal128(field.max_digits, field.decimal_places)
+        if internal_type == 'DateTimeField':
+            return pa.timestamp('us', tz='UTC' if settings.USE_TZ else None)
+        if internal_type == 'DateField':
+            return pa.date32()
+        if internal_type == 'TimeField':
+            return pa.time64('us')
+        if internal_type == 'DurationField':
+            return pa.duration('us')
+        if internal_type == 'BinaryField':
+            return pa.binary()
+        return pa.string()
+
+    @staticmethod
+    def encode_value(field, value):
+        """Arrow 로 그대로 저장할 수 없는 파이썬 값을 문자열/바이트로 변환"""
+        internal_type = field.get_internal_type()
+        if internal_type == 'JSONField':
+            return json.dumps(value, cls=field.encoder)
+        if internal_type == 'BinaryField':
+            return bytes(value)
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        return value
+
+    @staticmethod
+    def decode_value(field, value):
+        """encode_value 로 저장한 값을 Django 필드 값으로 복원"""
+        internal_type = (field.target_field if field.is_relation else field).get_internal_type()
+        if internal_type == 'JSONField':
+            return json.loads(value, cls=field.decoder)
+        if internal_type == 'UUIDField':
+            return uuid.UUID(value)
+        return value
+
+    def write_model(self, model, fields: list, chunks: Iterator[list], exported_at: datetime.datetime) -> dict:
+        """파이썬 값 행 청크를 row group 으로 기록하고 모델 매니페스트 반환 (완료 후 파일을 교체)"""
+        pa, pq = self.import_pyarrow()
+        schema = pa.schema([
+            pa.field(field.column, self.get_arrow_type(field), nullable=field.null) for field in fields
+        ])
+        pk_index = [field.primary_key for field in fields].index(True)
+        path = self.get_path(model, 'parquet')
+        temp_path = f"{path}.tmp"
+        chunk_entries = []
+
+        with pq.ParquetWriter(temp_path, schema, compression=self.compression) as writer:
+            for rows in chunks:
+                arrays = [
+                    pa.array([None if value is None else self.encode_value(field, value) for value in column],
+                             type=schema.field(index).type)
+                    for index, (field, column) in enumerate(zip(fields, zip(*rows)))
+                ]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema), row_group_size=len(rows))
+                last_pk = rows[-1][pk_index]
+                chunk_entries.append({
+                    'rows': len(rows),
+                    'last_pk': last_pk.hex if isinstance(last_pk, uuid.UUID) else last_pk,
+                })
+        os.replace(temp_path, path)
+
+        manifest = {
+            'model': model._meta.label_lower,
+            'table': model._meta.db_table,
+            'file': os.path.basename(path),
+            'exported_at': exported_at.isoformat(),
+            'columns': [
+                {'name': field.name, 'column': field.column, 'type': field.get_internal_type(),
+                 'arrow_type': str(schema.field(index).type), 'null': field.null}
+                for index, field in enumerate(fields)
+            ],
+            'rows': sum(entry['rows'] for entry in chunk_entries),
+            'chunks': chunk_entries,
+            'done': True,
+        }
+        temp_path = f"{self.get_path(model, 'json')}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, self.get_path(model, 'json'))
+        return manifest
+
+    def read_model(self, model, fields: list, after_pk=None) -> Iterator[tuple]:
+        """row group 단위로 (마지막 PK, 파이썬 값 행 목록) 반환 (after_pk 가 마지막 PK 인 청크까지는 건너뜀)"""
+        _, pq = self.import_pyarrow()
+        manifest = self.load_manifest(model)
+        columns = [field.column for field in fields]
+        if [column['column'] for column in manifest['columns']] != columns:
+            raise ValueError(f"Spooled columns of {model._meta.label} do not match the model, export it again")
+
+        chunks = manifest['chunks']
+        start = 0
+        if after_pk is not None:
+            after_pk = after_pk.hex if isinstance(after_pk, uuid.UUID) else after_pk
+            start = next(index + 1 for index, chunk in enumerate(chunks) if chunk['last_pk'] == after_pk)
+
+        pk_index = [field.primary_key for field in fields].index(True)
+        parquet_file = pq.ParquetFile(self.get_path(model, 'parquet'))
+        for index in range(start, len(chunks)):
+            table = parquet_file.read_row_group(index, columns=columns)
+            values = []
+            for field, column in zip(fields, table.columns):
+                decoded = column.to_pylist()
+                if field.get_internal_type() in ('JSONField', 'UUIDField') or field.is_relation:
+                    decoded = [None if value is None else self.decode_value(field, value) for value in decoded]
+                values.append(decoded)
+            rows = list(zip(*values))
+            yield rows[-1][pk_index], rows
+
+    def write_summary(self, models: List[Model]):
+        """스풀된 모델 매니페스트를 manifest.json 하나로 모음"""
+        summary = {'models': [self.load_manifest(model) for model in models if self.has_model(model)]}
+        path = os.path.join(self.directory, 'manifest.json')
+        with open(f"{path}.tmp", 'w') as f:
+            json.dump(summary, f, indent=2)
+        os.replace(f"{path}.tmp", path)
+        print(f"\nSpooled {len(summary['models'])} models "
+              f"({sum(entry['rows'] for entry in summary['models'])} rows) to {self.directory}")
+
+    def get_exported_at(self, models: List[Model]):
+        """스풀된 모델 중 가장 이른 내보내기 시각 (delta 워터마크로 사용)"""
+        marks = [self.load_manifest(model)['exported_at'] for model in models if self.has_model(model)]
+        return datetime.datetime.fromisoformat(min(marks)) if marks else None
+
+
+class MigrationTelemetry:
+    """마이그레이션 이벤트를 싱크로 전달 (워커 프로세스에서는 모아 두었다가 부모 프로세스에서 전달)
+
+    이벤트는 model_start, batch_done, model_done, error, index_rebuilt, sequences_reset 이며
+    싱크는 이벤트 dict 를 받는 handle() 과 실행 종료 시 호출되는 close() 를 구현한다.
+    """
+
+    def __init__(self, sinks: list = ()):
+        self.sinks = list(sinks)
+        self.buffering = False
+        self.buffer: List[dict] = []
+        self.lock = threading.Lock()  # 파이프라인 쓰기 스레드에서 동시에 호출됨
+
+    def emit(self, event: str, **data):
+        if not self.sinks:
+            return
+        self.replay([{'event': event, 'time': time.time(), 'pid': os.getpid(), **data}])
+
+    def replay(self, events: List[dict]):
+        with self.lock:
+            if self.buffering:
+                self.buffer.extend(events)
+                return
+            for event in events:
+                for sink in self.sinks:
+                    sink.handle(event)
+
+    def drain(self) -> List[dict]:
+        with self.lock:
+            events, self.buffer = self.buffer, []
+        return events
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+class RunReportSink(abc.ABC):
+    """텔레메트리 이벤트를 모델별로 집계하고 close 시 write() 로 기록하는 싱크"""
+
+    # 행 수 합계에서 제외하는 단계 (적재 단계와 행이 겹침)
+    OVERLAPPING_ENGINES = ('heavy', 'tree')
+
+    def __init__(self, path: str):
+        self.path = path
+        self.started = time.time()
+        self.models = defaultdict(lambda: {
+            'engine': None, 'rows': 0, 'batch_rows': 0, 'bytes': 0, 'read_seconds': 0.0, 'write_seconds': 0.0,
+            'seconds': 0.0, 'index_rebuild_seconds': 0.0, 'index_seconds': {}, 'latencies': [], 'phases': {},
+        })
+        self.errors: List[dict] = []
+        self.sequence_reset_seconds = 0.0
+        self.sequences_reset = 0
+
+    def handle(self, event: dict):
+        kind = event['event']
+        if kind == 'sequences_reset':
+            self.sequence_reset_seconds += event['seconds']
+            self.sequences_reset += event['reset']
+            return
+
+        # 샤드 이벤트는 모델 단위로 합산
+        stats = self.models[event['model'].split('#')[0]]
+        if kind == 'model_start':
+            stats['engine'] = stats['engine'] or event['engine']
+        elif kind == 'batch_done':
+            stats['batch_rows'] += event['rows']
+            stats['bytes'] += event['bytes']
+            stats['read_seconds'] += event['read_seconds']
+            stats['write_seconds'] += event['write_seconds']
+            stats['latencies'].append(event['write_seconds'])
+        elif kind == 'model_done':
+            phase = stats['phases'].setdefault(event['engine'], {'records': 0, 'seconds': 0.0})
+            phase['records'] += event['records']
+            # 샤드는 동시에 실행되므로 가장 오래 걸린 샤드 시간을 사용
+            phase['seconds'] = max(phase['seconds'], event['seconds'])
+            if event['engine'] not in self.OVERLAPPING_ENGINES:
+                stats['rows'] += event['records']
+        elif kind == 'index_rebuilt':
+            # seconds 는 모델의 인덱스 재생성 경과 시간, indexes 는 인덱스별 시간 (병렬 생성이라 합이 경과 시간과 다름)
+            stats['index_rebuild_seconds'] += event['seconds']
+            stats['index_seconds'].update(event.get('indexes', {}))
+        elif kind == 'error':
+            self.errors.append({'model': event['model'], 'error': event['error']})
+
+    @staticmethod
+    def percentile(values: List[float], percent: float) -> float:
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(round(percent / 100 * (len(values) - 1))))]
+
+    def build(self) -> dict:
+        models = {}
+        for label, stats in self.models.items():
+            latencies = sorted(stats['latencies'])
+            models[label] = {
+                'engine': stats['engine'],
+                'rows': stats['rows'] or stats['batch_rows'],
+                'bytes': stats['bytes'],
+                'seconds': sum(phase['seconds'] for phase in stats['phases'].values()),
+                'read_seconds': round(stats['read_seconds'], 3),
+                'write_seconds': round(stats['write_seconds'], 3),
+                'batches': len(latencies),
+                'batch_latency_seconds': {
+                    'p50': self.percentile(latencies, 50),
+                    'p90': self.percentile(latencies, 90),
+                    'p99': self.percentile(latencies, 99),
+                    'max': latencies[-1] if latencies else 0.0,
+                },
+                'index_rebuild_seconds': round(stats['index_rebuild_seconds'], 3),
+                'index_seconds': stats['index_seconds'],
+                'phases': stats['phases'],
+            }
+        finished = time.time()
+        return {
+            'started': datetime.datetime.fromtimestamp(self.started, datetime.timezone.utc).isoformat(),
+            'finished': datetime.datetime.fromtimestamp(finished, datetime.timezone.utc).isoformat(),
+            'duration_seconds': round(finished - self.started, 3),
+            'sequence_reset_seconds': round(self.sequence_reset_seconds, 3),
+            'sequences_reset': self.sequences_reset,
+            'models': models,
+            'errors': self.errors,
+        }
+
+    def close(self):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w') as f:
+            self.write(f, self.build())
+        os.replace(temp_path, self.path)
+        print(f"Wrote migration report to {self.path}")
+
+    @abc.abstractmethod
+    def write(self, f, report: dict):
+        """집계한 보고서를 열린 파일에 기록"""
+
+
+class JsonReportSink(RunReportSink):
+    """실행 보고서를 JSON 파일로 기록"""
+
+    def write(self, f, report: dict):
+        json.dump(report, f, indent=2)
+
+
+class PrometheusSink(RunReportSink):
+    """실행 보고서를 Prometheus 텍스트 포맷 파일로 기록 (node_exporter textfile collector 용)"""
+
+    # (메트릭 이름, 타입, 설명, 모델 보고서 키)
+    MODEL_METRICS = [
+        ('migrate_rows_total', 'counter', 'Rows migrated', 'rows'),
+        ('migrate_bytes_total', 'counter', 'Estimated in-memory bytes of migrated batches', 'bytes'),
+        ('migrate_duration_seconds', 'gauge', 'Wall time spent on the model', 'seconds'),
+        ('migrate_read_seconds_total', 'counter', 'Time spent reading old_db batches', 'read_seconds'),
+        ('migrate_write_seconds_total', 'counter', 'Time spent writing new_db batches', 'write_seconds'),
+        ('migrate_batches_total', 'counter', 'Committed batches', 'batches'),
+        ('migrate_index_rebuild_seconds_total', 'counter', 'Wall time spent rebuilding secondary indexes',
+         'index_rebuild_seconds'),
+    ]
+
+    @staticmethod
+    def format_label(value: str) -> str:
+        return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def write(self, f, report: dict):
+        for name, metric_type, description, key in self.MODEL_METRICS:
+            f.write(f"# HELP {name} {description}\n# TYPE {name} {metric_type}\n")
+            for label, stats in report['models'].items():
+                f.write(f'{name}{{model="{self.format_label(label)}"}} {stats[key]}\n')
+
+        f.write("# HELP migrate_batch_latency_seconds Batch write latency\n"
+                "# TYPE migrate_batch_latency_seconds summary\n")
+        for label, stats in report['models'].items():
+            for quantile, key in (('0.5', 'p50'), ('0.9', 'p90'), ('0.99', 'p99'), ('1', 'max')):
+                f.write(f'migrate_batch_latency_seconds{{model="{self.format_label(label)}",quantile="{quantile}"}} '
+                        f"{stats['batch_latency_seconds'][key]}\n")
+
+        errors = defaultdict(int)
+        for error in report['errors']:
+            errors[error['model'].split('#')[0]] += 1
+        f.write("# HELP migrate_errors_total Failed model migrations\n# TYPE migrate_errors_total counter\n")
+        for label, count in errors.items():
+            f.write(f'migrate_errors_total{{model="{self.format_label(label)}"}} {count}\n')
+
+        f.write("# HELP migrate_sequence_reset_seconds Time spent resetting sequences\n"
+                "# TYPE migrate_sequence_reset_seconds gauge\n"
+                f"migrate_sequence_reset_seconds {report['sequence_reset_seconds']}\n"
+                "# HELP migrate_run_duration_seconds Total run time\n"
+                "# TYPE migrate_run_duration_seconds gauge\n"
+                f"migrate_run_duration_seconds {report['duration_seconds']}\n"
+                "# HELP migrate_run_finished_timestamp_seconds Unix time the run finished\n"
+                "# TYPE migrate_run_finished_timestamp_seconds gauge\n"
+                f"migrate_run_finished_timestamp_seconds {time.time():.0f}\n")
+
+
+class SchemaSnapshot:
+    """데이터베이스의 테이블 존재 여부, 컬럼 목록(PostgreSQL 은 컬럼 타입 포함), 추정 행 수, 크기를 한 번에 읽어 둔 스냅샷"""
+
+    def __init__(self, using: str):
+        self.using = using
+        self.columns: Dict[str, List[str]] = defaultdict(list)
+        # PostgreSQL 컬럼별 (atttypid, atttypmod), format: {table: {column: (oid, typmod), ...}, ...}
+        self.column_types: Dict[str, Dict[str, tuple]] = defaultdict(dict)
+        self.row_estimates: Dict[str, int] = {}
+        self.sizes: Dict[str, int] = {}
+        self.load()
+
+    def load(self):
+        connection = connections[self.using]
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                # information_schema.columns 와 같은 릴레이션 종류를 대상으로 하되 타입 OID 와 typmod 도 함께 읽음
+                cursor.execute("""
+                    SELECT c.relname, a.attname, a.atttypid, a.atttypmod
+                    FROM pg_attribute a
+                    JOIN pg_class c ON c.oid = a.attrelid
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE n.nspname = current_schema() AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+                      AND a.attnum > 0 AND NOT a.attisdropped
+                    ORDER BY c.relname, a.attnum
+                """)
+                type_rows = cursor.fetchall()
+                column_rows = [(table, column) for table, column, _, _ in type_rows]
+                for table, column, type_oid, typmod in type_rows:
+                    self.column_types[table][column] = (type_oid, typmod)
+                cursor.execute("""
+                    SELECT c.relname, c.reltuples::bigint, pg_table_size(c.oid)
+                    FROM pg_class c
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE n.nspname = current_schema() AND c.relkind IN ('r', 'p')
+                """)
+                stat_rows = cursor.fetchall()
+            elif connection.vendor == 'mysql':
+                cursor.execute("""
+                    SELECT TABLE_NAME, COLUMN_NAME
+                    FROM information_schema.COLUMNS
+                    WHERE TABLE_SCHEMA = DATABASE()
+                    ORDER BY TABLE_NAME, ORDINAL_POSITION
+                """)
+                column_rows = cursor.fetchall()
+                cursor.execute("""
+                    SELECT TABLE_NAME, TABLE_ROWS, DATA_LENGTH
+                    FROM information_schema.TABLES
+                    WHERE TABLE_SCHEMA = DATABASE()
+                """)
+                stat_rows = cursor.fetchall()
+            else:
+                # 통계 카탈로그가 없는 데이터베이스는 Django introspection 으로 컬럼만 수집
+                column_rows = [
+                    (table, column.name)
+                    for table in connection.introspection.table_names(cursor)
+                    for column in connection.introspection.get_table_description(cursor, table)
+                ]
+                stat_rows = []
+
+        for table, column in column_rows:
+            self.columns[table].append(column)
+        for table, rows, size in stat_rows:
+            # PostgreSQL 14+ 에서 한 번도 ANALYZE 되지 않은 테이블은 reltuples 가 -1
+            if rows is not None and rows >= 0:
+                self.row_estimates[table] = int(rows)
+            if size is not None:
+                self.sizes[table] = int(size)
+
+    def has_table(self, table: str) -> bool:
+        return table in self.columns
+
+    def get_columns(self, table: str) -> List[str]:
+        return self.columns.get(table, [])
+
+    def get_column_types(self, table: str) -> Dict[str, tuple]:
+        return self.column_types.get(table, {})
+
+    def get_row_estimate(self, table: str):
+        return self.row_estimates.get(table)
+
+    def get_size(self, table: str):
+        return self.sizes.get(table)
+
+
+class SecondaryIndexManager:
+    """대량 적재 전 보조 인덱스와 UNIQUE 제약을 삭제하고 적재 후 다시 생성
+
+    삭제한 정의는 state_dir 에 기록해 두므로 적재 중 프로세스가 중단되어도 다음 실행에서 복구한다.
+    PostgreSQL 은 CREATE INDEX 가 SHARE 잠금이라 같은 테이블의 인덱스를 여러 연결에서 동시에 만들고
+    UNIQUE 제약은 UNIQUE 인덱스를 만든 뒤 USING INDEX 로 연결한다. MySQL 은 모든 인덱스를
+    ALTER TABLE 한 문장으로 추가하여 InnoDB 가 한 번의 테이블 스캔으로 생성하도록 한다.
+    """
+
+    def __init__(self, using: str, state_dir: str, workers=4, maintenance_work_mem='1GB'):
+        self.using = using
+        self.state_dir = state_dir
+        self.workers = workers
+        self.maintenance_work_mem = maintenance_work_mem
+        self.timings: List[dict] = []  # 인덱스별 재생성 소요 시간 (PostgreSQL 만, 세부 정보용)
+        os.makedirs(state_dir, exist_ok=True)
+
+    def get_state_path(self, model) -> str:
+        return os.path.join(self.state_dir, f"{model._meta.label_lower}.indexes")
+
+    def get_definitions(self, model) -> List[dict]:
+        """테이블의 보조 인덱스 및 UNIQUE 제약 정의 (PK 및 외래키가 참조하는 제약 제외)"""
+        connection = connections[self.using]
+        quote_name = connection.ops.quote_name
+        table = quote_name(model._meta.db_table)
+        definitions = []
+
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute("""
+                    SELECT c.conname, pg_get_constraintdef(c.oid)
+                    FROM pg_constraint c
+                    WHERE c.conrelid = to_regclass(%s) AND c.contype = 'u'
+                    AND NOT EXISTS (
+                        SELECT 1 FROM pg_constraint f WHERE f.contype = 'f' AND f.conindid = c.conindid
+                    )
+                """, [table])
+                for name, definition in cursor.fetchall():
+                    name = quote_name(name)
+                    if definition.startswith('UNIQUE (') and definition.endswith(')'):
+                        create = f"CREATE UNIQUE INDEX {name} ON {table} {definition[len('UNIQUE '):]}"
+                        attach = f"ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE USING INDEX {name}"
+                    else:
+                        create = f"ALTER TABLE {table} ADD CONSTRAINT {name} {definition}"
+                        attach = None
+                    definitions.append({
+                        'name': name,
+                        'drop': f"ALTER TABLE {table} DROP CONSTRAINT {name}",
+                        'create': create,
+                        'attach': attach,
+                    })
+
+                cursor.execute("""
+                    SELECT ci.relname, pg_get_indexdef(i.indexrelid)
+                    FROM pg_index i
+                    JOIN pg_class ci ON ci.oid = i.indexrelid
+                    WHERE i.indrelid = to_regclass(%s) AND NOT i.indisprimary
+                    AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+                """, [table])
+                for name, definition in cursor.fetchall():
+                    definitions.append({
+                        'name': quote_name(name),
+                        'drop': f"DROP INDEX {quote_name(name)}",
+                        'create': definition,
+                        'attach': None,
+                    })
+
+            elif connection.vendor == 'mysql':
+                cursor.execute("""
+                    SELECT INDEX_NAME, MIN(NON_UNIQUE),
+                           GROUP_CONCAT(CONCAT('`', COLUMN_NAME, '`',
+                                               IF(SUB_PART IS NULL, '', CONCAT('(', SUB_PART, ')')))
+                                        ORDER BY SEQ_IN_INDEX SEPARATOR ', ')
+                    FROM information_schema.STATISTICS
+                    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME <> 'PRIMARY'
+                    GROUP BY INDEX_NAME
+                """, [model._meta.db_table])
+                for name, non_unique, columns in cursor.fetchall():
+                    definitions.append({
+                        'name': quote_name(name),
+                        'drop': f"ALTER TABLE {table} DROP INDEX {quote_name(name)}",
+                        'create': f"ADD {'' if non_unique else 'UNIQUE '}INDEX {quote_name(name)} ({columns})",
+                        'attach': None,
+                    })
+
+        return definitions
+
+    def drop(self, model) -> List[dict]:
+        """보조 인덱스를 삭제하고 삭제한 정의 반환
+
+        이전 실행에서 삭제한 정의가 남아 있으면 그중 현재 스키마에 아직 없는 것만 사용한다.
+        재생성이 중간에 실패해 일부 인덱스만 다시 만들어진 경우에도 이미 있는 인덱스를 다시 만들지 않는다.
+        """
+        state_path = self.get_state_path(model)
+        if os.path.exists(state_path):
+            with open(state_path) as f:
+                saved = json.load(f)
+            current = {definition['name']: definition for definition in self.get_definitions(model)}
+            dropped = []
+            for definition in saved:
+                existing = current.get(definition['name'])
+                if existing is None:
+                    dropped.append(definition)
+                elif definition['attach'] and not existing['attach'] and existing['drop'].startswith('DROP INDEX'):
+                    # UNIQUE 인덱스는 만들었지만 제약으로 연결하기 전에 중단된 경우 연결만 수행
+                    dropped.append({**definition, 'create': None})
+            print(f"Found {len(saved)} indexes dropped by a previous run for {model._meta.label}, "
+                  f"{len(dropped)} still missing")
+            self.save_state(model, dropped)
+            return dropped
+
+        dropped = []
+        with connections[self.using].cursor() as cursor:
+            for definition in self.get_definitions(model):
+                try:
+                    cursor.execute(definition['drop'])
+                    dropped.append(definition)
+                except Exception as e:
+                    # MySQL 외래키가 사용하는 인덱스 등 삭제할 수 없는 인덱스는 유지
+                    print(f"Keeping index {definition['name']} on {model._meta.label}: {e}")
+
+        if dropped:
+            self.save_state(model, dropped)
+            print(f"Dropped {len(dropped)} secondary indexes on {model._meta.label}")
+        return dropped
+
+    def save_state(self, model, pending: List[dict]):
+        """아직 다시 만들지 않은 정의를 기록 (모두 만들었으면 상태 파일 삭제)"""
+        state_path = self.get_state_path(model)
+        if not pending:
+            if os.path.exists(state_path):
+                os.remove(state_path)
+            return
+        temp_path = f"{state_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(pending, f)
+        os.replace(temp_path, state_path)
+
+    def rebuild(self, model, dropped: List[dict]) -> float:
+        """삭제한 인덱스를 다시 생성하고 전체 경과 시간(초) 반환
+
+        PostgreSQL 은 인덱스별 소요 시간을 timings 에 세부 정보로 남기지만 병렬로 생성되므로 합계는 경과 시간이 아니다.
+        MySQL 은 ALTER TABLE 한 문장으로 생성하므로 인덱스별 시간이 없다.
+        """
+        if not dropped:
+            return 0.0
+
+        start_time = time.time()
+        print(f"Rebuilding {len(dropped)} indexes on {model._meta.label}...")
+        if connections[self.using].vendor == 'mysql':
+            table = connections[self.using].ops.quote_name(model._meta.db_table)
+            with connections[self.using].cursor() as cursor:
+                cursor.execute(f"ALTER TABLE {table} {', '.join(d['create'] for d in dropped)}")
+            self.save_state(model, [])
+        else:
+            # 인덱스를 하나 만들 때마다 상태 파일에서 제외해 중간에 실패해도 남은 인덱스만 다음 실행에서 만듦
+            pending = list(dropped)
+            lock = threading.Lock()
+
+            def create(definition):
+                self.create_index(model, definition)
+                with lock:
+                    pending.remove(definition)
+                    self.save_state(model, pending)
+
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for _ in executor.map(create, dropped):
+                    pass
+
+        duration = time.time() - start_time
+        print(f"Rebuilt indexes on {model._meta.label} in {duration:.2f} seconds")
+        return duration
+
+    def create_index(self, model, definition: dict):
+        """스레드 전용 연결에서 인덱스 하나를 생성"""
+        start_time = time.time()
+        connection = connections[self.using]
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(f"SET maintenance_work_mem = '{self.maintenance_work_mem}'")
+                # 이전 실행에서 인덱스만 만들고 제약 연결 전에 중단된 경우 create 가 None
+                if definition['create']:
+                    cursor.execute(definition['create'])
+                if definition['attach']:
+                    cursor.execute(definition['attach'])
+        finally:
+            connection.close()
+        self.record_timing(model, definition, time.time() - start_time)
+
+    def record_timing(self, model, definition: dict, duration: float):
+        self.timings.append({'model': model._meta.label, 'index': definition['name'], 'seconds': duration})
+        print(f"Index {definition['name']} on {model._meta.label} rebuilt in {duration:.2f} seconds")
+
+
+class LoadSessionProfile:
+    """대량 적재 동안 new_db 세션에 적용하는 벤더별 설정 묶음
+
+    설정은 connection_created 시그널로 새로 맺는 모든 new_db 연결(워커 프로세스, 파이프라인 쓰기 스레드 포함)에
+    적용하고, 종료 시 현재 연결의 설정을 기본값으로 되돌린 뒤 연결을 닫는다. 세션 설정은 연결이 닫히면
+    사라지므로 워커와 스레드의 연결은 각자 닫힐 때 함께 복구된다.
+
+    unlogged_tables 이면 PostgreSQL 에서 다른 테이블의 외래키가 참조하지 않는 테이블을 적재하는 동안 UNLOGGED 로
+    바꿔 WAL 기록을 생략하고, 적재가 끝나면(실패해도) LOGGED 로 되돌린다. 중단되어 UNLOGGED 로 남은 테이블은
+    다음 실행에서 해당 모델을 적재한 뒤 LOGGED 로 되돌린다.
+    """
+
+    PROFILES = {
+        # 커밋 시 WAL 플러시를 기다리지 않고(장애 시 마지막 커밋 일부 유실, 재실행으로 복구) 유니크 검사 생략
+        'bulk': {
+            'postgresql': [('synchronous_commit', 'off'), ('maintenance_work_mem', '1GB')],
+            'mysql': [('unique_checks', 0), ('foreign_key_checks', 0)],
+        },
+        # bulk + 외래키 트리거 생략(PostgreSQL 슈퍼유저 필요) 및 바이너리 로그 기록 안 함(복제 서버에 반영되지 않음)
+        'unchecked': {
+            'postgresql': [('synchronous_commit', 'off'), ('maintenance_work_mem', '1GB'),
+                           ('session_replication_role', 'replica')],
+            'mysql': [('unique_checks', 0), ('foreign_key_checks', 0), ('sql_log_bin', 0)],
+        },
+    }
+
+    def __init__(self, name: str = None, using='new_db', unlogged_tables=False):
+        if name is not None and name not in self.PROFILES:
+            raise ValueError(f"Unknown load profile: {name}")
+        self.name = name
+        self.using = using
+        self.unlogged_tables = unlogged_tables
+        self.failed: Set[str] = set()  # 권한 부족 등으로 적용하지 못한 설정 (프로세스당 한 번만 경고)
+
+    def get_settings(self, vendor: str) -> List[tuple]:
+        """벤더별 세션 설정 (PROFILES 에 없는 벤더는 빈 목록이라 프로파일이 아무것도 하지 않음)"""
+        return self.PROFILES.get(self.name, {}).get(vendor, [])
+
+    def manages(self, connection, setting: str) -> bool:
+        """프로파일이 적재 동안 유지하는 설정인지 (다른 곳에서 되돌리지 않도록)"""
+        return connection.alias == self.using and any(
+            name == setting and name not in self.failed for name, _ in self.get_settings(connection.vendor))
+
+    def activate(self):
+        """이후 생성되는 new_db 연결에 설정을 적용 (열려 있는 연결은 닫아 다음 사용 시 새 연결에 적용)"""
+        vendor = connections[self.using].vendor
+        settings_text = ', '.join(f"{name}={value}" for name, value in self.get_settings(vendor))
+        if settings_text:
+            print(f"Applying load profile '{self.name}' to {self.using} sessions: {settings_text}")
+        elif self.name:
+            print(f"Load profile '{self.name}' has no settings for {vendor}, {self.using} sessions are unchanged")
+        connection_created.connect(self.apply, dispatch_uid='migrate_db_load_profile')
+        connections[self.using].close()
+
+    def apply(self, sender, connection, **kwargs):
+        settings_list = self.get_settings(connection.vendor)
+        if connection.alias != self.using or not settings_list:
+            return
+
+        # 연결 생성 중이므로 Django 커서 대신 드라이버 커서 사용 (자동 커밋 상태라 실패해도 이후 쿼리에 영향 없음)
+        # sqlite3 등 컨텍스트 매니저를 지원하지 않는 드라이버 커서도 있으므로 closing 으로 닫음
+        with contextlib.closing(connection.connection.cursor()) as cursor:
+            for name, value in settings_list:
+                try:
+                    if connection.vendor == 'postgresql':
+                        cursor.execute(f"SET {name} = %s", [value])
+                    else:
+                        cursor.execute(f"SET SESSION {name} = %s", [value])
+                except Exception as e:
+                    if name not in self.failed:
+                        self.failed.add(name)
+                        print(f"Warning: could not set {name}={value} on {self.using}: {e}")
+
+    def deactivate(self):
+        """시그널을 해제하고 현재 연결의 설정을 세션 기본값으로 되돌린 뒤 연결을 닫음"""
+        connection_created.disconnect(dispatch_uid='migrate_db_load_profile')
+        connection = connections[self.using]
+        if connection.connection is None:
+            return
+
+        try:
+            with contextlib.closing(connection.connection.cursor()) as cursor:
+                for name, _ in self.get_settings(connection.vendor):
+                    if connection.vendor == 'postgresql':
+                        cursor.execute(f"RESET {name}")
+                    else:
+                        cursor.execute(f"SET SESSION {name} = DEFAULT")
+        except Exception as e:
+            print(f"Warning: could not reset load profile settings on {self.using}: {e}")
+        finally:
+            # 되돌리지 못했더라도 연결을 닫으면 세션 설정은 사라짐
+            connection.close()
+
+    def set_unlogged(self, model) -> bool:
+        """적재 전 테이블을 UNLOGGED 로 변경 (LOGGED 로 되돌려야 하면 True)"""
+        connection = connections[self.using]
+        if not self.unlogged_tables or connection.vendor != 'postgresql':
+            return False
+
+        table = connection.ops.quote_name(model._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT relpersistence FROM pg_class WHERE oid = %s::regclass", [table])
+            if cursor.fetchone()[0] == 'u':
+                print(f"{model._meta.label} is already UNLOGGED (interrupted run), switching back after loading")
+                return True
+
+            # 영구 테이블은 UNLOGGED 테이블을 참조할 수 없으므로 다른 테이블이 참조하는 테이블은 제외
+            cursor.execute("""
+                SELECT count(*) FROM pg_constraint
+                WHERE contype = 'f' AND confrelid = %s::regclass AND conrelid <> confrelid
+            """, [table])
+            if cursor.fetchone()[0]:
+                print(f"Keeping {model._meta.label} LOGGED (referenced by foreign keys of other tables)")
+                return False
+
+            cursor.execute(f"ALTER TABLE {table} SET UNLOGGED")
+        print(f"Switched {model._meta.label} to UNLOGGED for loading")
+        return True
+
+    def set_logged(self, model):
+        """적재한 테이블을 LOGGED 로 되돌림 (테이블 전체를 한 번에 WAL 에 기록)"""
+        start_time = time.time()
+        connection = connections[self.using]
+        with connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {connection.ops.quote_name(model._meta.db_table)} SET LOGGED")
+        print(f"Switched {model._meta.label} back to LOGGED in {time.time() - start_time:.2f} seconds")
+
+
+class ReferentialIntegrityChecker:
+    """적재 후 new_db 의 모든 외래키에 대해 참조 대상이 없는 행(고아 행)을 집합 연산으로 검사
+
+    외래키 검사를 끄고 적재하므로(MySQL foreign_key_checks, PostgreSQL session_replication_role) 적재가 끝나면
+    외래키마다 LEFT JOIN ... IS NULL 안티 조인 쿼리 하나로 고아 행 수와 샘플 PK 를 구한다.
+    쿼리는 스레드별 연결에서 병렬로 실행하고, 결과는 JSON 리포트로 기록한다.
+    """
+
+    def __init__(self, using: str, report_path: str, workers=4, sample_size=20):
+        self.using = using
+        self.report_path = report_path
+        self.workers = workers
+        self.sample_size = sample_size  # 외래키별로 리포트에 남길 고아 행 (PK, 외래키 값) 샘플 수
+
+    def get_foreign_keys(self, models: List[Model], tables: Set[str]) -> List[tuple]:
+        """검사할 (모델, 외래키 필드) 목록 (참조 대상 테이블이 new_db 에 없는 외래키 제외)"""
+        foreign_keys = []
+        for model in models:
+            for field in model._meta.concrete_fields:
+                if field.is_relation and (field.many_to_one or field.one_to_one) and \
+                        field.related_model._meta.db_table in tables:
+                    foreign_keys.append((model, field))
+        return foreign_keys
+
+    def get_orphan_sql(self, model, field) -> str:
+        """고아 행의 (PK, 외래키 값, 전체 고아 행 수) 를 PK 순으로 sample_size 개 반환하는 안티 조인 쿼리"""
+        quote_name = connections[self.using].ops.quote_name
+        child_pk = f"c.{quote_name(model._meta.pk.column)}"
+        child_fk = f"c.{quote_name(field.column)}"
+        parent_key = f"p.{quote_name(field.target_field.column)}"
+        return f"""
+            SELECT {child_pk}, {child_fk}, COUNT(*) OVER ()
+            FROM {quote_name(model._meta.db_table)} c
+            LEFT JOIN {quote_name(field.related_model._meta.db_table)} p ON {parent_key} = {child_fk}
+            WHERE {child_fk} IS NOT NULL AND {parent_key} IS NULL
+            ORDER BY {child_pk}
+            LIMIT {int(self.sample_size)}
+        """
+
+    def check_foreign_key(self, model, field) -> dict:
+        """스레드 전용 연결에서 외래키 하나의 고아 행 검사"""
+        start_time = time.time()
+        connection = connections[self.using]
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(self.get_orphan_sql(model, field))
+                rows = cursor.fetchall()
+        finally:
+            connection.close()
+        return {
+            'model': model._meta.label,
+            'field': field.name,
+            'references': field.related_model._meta.label,
+            'orphans': rows[0][2] if rows else 0,
+            'sample': [[pk, value] for pk, value, _ in rows],
+            'seconds': round(time.time() - start_time, 3),
+        }
+
+    def run(self, models: List[Model]) -> dict:
+        """모든 외래키를 병렬로 검사하고 리포트 기록 (고아 행이 있으면 IntegrityError)"""
+        start_time = time.time()
+        tables = set(connections[self.using].introspection.table_names())
+        foreign_keys = self.get_foreign_keys(models, tables)
+        print(f"\nChecking {len(foreign_keys)} foreign keys in {self.using} for orphaned rows "
+              f"with {self.workers} workers...")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(lambda foreign_key: self.check_foreign_key(*foreign_key), foreign_keys))
+
+        violations = [result for result in results if result['orphans']]
+        for result in violations:
+            sample = ', '.join(str(pk) for pk, _ in result['sample'])
+            print(f"{result['model']}.{result['field']} -> {result['references']}: {result['orphans']} orphaned rows "
+                  f"(pk {sample}{', ...' if result['orphans'] > len(result['sample']) else ''})")
+
+        report = {
+            'checked': timezone.now().isoformat(),
+            'duration': round(time.time() - start_time, 3),
+            'foreign_keys': results,
+            'violations': len(violations),
+        }
+        temp_path = f"{self.report_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+        os.replace(temp_path, self.report_path)
+
+        print(f"Integrity check finished in {report['duration']:.2f} seconds, "
+              f"{len(violations)} of {len(results)} foreign keys have orphaned rows. Report: {self.report_path}")
+        if violations:
+            raise IntegrityError(f"{len(violations)} foreign keys have orphaned rows in {self.using}, "
+                                 f"see {self.report_path}")
+        return report
+
+
+class BatchProgress:
+    """배치 커밋 진행률 출력 및 체크포인트 저장 (쓰기 스레드 여러 개에서 호출 가능)
+
+    배치가 순서와 다르게 커밋될 수 있으므로 앞선 배치가 모두 커밋된 위치까지만 체크포인트를 저장한다.
+    """
+
+    def __init__(self, migrator, model, estimated_count: int, shard: int = None):
+        self.migrator = migrator
+        self.model = model
+        self.label = model._meta.label if shard is None else f"{model._meta.label}#{shard}"
+        self.estimated_count = estimated_count
+        self.shard = shard
+        self.total_count = 0
+        self.batch_count = 0
+        self.last_progress = 0
+        self.last_pk = None
+        self.next_sequence = 0
+        self.pending: Dict[int, object] = {}
+        self.metrics = defaultdict(float)
+        self.lock = threading.Lock()
+
+    def committed(self, sequence: int, last_pk, row_count: int):
+        with self.lock:
+            self.pending[sequence] = last_pk
+            while self.next_sequence in self.pending:
+                self.last_pk = self.pending.pop(self.next_sequence)
+                self.next_sequence += 1
+                if self.migrator.checkpoint:
+                    self.migrator.checkpoint.save(self.model, self.last_pk, self.shard)
+
+            self.total_count += row_count
+            self.batch_count += 1
+
+            progress = (self.total_count / self.estimated_count * 100) if self.estimated_count else 100
+            if progress - self.last_progress >= 5:
+                print(f"Batch {self.batch_count} completed: {self.total_count}/{self.estimated_count} "
+                      f"records migrated ({progress:.1f}%)")
+                self.last_progress = progress
+
+
 class DatabaseMigrator:
-    def __init__(self, app_labels: List[str], batch_size=5000, exclude_models: List[str] = None):
+    MODES = ('full', 'delta', 'merge')
+    SPOOL_STAGES = ('export', 'import')
+
+    # 좁은 컬럼을 먼저 적재한 뒤 별도 단계에서 채우는 큰 TEXT/JSON 컬럼
+    DEFAULT_HEAVY_FIELDS = {
+        'member.profile': ['photo_id', 'card'],
+        'member.mmsdata': ['data'],
+        'member.phoneverificationlog': ['ci'],
+        'shop.emailtemplate': ['html_content'],
+        'shop.order': ['user_agent', 'message'],
+        'shop.naveradvertisementlog': ['user_agent'],
+    }
+    ENGINES = ('orm', 'copy', 'stream')
+
+    # PostgreSQL 바인드 파라미터 한도
+    MAX_INSERT_PARAMS = 65535
+
+    def __init__(self, app_labels: List[str], batch_size=5000, exclude_models: List[str] = None, workers=1,
+                 default_engine='orm', engines: Dict[str, str] = None, copy_binary=True,
+                 checkpoint_dir: str = None, resume=False, shards: Dict[str, int] = None,
+                 shard_method='minmax', mode='full', delta_state_file: str = None, delta_overlap_seconds=300,
+                 exact_counts=False, stats_file: str = None, rebuild_indexes=False, index_workers=4,
+                 index_state_dir='migrate_indexes', heavy_fields: Dict[str, List[str]] = None, heavy_batch_size=1000,
+                 pipeline_depth=0, pipeline_writers=1, adaptive_batches=False, batch_memory_budget=64 * 1024 * 1024,
+                 target_batch_seconds=2.0, merge_keys: Dict[str, List[str]] = None, rebuild_trees=False,
+                 consistent_snapshot=False, spool_stage=None, spool_dir='migrate_spool',
+                 row_filters: Dict[str, Q] = None, telemetry_sinks: list = None, load_profile: str = None,
+                 unlogged_tables=False, integrity_report: str = None, integrity_workers=4):
         self.app_labels = app_labels
         self.exclude_models = exclude_models or []  # format: ['app_label.model_name', ...]
         self.processed_models: Set[Model] = set()
         self.dependency_graph = defaultdict(set)
         self.batch_size = batch_size
+        self.workers = max(1, workers)  # 1이면 순차 실행
+        self.default_engine = default_engine
+        self.engines = engines or {}  # format: {'app_label.model_name': 'copy', ...}
+        self.copy_binary = copy_binary  # PostgreSQL 간 COPY 시 바이너리 포맷 사용 여부
+        self.results: List[dict] = []  # 모델별 엔진, 레코드 수, 소요 시간
+        if spool_stage not in (None, *self.SPOOL_STAGES):
+            raise ValueError(f"Unknown spool stage: {spool_stage}")
+        if spool_stage and mode == 'delta':
+            raise ValueError("Spool stages copy whole tables and cannot run in delta mode")
+        # 'export': old_db 를 스풀 파일로만 내보냄, 'import': old_db 대신 스풀 파일에서 new_db 로 적재
+        self.spool_stage = spool_stage
+        # 모델별로 옮길 행 조건 (format: {'app_label.model_name': Q(...), ...}), 조건은 모델 자신의 컬럼만 사용
+        self.row_filters = row_filters or {}
+        self.telemetry = MigrationTelemetry(telemetry_sinks or [])
+        self.spool = ColumnarSpool(spool_dir) if spool_stage else None
+        # 스풀 단계는 단계별로 체크포인트를 따로 관리 (내보내기 완료가 적재 완료로 간주되지 않도록)
+        if checkpoint_dir and spool_stage:
+            checkpoint_dir = os.path.join(checkpoint_dir, spool_stage)
+        self.checkpoint = MigrationCheckpoint(checkpoint_dir) if checkpoint_dir else None
+        self.resume = resume  # True 면 완료된 모델은 건너뛰고 중단된 모델은 마지막 PK 이후부터 이어서 진행
+        self.shards = shards or {}  # format: {'app_label.model_name': 샤드 수, ...}
+        self.shard_method = shard_method  # 'minmax' 또는 'histogram' (PostgreSQL pg_stats 기반)
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown migration mode: {mode}")
+        if mode == 'delta' and not delta_state_file:
+            raise ValueError("Delta mode requires delta_state_file")
+        # 'full': 전체 복사, 'delta': 워터마크 이후 변경분만 upsert, 'merge': 전체 행을 upsert 해 재실행 시 변경분 반영
+        self.mode = mode
+        self.merge_keys = merge_keys or {}  # format: {'app_label.model_name': ['field_name', ...], ...} (기본은 PK)
+        self.rebuild_trees = rebuild_trees  # True 면 적재 후 MPTT 모델의 lft/rght/tree_id/level 을 다시 계산
+        # True 면 모든 old_db 읽기 연결이 같은 시점의 스냅샷을 보도록 함 (MySQL 은 연결별 일관 스냅샷)
+        self.consistent_snapshot = consistent_snapshot
+        self.snapshot_active = False
+        self.snapshot_id = None
+        self.snapshot_time = None
+        self.snapshot_coordinator = None
+        # 적재 동안 new_db 세션 설정 프로파일 ('bulk', 'unchecked') 및 PostgreSQL UNLOGGED 적재 여부
+        self.load_profile = LoadSessionProfile(load_profile, 'new_db', unlogged_tables) \
+            if load_profile or unlogged_tables else None
+        # 적재 후 외래키 고아 행 검사 리포트 경로 (None 이면 검사 안 함)
+        self.integrity = ReferentialIntegrityChecker('new_db', integrity_report, integrity_workers) \
+            if integrity_report else None
+        if consistent_snapshot:
+            connection_created.connect(self.attach_source_snapshot, dispatch_uid='migrate_db_source_snapshot')
+        self.delta_marks = DeltaWatermarks(delta_state_file) if delta_state_file else None
+        # 서버 간 시계 오차 및 실행 중 커밋된 트랜잭션을 고려해 워터마크보다 앞당겨 조회하는 시간
+        self.delta_overlap = datetime.timedelta(seconds=delta_overlap_seconds)
+        self.exact_counts = exact_counts  # True 면 진행률 표시에 COUNT(*) 사용, 기본은 카탈로그 통계 추정치
+        self.throughput = ThroughputHistory(stats_file) if stats_file else None
+        self.schemas: Dict[str, SchemaSnapshot] = {}
+        # True 면 적재 전 new_db 보조 인덱스를 삭제하고 적재 후 다시 생성
+        # merge 모드는 충돌 대상 유니크 인덱스가 필요하므로 인덱스를 삭제하지 않음
+        self.indexes = SecondaryIndexManager('new_db', index_state_dir, index_workers) \
+            if rebuild_indexes and mode != 'merge' else None
+        # format: {'app_label.model_name': ['field_name', ...], ...}
+        self.heavy_fields = self.DEFAULT_HEAVY_FIELDS if heavy_fields is None else heavy_fields
+        self.heavy_batch_size = heavy_batch_size
+        self.pipeline_depth = pipeline_depth  # 읽기/쓰기 파이프라인 큐에 보관할 최대 배치 수 (0 이면 순차 실행)
+        self.pipeline_writers = max(1, pipeline_writers)
+        self.adaptive_batches = adaptive_batches  # True 면 배치 크기를 측정값으로 조정
+        self.batch_memory_budget = batch_memory_budget  # 동시에 메모리에 올라가는 배치 전체의 상한 (바이트)
+        self.target_batch_seconds = target_batch_seconds
+        for engine in [default_engine, *self.engines.values()]:
+            if engine not in self.ENGINES:
+                raise ValueError(f"Unknown migration engine: {engine}")
+        # COPY 엔진은 COPY FROM STDIN(PostgreSQL) 또는 LOAD DATA(MySQL) 대상만 지원 (모델 적재를 시작한 뒤 실패하지 않도록)
+        target_vendor = connections['new_db'].vendor
+        if mode == 'full' and not spool_stage and target_vendor not in ('postgresql', 'mysql') \
+                and 'copy' in [default_engine, *self.engines.values()]:
+            raise ValueError(f"COPY engine does not support {target_vendor} target, use the 'stream' engine")
         self.build_dependency_graph()
 
     def should_migrate_model(self, model: Model) -> bool:
@@ -30,22 +1466,27 @@ class DatabaseMigrator:
         if model_identifier in self.exclude_models:
             return False
 
+        # 스풀 적재 단계는 old_db 대신 내보낸 스풀 파일이 있는지 확인
+        if self.spool_stage == 'import':
+            return self.spool.has_model(model)
+
         # old_db에 테이블이 존재하는지 확인
-        with connections['old_db'].cursor() as cursor:
-            try:
-                cursor.execute(f"""
-                    SELECT EXISTS (
-                        SELECT 1 
-                        FROM information_schema.tables 
-                        WHERE table_schema = 'public' 
-                        AND table_name = '{model._meta.db_table}'
-                    )
-                """)
-                exists = cursor.fetchone()[0]
-                return exists
-            except Exception as e:
-                print(f"Warning: Error checking table existence for {model_identifier}: {e}")
-                return False
+        try:
+            return self.get_schema('old_db').has_table(model._meta.db_table)
+        except Exception as e:
+            print(f"Warning: Error checking table existence for {model_identifier}: {e}")
+            return False
+
+    def get_schema(self, using: str) -> SchemaSnapshot:
+        """실행당 한 번만 읽는 스키마 스냅샷"""
+        if using not in self.schemas:
+            self.schemas[using] = SchemaSnapshot(using)
+        return self.schemas[using]
+
+    def get_missing_columns(self, model) -> List[str]:
+        """모델에는 있지만 old_db 테이블에는 없는 컬럼"""
+        old_columns = set(self.get_schema('old_db').get_columns(model._meta.db_table))
+        return [field.column for field in model._meta.concrete_fields if field.column not in old_columns]
 
     def run_migration(self):
         """전체 마이그레이션 프로세스를 실행하는 메인 메서드"""
@@ -53,92 +1494,641 @@ class DatabaseMigrator:
             print(f"Starting database migration for apps: {', '.join(self.app_labels)}")
             if self.exclude_models:
                 print(f"Excluding models: {', '.join(self.exclude_models)}")
-            self.migrate_data()
+            if self.consistent_snapshot:
+                self.open_source_snapshot()
+            # 계획 출력 등 적재하지 않는 실행이 이전 체크포인트를 지우지 않도록 적재 직전에 정리
+            if self.checkpoint and not self.resume:
+                self.checkpoint.clear()
+            if self.load_profile:
+                self.load_profile.activate()
+            try:
+                self.migrate_data()
+            finally:
+                # 실패해도 세션 설정과 스냅샷을 복구하고 보고서 기록
+                if self.load_profile:
+                    self.load_profile.deactivate()
+                self.close_source_snapshot()
+                self.telemetry.close()
             print("Migration completed successfully!")
         except Exception as e:
             print(f"Error during migration: {str(e)}")
+            if self.checkpoint:
+                print(f"Checkpoints saved in {self.checkpoint.directory}; re-run with resume=True to continue")
             raise
 
+    def open_source_snapshot(self):
+        """old_db 읽기 연결들이 공유할 스냅샷 준비
+
+        PostgreSQL 은 Django 가 관리하지 않는 코디네이터 연결에서 REPEATABLE READ 트랜잭션을 열고
+        pg_export_snapshot() 으로 스냅샷을 내보낸다. 코디네이터 트랜잭션은 마이그레이션이 끝날 때까지 유지되며,
+        이후 생성되는 모든 old_db 연결(워커 프로세스, 파이프라인/COPY 스레드 포함)이 SET TRANSACTION SNAPSHOT
+        으로 같은 시점을 읽는다. 포크된 워커는 os._exit 로 종료되므로 상속한 코디네이터 연결을 닫지 않는다.
+
+        MySQL 은 스냅샷을 내보낼 수 없으므로 연결마다 START TRANSACTION WITH CONSISTENT SNAPSHOT 으로 시작한다.
+        각 모델(샤드)은 일관된 시점에서 읽지만, 서로 다른 연결 간에는 연결이 열린 시각만큼 차이가 날 수 있다.
+        """
+        source = connections['old_db']
+        # 스냅샷보다 앞선 시각을 워터마크로 사용하도록 내보내기 전에 기록
+        snapshot_time = timezone.now()
+        if source.vendor == 'postgresql':
+            self.snapshot_coordinator = source.get_new_connection(source.get_connection_params())
+            self.snapshot_coordinator.set_session(isolation_level='REPEATABLE READ', readonly=True)
+            with self.snapshot_coordinator.cursor() as cursor:
+                cursor.execute("SELECT pg_export_snapshot()")
+                self.snapshot_id = cursor.fetchone()[0]
+            print(f"Reading old database from exported snapshot {self.snapshot_id}")
+        elif source.vendor == 'mysql':
+            print("Reading old database with a consistent snapshot per connection (MySQL cannot share snapshots)")
+        else:
+            print(f"Consistent snapshots are not supported for {source.vendor}, reading without a snapshot")
+            return
+
+        # 스냅샷 이전에 열린 연결은 닫아 다음 조회 시 스냅샷에 연결된 새 연결을 사용
+        source.close()
+        self.snapshot_active = True
+        self.snapshot_time = snapshot_time
+
+    def close_source_snapshot(self):
+        """스냅샷 트랜잭션을 종료하고 이후 old_db 연결은 최신 데이터를 읽도록 복구"""
+        if not self.snapshot_active:
+            return
+        self.snapshot_active = False
+        self.snapshot_time = None
+        connections['old_db'].close()
+        if self.snapshot_coordinator:
+            self.snapshot_coordinator.close()
+            self.snapshot_coordinator = None
+            self.snapshot_id = None
+
+    def attach_source_snapshot(self, sender, connection, **kwargs):
+        """새 old_db 연결을 공유 스냅샷(PostgreSQL) 또는 일관 스냅샷(MySQL) 읽기 트랜잭션으로 시작"""
+        if connection.alias != 'old_db' or not self.snapshot_active:
+            return
+
+        # 트랜잭션이 연결이 닫힐 때까지 유지되도록 자동 커밋을 끔 (old_db 는 읽기만 하므로 커밋하지 않음)
+        if connection.vendor == 'postgresql':
+            connection.connection.set_session(isolation_level='REPEATABLE READ', readonly=True)
+            connection.set_autocommit(False)
+            with connection.connection.cursor() as cursor:
+                cursor.execute("SET TRANSACTION SNAPSHOT %s", [self.snapshot_id])
+        elif connection.vendor == 'mysql':
+            connection.set_autocommit(False)
+            with connection.connection.cursor() as cursor:
+                cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY")
+
     def migrate_data(self):
         """의존성 순서에 따라 모든 모델의 데이터를 마이그레이션"""
         migration_order = self.get_migration_order()
         total_start_time = time.time()
+        # 복사 시작 전 시각(스냅샷을 사용하면 스냅샷 직전 시각)을 워터마크로 사용하여
+        # 복사 중 변경된 행도 다음 delta 에서 다시 가져옴
+        high_water_mark = self.snapshot_time or timezone.now()
 
         print("\nMigration order:")
         for i, model in enumerate(migration_order, 1):
             status = "SKIP" if not self.should_migrate_model(model) else "MIGRATE"
             print(f"{i}. {model._meta.label} [{status}]")
+            if status == "MIGRATE" and self.spool_stage != 'import' and self.get_missing_columns(model):
+                print(f"   Warning: columns missing in old database: {', '.join(self.get_missing_columns(model))}")
+
+        if self.workers > 1:
+            self.migrate_data_parallel(migration_order)
+        else:
+            for model in migration_order:
+                if not self.should_migrate_model(model):
+                    print(f"\nSkipping migration for {model._meta.label} (excluded or not in old database)")
+                    continue
+
+                self.migrate_model(model)
+
+        migrated = [model for model in migration_order if self.should_migrate_model(model)]
+        if self.spool_stage == 'export':
+            # 내보내기 단계는 new_db 를 변경하지 않으므로 시퀀스/트리/워터마크는 적재 단계에서 처리
+            self.spool.write_summary(migrated)
+        else:
+            # 모든 모델 적재 후 시퀀스를 한 번에 조정
+            self.reset_sequences(migrated)
+
+            if self.rebuild_trees:
+                for model in migrated:
+                    if hasattr(model, '_mptt_meta'):
+                        self.rebuild_tree(model)
+
+            # 외래키 검사를 끈 채 적재했으므로 고아 행이 없을 때만 완료로 처리 (실패하면 워터마크를 남기지 않음)
+            # 모든 외래키를 전체 조인으로 검사하므로 전체 복사(full)에서만 실행하고 짧은 delta/merge 실행은 생략
+            if self.integrity and self.mode == 'full':
+                self.integrity.run(migrated)
+            elif self.integrity:
+                print(f"\nSkipping foreign key orphan check in {self.mode} mode")
+
+        if self.spool_stage == 'import':
+            # 스풀에서 적재한 데이터는 내보낸 시점 기준이므로 내보내기 시각을 워터마크로 사용
+            high_water_mark = self.spool.get_exported_at(migrated) or high_water_mark
+
+        if self.delta_marks and self.spool_stage != 'export':
+            # delta 모드에서는 전체 복사를 거친(워터마크가 있는) 모델만 워터마크를 갱신
+            self.delta_marks.update([
+                model for model in migration_order
+                if self.should_migrate_model(model) and (self.mode == 'full' or self.delta_marks.get(model))
+            ], high_water_mark)
+            self.delta_marks.save()
+            print(f"\nRecorded high-water mark {high_water_mark.isoformat()} in {self.delta_marks.path}")
+
+        if self.throughput:
+            self.throughput.update(self.results)
+            self.throughput.save()
 
-        for model in migration_order:
+        total_duration = time.time() - total_start_time
+        self.print_results()
+        print(f"\nTotal migration time: {total_duration:.2f} seconds")
+
+    def get_table_stats(self, model, using='old_db') -> tuple:
+        """스키마 스냅샷의 (추정 행 수, 테이블 크기 바이트), 알 수 없으면 None"""
+        schema = self.get_schema(using)
+        return schema.get_row_estimate(model._meta.db_table), schema.get_size(model._meta.db_table)
+
+    def estimate_count(self, model, queryset=None, shard: int = None) -> int:
+        """진행률 표시용 행 수 (기본은 카탈로그 추정치, exact_counts 이면 COUNT(*))"""
+        if queryset is None:
+            queryset = self.get_source_queryset(model)
+        if self.exact_counts:
+            return queryset.count()
+
+        # 행 필터가 있으면 테이블 통계 대신 필터를 반영한 실행 계획의 추정치 사용
+        if self.get_row_filter(model):
+            rows = self.get_planner_estimate(queryset)
+            if rows is None:
+                print(f"No planner estimate for filtered {model._meta.label}, counting rows")
+                return queryset.count()
+            return rows
+
+        rows, _ = self.get_table_stats(model)
+        if rows is None:
+            print(f"No catalog statistics for {model._meta.label}, counting rows")
+            return queryset.count()
+        if shard is not None:
+            rows //= self.get_shard_count(model)
+        return rows
+
+    def get_planner_estimate(self, queryset):
+        """PostgreSQL 실행 계획의 예상 행 수 (다른 벤더는 None)"""
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    def print_plan(self):
+        """실제 복사 없이 마이그레이션 순서대로 모델별 예상 행 수, 크기, 소요 시간 출력"""
+        migration_order = self.get_migration_order()
+        print(f"\nMigration plan ({self.mode} mode):")
+        print(f"{'#':>3} {'model':<40} {'engine':<7} {'rows':>12} {'size MB':>10} {'rec/s':>10} {'est. time':>10}")
+
+        total_rows = total_bytes = total_seconds = 0
+        unknown_duration = False
+        for i, model in enumerate(migration_order, 1):
             if not self.should_migrate_model(model):
-                print(f"\nSkipping migration for {model._meta.label} (excluded or not in old database)")
+                print(f"{i:>3} {model._meta.label:<40} {'SKIP':<7}")
                 continue
 
-            print(f"\nStarting migration for {model._meta.label}...")
-            if model.__name__ == 'Profile':
-                self.migrate_profile_data(model)
+            _, size = self.get_table_stats(model)
+            rows = self.estimate_count(model)
+            rate = self.throughput.get_rate(model) if self.throughput else None
+            seconds = rows / rate if rate else None
+
+            total_rows += rows
+            total_bytes += size or 0
+            if seconds is None:
+                unknown_duration = True
+            else:
+                total_seconds += seconds
+
+            engine = self.get_engine(model)
+            if self.get_shard_count(model) > 1:
+                engine = f"{engine}x{self.get_shard_count(model)}"
+            size_text = f"{size / 1024 / 1024:.1f}" if size is not None else '?'
+            rate_text = f"{rate:.0f}" if rate else '?'
+            seconds_text = f"{seconds:.1f}s" if seconds is not None else '?'
+            print(f"{i:>3} {model._meta.label:<40} {engine:<7} {rows:>12} {size_text:>10} {rate_text:>10} "
+                  f"{seconds_text:>10}")
+
+        print(f"Total: {total_rows} rows, {total_bytes / 1024 / 1024:.1f} MB, "
+              f"about {total_seconds:.1f} seconds sequentially"
+              f"{' (some models have no measured throughput)' if unknown_duration else ''}")
+
+    def report_model_result(self, model, engine: str, total_count: int, duration: float, shard: int = None,
+                            metrics: dict = None):
+        """모델 마이그레이션 결과 출력 및 기록"""
+        label = model._meta.label if shard is None else f"{model._meta.label}#{shard}"
+        self.results.append({
+            'model': label,
+            'engine': engine,
+            'records': total_count,
+            'seconds': duration,
+            'metrics': dict(metrics or {}),
+        })
+        self.telemetry.emit('model_done', model=label, engine=engine, records=total_count, seconds=duration,
+                            metrics=dict(metrics or {}))
+        print(f"Completed migrating {label}")
+        print(f"Engine: {engine}")
+        print(f"Total records: {total_count}")
+        print(f"Time taken: {duration:.2f} seconds")
+        print(f"Average speed: {total_count / duration:.2f} records/second")
+        print("-" * 50)
+
+    def print_results(self):
+        """엔진별 처리 속도를 비교할 수 있도록 모델별 결과 요약 출력"""
+        if not self.results:
+            return
+
+        print("\nMigration summary:")
+        print(f"{'model':<40} {'engine':<8} {'records':>12} {'seconds':>10} {'records/s':>12}")
+        for result in self.results:
+            speed = result['records'] / result['seconds'] if result['seconds'] else 0
+            print(f"{result['model']:<40} {result['engine']:<8} {result['records']:>12} "
+                  f"{result['seconds']:>10.2f} {speed:>12.2f}")
+
+        # merge 모드는 샤드 결과를 모델 단위로 합산해 삽입/갱신/변경 없음/건너뜀 행 수 출력
+        # (지연 컬럼이 있는 모델은 변경 없음 행 수를 알 수 없으므로 '-' 로 표시)
+        merge_counts = defaultdict(lambda: defaultdict(int))
+        for result in self.results:
+            if 'inserted' in result['metrics']:
+                counts = merge_counts[result['model'].split('#')[0]]
+                for name in ('inserted', 'updated', 'unchanged', 'skipped'):
+                    if name in result['metrics']:
+                        counts[name] += int(result['metrics'][name])
+                    elif name == 'unchanged':
+                        counts[name] = None
+        if merge_counts:
+            print("\nMerge summary:")
+            print(f"{'model':<40} {'inserted':>12} {'updated':>12} {'unchanged':>12} {'skipped':>12}")
+            for label, counts in merge_counts.items():
+                unchanged = '-' if counts['unchanged'] is None else counts['unchanged']
+                print(f"{label:<40} {counts['inserted']:>12} {counts['updated']:>12} {unchanged:>12} "
+                      f"{counts['skipped']:>12}")
+
+    def get_engine(self, model) -> str:
+        """모델에 지정된 전송 엔진 반환 (merge 모드는 upsert 결과를 집계하는 stream 엔진만 사용)"""
+        if self.mode == 'merge':
+            return 'stream'
+        model_identifier = f"{model._meta.app_label}.{model._meta.model_name}"
+        return self.engines.get(model_identifier, self.default_engine)
+
+    def get_merge_keys(self, model) -> List[str]:
+        """merge 모드에서 다른 PK 의 행과 겹치는지 확인할 유니크 키 필드 (지정되지 않으면 PK, 충돌 대상은 항상 PK)"""
+        model_identifier = f"{model._meta.app_label}.{model._meta.model_name}"
+        return self.merge_keys.get(model_identifier, [model._meta.pk.name])
+
+    def migrate_model(self, model):
+        """단일 모델 마이그레이션 (전송 엔진 및 모델 종류에 따라 전용 로직 선택)"""
+        if self.checkpoint and self.checkpoint.is_done(model):
+            print(f"\nSkipping migration for {model._meta.label} (completed in previous run)")
+            return
+
+        print(f"\nStarting migration for {model._meta.label}...")
+        engine = self.get_engine(model)
+        self.telemetry.emit('model_start', model=model._meta.label, engine=engine)
+        try:
+            self.migrate_model_with_engine(model, engine)
+        except Exception as e:
+            self.telemetry.emit('error', model=model._meta.label, error=str(e))
+            raise
+
+        if self.checkpoint:
+            self.checkpoint.mark_done(model)
+
+    def migrate_model_with_engine(self, model, engine: str):
+        """스풀 단계, 모드, 전송 엔진에 맞는 적재 로직 실행 (필요하면 인덱스 삭제/재생성 및 지연 컬럼 단계 포함)"""
+        if self.spool_stage == 'export':
+            self.export_model_spool(model)
+        elif self.mode == 'delta':
+            self.migrate_model_delta(model)
+        else:
+            dropped_indexes = self.indexes.drop(model) if self.indexes else []
+            # UNLOGGED 전환은 빈 테이블을 채우는 full 모드에서만 (테이블 재작성 비용이 적재량에 비해 작음)
+            unlogged = False
+            try:
+                unlogged = self.mode == 'full' and self.load_profile and self.load_profile.set_unlogged(model)
+                if self.spool_stage == 'import':
+                    # 스풀 파일에는 지연 컬럼까지 모든 컬럼이 있으므로 지연 단계가 없음
+                    self.import_model_spool(model)
+                elif self.get_shard_count(model) > 1 and engine != 'copy':
+                    self.migrate_model_sharded(model)
+                elif engine == 'copy':
+                    self.migrate_model_copy(model)
+                elif engine == 'stream':
+                    self.migrate_model_stream(model)
+                else:
+                    self.migrate_model_data(model)
+
+                # COPY 엔진은 모든 컬럼을 한 번에 스트리밍하므로 지연 단계가 없음
+                if engine != 'copy' and not self.spool_stage and self.get_heavy_fields(model):
+                    self.migrate_heavy_fields(model)
+            except Exception:
+                # 적재 실패 시에도 LOGGED 전환과 인덱스를 복구하되, 복구 오류는 따로 기록하고 적재 오류를 다시 발생
+                if unlogged:
+                    self.run_recovery_step(model, 'restore LOGGED', self.load_profile.set_logged)
+                self.run_recovery_step(model, 'rebuild indexes',
+                                       lambda m: self.rebuild_model_indexes(m, dropped_indexes))
+                raise
+
+            # 인덱스를 다시 만들기 전에 LOGGED 로 되돌려 인덱스까지 다시 쓰지 않도록 함
+            if unlogged:
+                self.load_profile.set_logged(model)
+            self.rebuild_model_indexes(model, dropped_indexes)
+
+    def run_recovery_step(self, model, step: str, recover: Callable):
+        """적재 실패 후 복구 단계 실행 (복구 오류는 출력과 텔레메트리로만 남겨 원래 적재 오류를 가리지 않음)"""
+        try:
+            recover(model)
+        except Exception as e:
+            print(f"Failed to {step} for {model._meta.label}: {str(e)}")
+            self.telemetry.emit('error', model=model._meta.label, error=f"Failed to {step}: {e}")
+
+    def rebuild_model_indexes(self, model, dropped_indexes: List[dict]):
+        """적재 전에 삭제한 인덱스를 다시 생성 (실패하면 삭제한 정의가 남아 다음 실행에서 복구)"""
+        if not dropped_indexes:
+            return
+        timing_offset = len(self.indexes.timings)
+        duration = self.indexes.rebuild(model, dropped_indexes)
+        # 모델당 경과 시간 한 번만 보고하고 인덱스별 시간은 세부 정보로만 전달
+        self.telemetry.emit('index_rebuilt', model=model._meta.label, seconds=duration,
+                            indexes={timing['index']: round(timing['seconds'], 3)
+                                     for timing in self.indexes.timings[timing_offset:]})
+
+    def get_heavy_fields(self, model) -> List[str]:
+        """모델에 선언된 지연 적재 컬럼 (필드 이름)"""
+        model_identifier = f"{model._meta.app_label}.{model._meta.model_name}"
+        return self.heavy_fields.get(model_identifier, [])
+
+    def get_shard_count(self, model) -> int:
+        """모델에 지정된 PK 범위 샤드 수 반환"""
+        model_identifier = f"{model._meta.app_label}.{model._meta.model_name}"
+        return self.shards.get(model_identifier, 1)
+
+    def get_pk_ranges(self, model, shard_count: int) -> List[tuple]:
+        """모델의 PK 공간을 [low, high) 범위 shard_count 개로 분할"""
+        if model._meta.pk.get_internal_type() not in ('AutoField', 'BigAutoField', 'SmallAutoField',
+                                                      'IntegerField', 'BigIntegerField'):
+            return []
+
+        bounds = self.get_source_queryset(model).aggregate(low=Min('pk'), high=Max('pk'))
+        if bounds['low'] is None:
+            return []
+        low, high = bounds['low'], bounds['high'] + 1
+
+        split_points = []
+        if self.shard_method == 'histogram':
+            split_points = self.get_histogram_split_points(model, shard_count)
+        if not split_points:
+            step = max(1, -(-(high - low) // shard_count))
+            split_points = list(range(low + step, high, step))[:shard_count - 1]
+
+        edges = [low, *[point for point in split_points if low < point < high], high]
+        return [(edges[i], edges[i + 1]) for i in range(len(edges) - 1)]
+
+    def get_shard_ranges(self, model, shard_count: int) -> List[tuple]:
+        """샤드 PK 범위 (체크포인트를 사용하면 첫 실행에서 계산해 저장한 범위를 이어하기에서 그대로 사용)
+
+        샤드 체크포인트는 샤드 번호로만 구분되므로 MAX(pk) 증가, ANALYZE 로 인한 히스토그램 변경, 샤드 수 변경으로
+        경계가 움직이면 완료된 샤드나 마지막 PK 부터 이어가는 샤드가 복사하지 않은 행을 건너뛰게 된다.
+        """
+        if not self.checkpoint:
+            return self.get_pk_ranges(model, shard_count)
+
+        saved_count, pk_ranges = self.checkpoint.get_pk_ranges(model) if self.resume else (None, None)
+        if pk_ranges is None:
+            pk_ranges = self.get_pk_ranges(model, shard_count)
+            self.checkpoint.save_pk_ranges(model, shard_count, pk_ranges)
+            return pk_ranges
+
+        if saved_count != shard_count:
+            raise ValueError(f"Cannot resume {model._meta.label}: previous run used {saved_count} shards, "
+                             f"now configured for {shard_count}")
+        print(f"Reusing PK ranges of {model._meta.label} from checkpoint")
+        # 이전 실행 이후 추가된 행은 마지막 샤드가 이어서 복사하도록 상한만 늘림 (다른 경계는 그대로)
+        if pk_ranges:
+            high = self.get_source_queryset(model).aggregate(high=Max('pk'))['high']
+            if high is not None and high + 1 > pk_ranges[-1][1]:
+                pk_ranges[-1] = (pk_ranges[-1][0], high + 1)
+        return pk_ranges
+
+    def get_histogram_split_points(self, model, shard_count: int) -> List[int]:
+        """PostgreSQL 통계 히스토그램으로 행 수가 고르게 나뉘는 PK 분할 지점 계산"""
+        connection = connections['old_db']
+        if connection.vendor != 'postgresql':
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT histogram_bounds::text::bigint[]
+                FROM pg_stats
+                WHERE schemaname = current_schema() AND tablename = %s AND attname = %s
+            """, [model._meta.db_table, model._meta.pk.column])
+            row = cursor.fetchone()
+
+        if not row or not row[0]:
+            print(f"No histogram statistics for {model._meta.label}, using MIN/MAX split")
+            return []
+
+        histogram = row[0]
+        return sorted({histogram[len(histogram) * i // shard_count] for i in range(1, shard_count)})
+
+    def migrate_model_sharded(self, model):
+        """큰 모델의 PK 범위를 샤드로 나누어 워커 프로세스에서 병렬 복사"""
+        start_time = time.time()
+        pk_ranges = self.get_shard_ranges(model, self.get_shard_count(model))
+        if len(pk_ranges) < 2:
+            print(f"{model._meta.label} cannot be split into PK ranges, migrating without shards")
+            if self.get_engine(model) == 'stream':
+                self.migrate_model_stream(model)
             else:
                 self.migrate_model_data(model)
+            return
 
-        total_duration = time.time() - total_start_time
-        print(f"\nTotal migration time: {total_duration:.2f} seconds")
+        print(f"Splitting {model._meta.label} into {len(pk_ranges)} shards ({self.shard_method}):")
+        for shard, (low, high) in enumerate(pk_ranges):
+            print(f"Shard {shard}: pk >= {low} AND pk < {high}")
+
+        connections.close_all()
+        sys.stdout.flush()
+
+        context = multiprocessing.get_context('fork')
+        worker_counter = context.Value('i', 0)
+        shard_results = []
+
+        with ProcessPoolExecutor(max_workers=len(pk_ranges),
+                                 mp_context=context,
+                                 initializer=_init_migration_worker,
+                                 initargs=(self, worker_counter, 'shard')) as executor:
+            futures = [
+                executor.submit(_migrate_shard_in_worker, model._meta.label, shard, pk_range)
+                for shard, pk_range in enumerate(pk_ranges)
+            ]
+            for future in futures:
+                shard_results.extend(self.collect_worker_result(future))
+
+        self.results.extend(shard_results)
+
+        total_count = sum(result['records'] for result in shard_results)
+        duration = time.time() - start_time
+        print(f"Completed migrating {model._meta.label} with {len(pk_ranges)} shards")
+        for result in shard_results:
+            speed = result['records'] / result['seconds'] if result['seconds'] else 0
+            print(f"{result['model']}: {result['records']} records in {result['seconds']:.2f} seconds "
+                  f"({speed:.2f} records/second)")
+        print(f"Total records: {total_count}")
+        print(f"Time taken: {duration:.2f} seconds")
+        print(f"Average speed: {total_count / duration:.2f} records/second")
+        print("-" * 50)
 
-    def migrate_model_data(self, model):
-        """일반 모델의 데이터를 마이그레이션"""
+    def migrate_model_range(self, model, pk_range: tuple, shard: int):
+        """샤드 하나의 PK 범위를 모델 전송 엔진으로 마이그레이션"""
+        print(f"\nStarting shard {shard} of {model._meta.label} (pk {pk_range[0]} - {pk_range[1]})...")
+        label = f"{model._meta.label}#{shard}"
+        self.telemetry.emit('model_start', model=label, engine=self.get_engine(model))
+        try:
+            if self.get_engine(model) == 'stream':
+                self.migrate_model_stream(model, pk_range, shard)
+            else:
+                self.migrate_model_data(model, pk_range, shard)
+        except Exception as e:
+            self.telemetry.emit('error', model=label, error=str(e))
+            raise
+
+    def get_migration_levels(self, migration_order: List[Model]) -> Dict[Model, int]:
+        """의존성 그래프를 위상 레벨로 분류 (같은 레벨의 모델은 서로 독립)"""
+        levels = {}
+        for model in migration_order:
+            # 자기 참조 및 순환 의존성(아직 레벨이 없는 모델)은 순차 실행과 동일하게 무시
+            dependency_levels = [
+                levels[dependency] for dependency in self.dependency_graph[model]
+                if dependency is not model and dependency in levels
+            ]
+            levels[model] = max(dependency_levels) + 1 if dependency_levels else 0
+        return levels
+
+    def migrate_data_parallel(self, migration_order: List[Model]):
+        """참조하는 모델이 모두 커밋된 모델부터 프로세스 풀에서 병렬 마이그레이션"""
+        targets = [model for model in migration_order if self.should_migrate_model(model)]
+        for model in migration_order:
+            if model not in targets:
+                print(f"\nSkipping migration for {model._meta.label} (excluded or not in old database)")
+
+        levels = self.get_migration_levels(targets)
+        print(f"\nParallel migration with {self.workers} workers:")
+        for level in sorted(set(levels.values())):
+            labels = [model._meta.label for model in targets if levels[model] == level]
+            print(f"Level {level}: {', '.join(labels)}")
+
+        # 자기 참조 및 순환 의존성을 제외하고 먼저 완료되어야 하는 모델
+        pending = {
+            model: {
+                dependency for dependency in self.dependency_graph[model]
+                if dependency is not model and dependency in levels and levels[dependency] < levels[model]
+            }
+            for model in targets
+        }
+        completed: Set[Model] = set()
+        running = {}
+
+        # fork 전에 부모 프로세스의 연결을 닫아 워커가 소켓을 공유하지 않도록 함
+        connections.close_all()
+        sys.stdout.flush()
+
+        context = multiprocessing.get_context('fork')
+        worker_counter = context.Value('i', 0)
+
+        with ProcessPoolExecutor(max_workers=self.workers,
+                                 mp_context=context,
+                                 initializer=_init_migration_worker,
+                                 initargs=(self, worker_counter)) as executor:
+            try:
+                while pending or running:
+                    ready = sorted(
+                        (model for model, dependencies in pending.items() if dependencies <= completed),
+                        key=lambda m: levels[m]
+                    )
+                    for model in ready:
+                        del pending[model]
+                        future = executor.submit(_migrate_model_in_worker, model._meta.label)
+                        running[future] = model
+
+                    if not running:
+                        raise RuntimeError(
+                            f"Unresolvable dependencies for: {', '.join(m._meta.label for m in pending)}")
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        model = running.pop(future)
+                        self.results.extend(self.collect_worker_result(future))
+                        completed.add(model)
+                        print(f"Committed {model._meta.label} ({len(completed)}/{len(targets)} models)")
+            except Exception:
+                # 실패 시 대기 중인 모델은 시작하지 않고 실행 중인 모델만 마무리
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+
+    def collect_worker_result(self, future) -> list:
+        """워커 결과 목록을 반환하고 워커에서 모아 둔 텔레메트리 이벤트를 싱크로 전달 (실패한 워커 포함)"""
+        try:
+            results, events = future.result()
+        except Exception as e:
+            self.telemetry.replay(getattr(e, 'telemetry_events', []))
+            raise
+        self.telemetry.replay(events)
+        return results
+
+    def migrate_model_data(self, model, pk_range: tuple = None, shard: int = None):
+        """일반 모델의 데이터를 PK 키셋 청크 단위로 마이그레이션 (청크마다 커밋 및 체크포인트 저장)"""
         start_time = time.time()
-        total_count = 0
-        batch_count = 0
+
+        heavy_fields = self.get_heavy_fields(model)
+        queryset = self.get_optimized_queryset(model)
+        if heavy_fields:
+            print(f"Deferring heavy fields: {', '.join(heavy_fields)}")
+            queryset = queryset.defer(*heavy_fields)
+        if pk_range:
+            queryset = queryset.filter(pk__gte=pk_range[0], pk__lt=pk_range[1])
 
         print(f"Estimating record count for {model._meta.label}...")
-        estimated_count = model.objects.using('old_db').count()
+        estimated_count = self.estimate_count(model, queryset, shard)
         print(f"Found approximately {estimated_count} records to migrate")
 
+        last_pk = self.checkpoint.get_last_pk(model, shard) if self.checkpoint else None
+        if last_pk is not None:
+            print(f"Resuming {model._meta.label} after pk {last_pk}")
+
+        sizer = self.create_batch_sizer(model, self.batch_size)
+
+        def read_batches():
+            chunk_last_pk = last_pk
+            while True:
+                chunk = queryset.order_by('pk')
+                if chunk_last_pk is not None:
+                    chunk = chunk.filter(pk__gt=chunk_last_pk)
+                instances = list(chunk[:sizer.size])
+                if not instances:
+                    return
+                chunk_last_pk = instances[-1].pk
+                yield chunk_last_pk, self.build_new_instances(model, instances, heavy_fields)
+
+        def write_batch(new_instances):
+            model.objects.using('new_db').bulk_create(
+                new_instances,
+                ignore_conflicts=True
+            )
+
         try:
             self.disable_foreign_key_checks('new_db')
 
-            with transaction.atomic(using='new_db'):
-                queryset = self.get_optimized_queryset(model)
-                new_instances = []
-                last_progress = 0
-
-                for instance in queryset:
-                    new_instance = model()
-                    for field in model._meta.fields:
-                        if hasattr(instance, field.name):
-                            setattr(new_instance, field.name, getattr(instance, field.name))
-                    new_instances.append(new_instance)
-
-                    if len(new_instances) >= self.batch_size:
-                        actual_batch_size = min(
-                            self.batch_size * 2 if len(model._meta.fields) > 10 else self.batch_size,
-                            5000
-                        )
-
-                        model.objects.using('new_db').bulk_create(
-                            new_instances,
-                            batch_size=actual_batch_size,
-                            ignore_conflicts=True
-                        )
-                        total_count += len(new_instances)
-                        batch_count += 1
-
-                        progress = (total_count / estimated_count * 100)
-                        if progress - last_progress >= 5:
-                            print(
-                                f"Batch {batch_count} completed: {total_count}/{estimated_count} records migrated ({progress:.1f}%)")
-                            last_progress = progress
-
-                        new_instances = []
-
-                if new_instances:
-                    model.objects.using('new_db').bulk_create(
-                        new_instances,
-                        ignore_conflicts=True
-                    )
-                    total_count += len(new_instances)
-
-                if self.is_auto_field(model._meta.pk):
-                    self.prepare_auto_increment(model, 'new_db')
+            progress = self.load_batches(model, read_batches(), write_batch, estimated_count, shard, sizer)
 
             self.enable_foreign_key_checks('new_db')
 
@@ -148,82 +2138,259 @@ class DatabaseMigrator:
             raise
 
         end_time = time.time()
-        duration = end_time - start_time
-        print(f"Completed migrating {model._meta.label}")
-        print(f"Total records: {total_count}")
-        print(f"Time taken: {duration:.2f} seconds")
-        print(f"Average speed: {total_count / duration:.2f} records/second")
-        print("-" * 50)
+        self.report_model_result(model, 'orm', progress.total_count, end_time - start_time, shard, progress.metrics)
+
+    def create_batch_sizer(self, model, initial: int, use_history=True) -> AdaptiveBatchSizer:
+        """모델용 배치 크기 조정기 (이전 실행의 최종 배치 크기가 있으면 그 값에서 시작)"""
+        if use_history and self.adaptive_batches and self.throughput and self.throughput.get_batch_size(model):
+            initial = self.throughput.get_batch_size(model)
+
+        # 파이프라인은 큐에 쌓인 배치와 처리 중인 배치가 동시에 메모리에 있음
+        batches_in_memory = self.pipeline_depth + self.pipeline_writers + 1 if self.pipeline_depth else 1
+        return AdaptiveBatchSizer(
+            initial,
+            adaptive=self.adaptive_batches,
+            memory_budget=self.batch_memory_budget // batches_in_memory,
+            target_seconds=self.target_batch_seconds,
+        )
+
+    def report_batch_sizes(self, label: str, sizer: AdaptiveBatchSizer):
+        if not sizer.adaptive:
+            return
+        summary = sizer.summary()
+        print(f"Batch size for {label}: initial {summary['batch_size_initial']}, "
+              f"final {summary['batch_size_final']} (range {summary['batch_size_min']}-{summary['batch_size_max']}, "
+              f"~{summary['bytes_per_row']:.0f} bytes/row, ~{summary['seconds_per_row'] * 1000:.3f} ms/row)")
+
+    def load_batches(self, model, batches: Iterator[tuple], write_batch: Callable, estimated_count: int,
+                     shard: int = None, sizer: AdaptiveBatchSizer = None) -> BatchProgress:
+        """(마지막 PK, 배치) 를 읽어 배치마다 new_db 트랜잭션으로 쓰고 진행률/체크포인트 갱신
+
+        pipeline_depth 가 있으면 읽기 스레드와 쓰기 스레드를 크기가 제한된 큐로 연결해 동시에 실행한다.
+        """
+        progress = BatchProgress(self, model, estimated_count, shard)
+        try:
+            if self.pipeline_depth:
+                self.load_batches_pipelined(progress, batches, write_batch, sizer)
+            else:
+                sequence = 0
+                while True:
+                    read_start = time.time()
+                    item = next(batches, None)
+                    read_seconds = time.time() - read_start
+                    progress.metrics['read_seconds'] += read_seconds
+                    if item is None:
+                        break
+
+                    last_pk, batch = item
+                    write_start = time.time()
+                    with transaction.atomic(using='new_db'):
+                        write_batch(batch)
+                    write_seconds = time.time() - write_start
+                    progress.metrics['write_seconds'] += write_seconds
+                    if sizer:
+                        sizer.observe(batch, write_seconds)
+                    progress.committed(sequence, last_pk, len(batch))
+                    self.emit_batch_done(progress, batch, read_seconds, write_seconds)
+                    sequence += 1
+        except Exception:
+            if progress.last_pk is not None:
+                print(f"Last committed pk for {model._meta.label}: {progress.last_pk}")
+            raise
 
-    def migrate_profile_data(self, model):
-        """Profile 전용 마이그레이션 로직"""
+        if sizer:
+            progress.metrics.update(sizer.summary())
+            self.report_batch_sizes(progress.label, sizer)
+        return progress
+
+    def emit_batch_done(self, progress: BatchProgress, batch, read_seconds: float, write_seconds: float):
+        if self.telemetry.sinks:
+            self.telemetry.emit('batch_done', model=progress.label, rows=len(batch),
+                                bytes=AdaptiveBatchSizer.estimate_batch_bytes(batch),
+                                read_seconds=read_seconds, write_seconds=write_seconds)
+
+    def load_batches_pipelined(self, progress: BatchProgress, batches: Iterator[tuple], write_batch: Callable,
+                               sizer: AdaptiveBatchSizer = None):
+        """읽기 스레드 하나와 쓰기 스레드 여러 개를 크기 제한 큐로 연결 (큐 크기가 메모리 사용량 상한)"""
+        batch_queue = queue.Queue(maxsize=self.pipeline_depth)
+        reader_done = threading.Event()
+        stop = threading.Event()
+        errors = []
+        metrics_lock = threading.Lock()
+
+        def add_metric(name, seconds):
+            with metrics_lock:
+                progress.metrics[name] += seconds
+
+        def reader():
+            try:
+                sequence = 0
+                while not stop.is_set():
+                    read_start = time.time()
+                    item = next(batches, None)
+                    read_seconds = time.time() - read_start
+                    add_metric('read_seconds', read_seconds)
+                    if item is None:
+                        break
+
+                    # 큐가 가득 차 기다린 시간 = 쓰기 쪽이 병목
+                    put_start = time.time()
+                    while not stop.is_set():
+                        try:
+                            batch_queue.put((sequence, *item, read_seconds), timeout=0.5)
+                            break
+                        except queue.Full:
+                            continue
+                    add_metric('reader_blocked_seconds', time.time() - put_start)
+                    sequence += 1
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                reader_done.set()
+                connections['old_db'].close()
+
+        def writer():
+            try:
+                self.disable_foreign_key_checks('new_db')
+                while not stop.is_set():
+                    # 큐가 비어 기다린 시간 = 읽기 쪽이 병목
+                    get_start = time.time()
+                    try:
+                        sequence, last_pk, batch, read_seconds = batch_queue.get(timeout=0.5)
+                    except queue.Empty:
+                        add_metric('writer_idle_seconds', time.time() - get_start)
+                        if reader_done.is_set() and batch_queue.empty():
+                            break
+                        continue
+                    add_metric('writer_idle_seconds', time.time() - get_start)
+
+                    write_start = time.time()
+                    with transaction.atomic(using='new_db'):
+                        write_batch(batch)
+                    write_seconds = time.time() - write_start
+                    add_metric('write_seconds', write_seconds)
+                    if sizer:
+                        sizer.observe(batch, write_seconds)
+                    progress.committed(sequence, last_pk, len(batch))
+                    self.emit_batch_done(progress, batch, read_seconds, write_seconds)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                try:
+                    self.enable_foreign_key_checks('new_db')
+                except Exception as e:
+                    # 연결이 끊겨 쓰기가 실패한 경우 이 오류가 원래 오류를 가리지 않도록 기록만 함
+                    print(f"Error re-enabling foreign key checks in {threading.current_thread().name}: {str(e)}")
+                finally:
+                    connections['new_db'].close()
+
+        threads = [threading.Thread(target=reader, name='migrate-reader')]
+        threads += [threading.Thread(target=writer, name=f'migrate-writer-{i}') for i in range(self.pipeline_writers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics = progress.metrics
+        metrics['writers'] = self.pipeline_writers
+        metrics['queue_depth'] = self.pipeline_depth
+        # 읽기가 큐에 넣으려고 기다린 시간이 쓰기 스레드 평균 대기 시간보다 길면 쓰기(new_db)가 병목
+        writer_idle = metrics['writer_idle_seconds'] / self.pipeline_writers
+        metrics['bottleneck'] = 'new_db (writer)' if metrics['reader_blocked_seconds'] > writer_idle \
+            else 'old_db (reader)'
+        print(f"Pipeline {progress.label}: read {metrics['read_seconds']:.2f}s, write {metrics['write_seconds']:.2f}s, "
+              f"reader blocked {metrics['reader_blocked_seconds']:.2f}s, writers idle {writer_idle:.2f}s "
+              f"-> bottleneck: {metrics['bottleneck']}")
+
+        if errors:
+            raise errors[0]
+
+    def build_new_instances(self, model, instances, skip_fields: List[str] = ()) -> List[Model]:
+        """old_db 인스턴스의 필드 값을 복사한 new_db 저장용 인스턴스 목록 (지연 필드는 기본값 유지)"""
+        new_instances = []
+        fields = [field for field in model._meta.fields if field.name not in skip_fields]
+        for instance in instances:
+            new_instance = model()
+            for field in fields:
+                if hasattr(instance, field.name):
+                    setattr(new_instance, field.name, getattr(instance, field.name))
+            new_instances.append(new_instance)
+        return new_instances
+
+    def get_timestamp_fields(self, model) -> List[str]:
+        """변경분 조회에 사용할 created/modified 필드 이름"""
+        field_names = {field.name for field in model._meta.concrete_fields}
+        return [name for name in ('created', 'modified') if name in field_names]
+
+    def migrate_model_delta(self, model):
+        """워터마크 이후 생성/수정된 행만 new_db 에 upsert
+
+        created/modified 가 없는 정수 PK 모델은 new_db 최대 PK 이후 행만 추가한다.
+        old_db 에서 삭제된 행은 반영하지 않는다.
+        """
         start_time = time.time()
         total_count = 0
-        batch_count = 0
 
-        print(f"Estimating record count for {model._meta.label}...")
-        estimated_count = model.objects.using('old_db').count()
-        print(f"Found approximately {estimated_count} records to migrate")
+        mark = self.delta_marks.get(model)
+        if mark is None:
+            print(f"No high-water mark for {model._meta.label}, run a full migration first")
+            return
+
+        queryset = self.get_optimized_queryset(model)
+        timestamp_fields = self.get_timestamp_fields(model)
+        upsert = bool(timestamp_fields)
+
+        if timestamp_fields:
+            since = mark - self.delta_overlap
+            condition = Q()
+            for name in timestamp_fields:
+                condition |= Q(**{f"{name}__gt": since})
+            queryset = queryset.filter(condition)
+            print(f"Copying {model._meta.label} rows with {'/'.join(timestamp_fields)} after {since.isoformat()}")
+        elif self.is_auto_field(model._meta.pk):
+            max_pk = model._base_manager.using('new_db').aggregate(max_pk=Max('pk'))['max_pk']
+            if max_pk is not None:
+                queryset = queryset.filter(pk__gt=max_pk)
+            print(f"Appending {model._meta.label} rows after pk {max_pk}")
+        else:
+            print(f"Skipping delta for {model._meta.label} (no timestamp fields or auto primary key)")
+            return
+
+        connection = connections['new_db']
+        update_options = {}
+        if upsert:
+            update_options = {
+                'update_conflicts': True,
+                'update_fields': [field.name for field in model._meta.concrete_fields if not field.primary_key],
+            }
+            if connection.features.supports_update_conflicts_with_target:
+                update_options['unique_fields'] = [model._meta.pk.name]
+        else:
+            update_options = {'ignore_conflicts': True}
 
         try:
             self.disable_foreign_key_checks('new_db')
 
-            # 1. 기본 정보 마이그레이션 (이미지 필드 제외)
-            with transaction.atomic(using='new_db'):
-                basic_fields = [
-                    'id', 'user_id', 'phone', 'address', 'phone_verified',
-                    'phone_verified_status', 'document_verified', 'allow_order',
-                    'total_order_count', 'first_purchased', 'last_purchased',
-                    'not_purchased_months', 'repurchased', 'max_price',
-                    'total_list_price', 'total_selling_price', 'average_price',
-                    'mileage', 'memo', 'date_of_birth', 'gender', 'domestic',
-                    'telecom', 'created', 'modified'
-                ]
+            last_pk = None
+            while True:
+                chunk = queryset.order_by('pk')
+                if last_pk is not None:
+                    chunk = chunk.filter(pk__gt=last_pk)
+                instances = list(chunk[:self.batch_size])
+                if not instances:
+                    break
 
-                queryset = (model.objects.using('old_db')
-                            .select_related('user')
-                            .only(*basic_fields)
-                            .iterator(chunk_size=10000))
-
-                new_instances = []
-                last_progress = 0
-
-                for instance in queryset:
-                    new_instance = model()
-                    for field_name in basic_fields:
-                        if hasattr(instance, field_name):
-                            setattr(new_instance, field_name, getattr(instance, field_name))
-                    new_instances.append(new_instance)
-
-                    if len(new_instances) >= 10000:
-                        model.objects.using('new_db').bulk_create(
-                            new_instances,
-                            batch_size=10000,
-                            ignore_conflicts=True
-                        )
-                        total_count += len(new_instances)
-                        batch_count += 1
-
-                        progress = (total_count / estimated_count * 100)
-                        if progress - last_progress >= 5:
-                            print(
-                                f"Batch {batch_count} completed: {total_count}/{estimated_count} records migrated ({progress:.1f}%)")
-                            last_progress = progress
-
-                        new_instances = []
-
-                if new_instances:
+                with transaction.atomic(using='new_db'):
                     model.objects.using('new_db').bulk_create(
-                        new_instances,
-                        ignore_conflicts=True
+                        self.build_new_instances(model, instances),
+                        **update_options
                     )
-                    total_count += len(new_instances)
-
-            # 2. 이미지 필드 별도 마이그레이션
-            self.migrate_profile_images(model)
 
-            if self.is_auto_field(model._meta.pk):
-                self.prepare_auto_increment(model, 'new_db')
+                last_pk = instances[-1].pk
+                total_count += len(instances)
+                print(f"{total_count} changed records applied")
 
             self.enable_foreign_key_checks('new_db')
 
@@ -232,59 +2399,603 @@ class DatabaseMigrator:
             self.enable_foreign_key_checks('new_db')
             raise
 
-        end_time = time.time()
-        duration = end_time - start_time
-        print(f"Completed migrating {model._meta.label}")
-        print(f"Total records: {total_count}")
-        print(f"Time taken: {duration:.2f} seconds")
-        print(f"Average speed: {total_count / duration:.2f} records/second")
-        print("-" * 50)
+        self.report_model_result(model, 'delta', total_count, time.time() - start_time)
 
-    def migrate_profile_images(self, model):
-        """Profile 이미지 필드만 별도로 마이그레이션"""
-        print("Starting image field migration...")
-        image_fields = ['photo_id', 'card']
+    def migrate_heavy_fields(self, model):
+        """지연 적재 컬럼을 (pk, 컬럼...) 청크 단위로 읽어 일괄 UPDATE (메모리는 heavy_batch_size 행으로 제한)"""
+        start_time = time.time()
+        heavy_fields = self.get_heavy_fields(model)
+        print(f"Starting heavy field migration for {model._meta.label}: {', '.join(heavy_fields)}")
 
-        # 이미지가 있는 레코드만 조회
-        queryset = (model.objects.using('old_db')
-                    .exclude(photo_id='', card='')
-                    .only('id', *image_fields))
+        queryset = self.get_source_queryset(model).order_by('pk').values_list('pk', *heavy_fields)
 
-        total_images = queryset.count()
-        if total_images == 0:
-            print("No image fields to migrate")
-            return
+        # full 모드는 좁은 컬럼 단계에서 빈 문자열 기본값으로 채워지므로 문자열 컬럼이 모두 비어 있는 행을 건너뜀
+        # (merge 모드는 원본에서 비운 값을 대상에 반영해야 하므로 모든 행을 갱신)
+        fields = [model._meta.get_field(name) for name in heavy_fields]
+        if self.mode == 'full' and all(field.empty_strings_allowed and not field.null for field in fields):
+            queryset = queryset.exclude(**{name: '' for name in heavy_fields})
 
-        print(f"Found {total_images} records with image fields")
         processed = 0
-        batch_size = 1000
-
-        for instance in queryset.iterator(chunk_size=batch_size):
+        missing_count = 0
+        chunk_count = 0
+        last_pk = None
+        # 지연 컬럼 단계는 좁은 컬럼 단계에서 기록된 배치 크기를 쓰지 않음
+        sizer = self.create_batch_sizer(model, self.heavy_batch_size, use_history=False)
+
+        while True:
+            chunk = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            rows = list(chunk[:sizer.size])
+            if not rows:
+                break
+
+            chunk_count += 1
+            last_pk = rows[-1][0]
             try:
+                write_start = time.time()
                 with transaction.atomic(using='new_db'):
-                    new_instance = model.objects.using('new_db').get(id=instance.id)
-                    updated = False
+                    updated_pks = self.update_fields_in_bulk(model, heavy_fields, rows)
+                sizer.observe(rows, time.time() - write_start)
+            except Exception as e:
+                # 건너뛰면 컬럼이 기본값으로 남은 채 완료로 기록되므로 다른 적재 경로처럼 실패 처리
+                print(f"Error processing heavy fields for {model._meta.label} {rows[0][0]}-{last_pk}: {str(e)}")
+                raise
+
+            missing = [row[0] for row in rows if row[0] not in updated_pks]
+            processed += len(updated_pks)
+            missing_count += len(missing)
+            if missing:
+                print(f"Warning: chunk {chunk_count}: {len(missing)} {model._meta.label} rows not found in new "
+                      f"database: {', '.join(str(pk) for pk in missing)}")
+            if chunk_count % 10 == 0:
+                print(f"Processed {processed} heavy field records")
+
+        if missing_count:
+            print(f"{missing_count} {model._meta.label} rows were missing in new database")
+        self.report_batch_sizes(f"{model._meta.label} heavy fields", sizer)
+        self.report_model_result(model, 'heavy', processed, time.time() - start_time, metrics=sizer.summary())
+
+    def update_fields_in_bulk(self, model, field_names: List[str], rows: List[tuple]) -> Set:
+        """(pk, 값...) 튜플 청크를 한 번의 UPDATE 로 new_db 에 반영하고 갱신된 PK 집합 반환
+
+        PostgreSQL 은 UPDATE ... FROM (VALUES ...) RETURNING 으로, 그 외에는 존재하는 PK 를 조회한 뒤
+        bulk_update 로 값을 그대로 덮어쓴다 (원본에서 비운 값도 대상에서 비워지도록 빈 문자열도 그대로 반영).
+        """
+        connection = connections['new_db']
+        fields = [model._meta.get_field(name) for name in field_names]
+
+        if connection.vendor == 'postgresql':
+            quote_name = connection.ops.quote_name
+            pk_column = quote_name(model._meta.pk.column)
+            columns = [quote_name(field.column) for field in fields]
+            assignments = []
+            for field, column in zip(fields, columns):
+                assignments.append(f"{column} = v.{column}::{field.cast_db_type(connection)}")
+            values = ', '.join([f"({', '.join(['%s'] * (len(columns) + 1))})"] * len(rows))
+            params = []
+            for pk, *row_values in rows:
+                params.append(pk)
+                params += [field.get_db_prep_save(value, connection) for field, value in zip(fields, row_values)]
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {quote_name(model._meta.db_table)} AS t SET {', '.join(assignments)} "
+                    f"FROM (VALUES {values}) AS v({pk_column}, {', '.join(columns)}) "
+                    f"WHERE t.{pk_column} = v.{pk_column} RETURNING t.{pk_column}",
+                    params
+                )
+                return {row[0] for row in cursor.fetchall()}
+
+        existing_pks = set(model._base_manager.using('new_db')
+                           .filter(pk__in=[row[0] for row in rows])
+                           .values_list('pk', flat=True))
+        instances = []
+        for pk, *values in rows:
+            if pk not in existing_pks:
+                continue
+            instance = model(pk=pk)
+            for field, value in zip(fields, values):
+                setattr(instance, field.attname, value)
+            instances.append(instance)
+        model._base_manager.using('new_db').bulk_update(instances, field_names)
+        return existing_pks
+
+    def rebuild_tree(self, model):
+        """new_db 의 MPTT 트리 값(lft/rght/tree_id/level)을 한 번의 선형 순회로 다시 계산해 일괄 UPDATE
+
+        (pk, parent_id) 를 형제 정렬 순서(order_insertion_by, pk)대로 한 번에 읽어 계산하므로
+        노드마다 쿼리를 실행하는 TreeManager.rebuild() 를 대신한다. 값이 바뀐 행만 갱신한다.
+        """
+        start_time = time.time()
+        opts = model._mptt_meta
+        tree_fields = [opts.left_attr, opts.right_attr, opts.tree_id_attr, opts.level_attr]
+        parent_attname = model._meta.get_field(opts.parent_attr).attname
+
+        rows = list(model._base_manager.using('new_db')
+                    .order_by(*opts.order_insertion_by, 'pk')
+                    .values_list('pk', parent_attname, *tree_fields))
+        compute_start = time.time()
+        tree_values = self.compute_nested_sets([(pk, parent_pk) for pk, parent_pk, *_ in rows])
+        compute_seconds = time.time() - compute_start
+
+        if len(tree_values) < len(rows):
+            print(f"Warning: {len(rows) - len(tree_values)} {model._meta.label} rows are in parent cycles "
+                  f"and were left unchanged")
+
+        changed = [(pk, *tree_values[pk]) for pk, _, *current in rows
+                   if pk in tree_values and tuple(current) != tree_values[pk]]
+        rows_per_statement = self.MAX_INSERT_PARAMS // (len(tree_fields) + 1)
+        with transaction.atomic(using='new_db'):
+            for offset in range(0, len(changed), rows_per_statement):
+                self.update_fields_in_bulk(model, tree_fields, changed[offset:offset + rows_per_statement])
+
+        duration = time.time() - start_time
+        print(f"Rebuilt {model._meta.label} tree: {len(rows)} nodes, {len(changed)} changed "
+              f"(computed in {compute_seconds:.3f}s, total {duration:.2f}s)")
+        self.report_model_result(model, 'tree', len(rows), duration,
+                                 metrics={'changed': len(changed), 'compute_seconds': compute_seconds})
+
+    @staticmethod
+    def compute_nested_sets(nodes: List[tuple]) -> Dict:
+        """형제 순서대로 정렬된 (pk, parent_pk) 목록에서 pk -> (lft, rght, tree_id, level) 계산
+
+        부모가 없거나 목록에 없는 노드는 루트가 되고, 루트 순서대로 tree_id 를 부여한다.
+        루트에서 도달할 수 없는(부모 순환에 속한) 노드는 결과에 포함되지 않는다.
+        """
+        children = defaultdict(list)
+        roots = []
+        pks = {pk for pk, _ in nodes}
+        for pk, parent_pk in nodes:
+            if parent_pk is None or parent_pk not in pks:
+                roots.append(pk)
+            else:
+                children[parent_pk].append(pk)
+
+        values = {}
+        for tree_id, root in enumerate(roots, 1):
+            counter = 1
+            lefts = {root: counter}
+            # 재귀 대신 (노드, 레벨, 남은 자식 반복자) 스택으로 깊이 우선 순회
+            stack = [(root, 0, iter(children.get(root, ())))]
+            while stack:
+                pk, level, remaining = stack[-1]
+                child = next(remaining, None)
+                counter += 1
+                if child is None:
+                    values[pk] = (lefts.pop(pk), counter, tree_id, level)
+                    stack.pop()
+                else:
+                    lefts[child] = counter
+                    stack.append((child, level + 1, iter(children.get(child, ()))))
+        return values
+
+    def migrate_model_copy(self, model):
+        """COPY / LOAD DATA 로 Django 객체 생성 없이 행을 그대로 전송
+
+        PostgreSQL 간에는 COPY TO STDOUT / COPY FROM STDIN 을 파이프로 연결해 스트리밍하고,
+        그 외에는 old_db 행 튜플을 텍스트 포맷으로 변환해 COPY FROM STDIN(PostgreSQL) 또는
+        LOAD DATA LOCAL INFILE(MySQL, OPTIONS 에 local_infile 필요)로 적재한다.
+        COPY 는 충돌 무시를 지원하지 않으므로 new_db 테이블이 비어 있어야 한다.
+        """
+        start_time = time.time()
+        source_vendor = connections['old_db'].vendor
+        target_vendor = connections['new_db'].vendor
+        columns = [field.column for field in model._meta.concrete_fields]
 
-                    for field in image_fields:
-                        if getattr(instance, field):
-                            setattr(new_instance, field, getattr(instance, field))
-                            updated = True
+        try:
+            self.disable_foreign_key_checks('new_db')
 
-                    if updated:
-                        new_instance.save(update_fields=image_fields)
-                        processed += 1
+            with transaction.atomic(using='new_db'):
+                if source_vendor == 'postgresql' and target_vendor == 'postgresql':
+                    copy_format = self.get_copy_format(model, columns)
+                    print(f"Streaming {model._meta.label} with COPY ({copy_format})")
+                    total_count = self.copy_postgresql_stream(model, columns, copy_format)
+                elif target_vendor == 'postgresql':
+                    print(f"Loading {model._meta.label} with COPY FROM STDIN")
+                    total_count = self.copy_rows_postgresql(model, columns)
+                elif target_vendor == 'mysql':
+                    print(f"Loading {model._meta.label} with LOAD DATA LOCAL INFILE")
+                    total_count = self.copy_rows_mysql(model, columns)
+                else:
+                    raise NotImplementedError(f"COPY engine does not support {target_vendor} target")
 
-                        if processed % batch_size == 0:
-                            print(f"Processed {processed}/{total_images} image records")
+            self.enable_foreign_key_checks('new_db')
 
-            except model.DoesNotExist:
-                print(f"Warning: Profile {instance.id} not found in new database")
-                continue
+        except Exception as e:
+            print(f"Error migrating {model._meta.label}: {str(e)}")
+            self.enable_foreign_key_checks('new_db')
+            raise
+
+        self.report_model_result(model, 'copy', total_count, time.time() - start_time)
+
+    def migrate_model_stream(self, model, pk_range: tuple = None, shard: int = None):
+        """Django 객체 없이 서버 사이드 커서의 행 튜플을 다중 행 INSERT 로 전송 (청크마다 커밋 및 체크포인트 저장)"""
+        start_time = time.time()
+
+        merge_keys = self.get_merge_keys(model) if self.mode == 'merge' else None
+        plan = ColumnPlan(model, 'old_db', 'new_db', self.get_heavy_fields(model), merge_keys)
+        merge_counts = defaultdict(int)
+        merge_lock = threading.Lock()
+
+        queryset = self.get_source_queryset(model)
+        filter_sql, params = self.get_row_filter_sql(model)
+        conditions = [filter_sql] if filter_sql else []
+        if pk_range:
+            queryset = queryset.filter(pk__gte=pk_range[0], pk__lt=pk_range[1])
+            conditions += [f"{plan.pk_column} >= %s", f"{plan.pk_column} < %s"]
+            params += list(pk_range)
+
+        print(f"Estimating record count for {model._meta.label}...")
+        estimated_count = self.estimate_count(model, queryset, shard)
+        print(f"Found approximately {estimated_count} records to migrate")
+
+        last_pk = self.checkpoint.get_last_pk(model, shard) if self.checkpoint else None
+        if last_pk is not None:
+            print(f"Resuming {model._meta.label} after pk {last_pk}")
+            conditions.append(f"{plan.pk_column} > %s")
+            params.append(last_pk)
+
+        sql = plan.select_sql
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        sql += f" ORDER BY {plan.pk_column}"
+
+        sizer = self.create_batch_sizer(model, self.batch_size)
+
+        def read_batches():
+            for rows in self.iter_source_rows(model, plan.columns, lambda: sizer.size, sql, params):
+                yield rows[-1][plan.pk_index], plan.convert(rows)
+
+        def write_batch(rows):
+            self.insert_rows(plan, rows, merge_counts, merge_lock)
+
+        try:
+            self.disable_foreign_key_checks('new_db')
+
+            progress = self.load_batches(model, read_batches(), write_batch, estimated_count, shard, sizer)
+
+            self.enable_foreign_key_checks('new_db')
+
+        except Exception as e:
+            print(f"Error migrating {model._meta.label}: {str(e)}")
+            self.enable_foreign_key_checks('new_db')
+            raise
+
+        if merge_keys is not None:
+            self.report_merge_counts(model, progress, merge_counts)
+        self.report_model_result(model, 'stream', progress.total_count, time.time() - start_time, shard,
+                                 progress.metrics)
+
+    def insert_rows(self, plan: ColumnPlan, rows: List[list], merge_counts: Dict[str, int], lock):
+        """변환된 행을 다중 행 INSERT 로 new_db 에 기록 (merge 모드면 삽입/갱신/변경 없음 행 수를 누적)"""
+        rows_per_statement = max(1, self.MAX_INSERT_PARAMS // len(plan.insert_columns))
+        with connections['new_db'].cursor() as cursor:
+            for offset in range(0, len(rows), rows_per_statement):
+                chunk = rows[offset:offset + rows_per_statement]
+                if plan.merge_columns is None:
+                    cursor.execute(plan.insert_sql(len(chunk)), [value for row in chunk for value in row])
+                    continue
+                counts = self.merge_rows(cursor, plan, chunk)
+                with lock:
+                    for name, count in zip(('inserted', 'updated', 'unchanged', 'skipped'), counts):
+                        merge_counts[name] += count
+
+    def report_merge_counts(self, model, progress: BatchProgress, merge_counts: Dict[str, int]):
+        """merge 결과 행 수 기록
+
+        변경 여부는 이 단계에서 쓴 좁은 컬럼만 비교하므로, 지연 컬럼 단계에서 갱신되는 모델은 변경 없음 행 수를
+        unchanged 대신 light_unchanged 로만 기록한다 (지연 컬럼만 바뀐 행도 변경 없음으로 계산되기 때문).
+        """
+        counts = dict(merge_counts)
+        if counts.get('skipped'):
+            print(f"Warning: skipped {counts['skipped']} {model._meta.label} rows whose merge key belongs to "
+                  f"another primary key in new database")
+        if self.get_heavy_fields(model):
+            counts['light_unchanged'] = counts.pop('unchanged', 0)
+            print(f"Merged {model._meta.label}: {counts['inserted']} inserted, {counts['updated']} updated, "
+                  f"{counts['light_unchanged']} unchanged in non-heavy columns (heavy fields not compared)")
+        else:
+            print(f"Merged {model._meta.label}: {counts['inserted']} inserted, "
+                  f"{counts['updated']} updated, {counts['unchanged']} unchanged")
+        progress.metrics.update(counts)
+
+    def export_model_spool(self, model):
+        """old_db 행을 파이썬 값으로 변환해 스풀 파일로 내보냄 (new_db 는 사용하지 않음)"""
+        start_time = time.time()
+        exported_at = self.snapshot_time or timezone.now()
+        plan = ColumnPlan(model, 'old_db', None)
+        filter_sql, params = self.get_row_filter_sql(model)
+        sql = plan.select_sql
+        if filter_sql:
+            sql += f" WHERE {filter_sql}"
+        sql += f" ORDER BY {plan.pk_column}"
+        print(f"Exporting {model._meta.label} to {self.spool.get_path(model, 'parquet')}")
+
+        chunks = (plan.convert(rows)
+                  for rows in self.iter_source_rows(model, plan.columns, self.batch_size, sql, params))
+        manifest = self.spool.write_model(model, plan.fields, chunks, exported_at)
+
+        file_size = os.path.getsize(self.spool.get_path(model, 'parquet'))
+        print(f"Exported {manifest['rows']} records in {len(manifest['chunks'])} chunks "
+              f"({file_size / 1024 / 1024:.1f} MB)")
+        self.report_model_result(model, 'export', manifest['rows'], time.time() - start_time,
+                                 metrics={'chunks': len(manifest['chunks']), 'bytes': file_size})
+
+    def import_model_spool(self, model):
+        """스풀 파일의 row group 을 청크로 new_db 에 적재 (old_db 는 사용하지 않음, 청크마다 커밋 및 체크포인트 저장)"""
+        start_time = time.time()
+        merge_keys = self.get_merge_keys(model) if self.mode == 'merge' else None
+        plan = ColumnPlan(model, None, 'new_db', merge_keys=merge_keys)
+        merge_counts = defaultdict(int)
+        merge_lock = threading.Lock()
+
+        manifest = self.spool.load_manifest(model)
+        print(f"Importing {manifest['rows']} {model._meta.label} records from {manifest['file']}")
+
+        last_pk = self.checkpoint.get_last_pk(model) if self.checkpoint else None
+        if last_pk is not None:
+            print(f"Resuming {model._meta.label} after pk {last_pk}")
+
+        def read_batches():
+            for chunk_last_pk, rows in self.spool.read_model(model, plan.fields, last_pk):
+                yield chunk_last_pk, plan.convert(rows)
+
+        def write_batch(rows):
+            self.insert_rows(plan, rows, merge_counts, merge_lock)
+
+        try:
+            self.disable_foreign_key_checks('new_db')
+
+            progress = self.load_batches(model, read_batches(), write_batch, manifest['rows'])
+
+            self.enable_foreign_key_checks('new_db')
+
+        except Exception as e:
+            print(f"Error migrating {model._meta.label}: {str(e)}")
+            self.enable_foreign_key_checks('new_db')
+            raise
+
+        if merge_keys is not None:
+            self.report_merge_counts(model, progress, merge_counts)
+        self.report_model_result(model, 'import', progress.total_count, time.time() - start_time,
+                                 metrics=progress.metrics)
+
+    def merge_rows(self, cursor, plan: ColumnPlan, rows: List[list]) -> tuple:
+        """행 청크를 new_db 에 PK 기준으로 upsert 하고 (삽입, 갱신, 변경 없음, 건너뜀) 행 수 반환
+
+        PostgreSQL 은 RETURNING 으로 삽입/갱신된 행만 돌려받는다. MySQL 은 Django 가 CLIENT.FOUND_ROWS 로
+        연결하므로 영향 받은 행 수가 삽입 1, 변경 없음 1, 갱신 2 로 계산되어, 먼저 기존 키 수를 조회해 구분한다.
+
+        merge_keys 유니크 키를 new_db 에서 다른 PK 의 행이 쓰고 있으면(원본에서 삭제된 행의 키를 새 행이 쓰거나
+        두 행이 키를 맞바꾼 경우) upsert 가 유니크 제약 위반으로 모델 전체를 중단시키므로 해당 행은 건너뛰고
+        건너뜀으로 집계한다. 이런 행은 대상의 오래된 행을 정리한 뒤 다시 실행해야 반영된다. merge_keys 로 지정하지
+        않은 다른 유니크 제약의 충돌은 확인하지 않으며, MySQL 의 ON DUPLICATE KEY 는 PK 외의 유니크 키로도 충돌한다.
+        """
+        connection = connections['new_db']
+        collisions = self.find_key_collisions(cursor, plan, rows) if plan.key_columns else set()
+        if collisions:
+            print(f"Warning: {plan.model._meta.label} merge keys already used by other rows in new database, "
+                  f"skipping pk {', '.join(str(pk) for pk in sorted(collisions, key=str)[:20])}")
+            rows = [row for row in rows if row[plan.pk_index] not in collisions]
+            if not rows:
+                return 0, 0, 0, len(collisions)
+
+        params = [value for row in rows for value in row]
+        if connection.vendor == 'postgresql':
+            cursor.execute(plan.insert_sql(len(rows)), params)
+            flags = [inserted for inserted, in cursor.fetchall()]
+            inserted = sum(1 for flag in flags if flag)
+            return inserted, len(flags) - inserted, len(rows) - len(flags), len(collisions)
+
+        key_indexes = [plan.insert_columns.index(column) for column in plan.merge_columns]
+        key_list = ', '.join(connection.ops.quote_name(column) for column in plan.merge_columns)
+        key_placeholder = f"({', '.join(['%s'] * len(key_indexes))})"
+        cursor.execute(
+            f"SELECT COUNT(*) FROM {connection.ops.quote_name(plan.model._meta.db_table)} "
+            f"WHERE ({key_list}) IN ({', '.join([key_placeholder] * len(rows))})",
+            [row[index] for row in rows for index in key_indexes]
+        )
+        existing = cursor.fetchone()[0]
+
+        cursor.execute(plan.insert_sql(len(rows)), params)
+        if connection.vendor == 'mysql' and plan.insert_suffix:
+            updated = max(0, cursor.rowcount - len(rows))
+        else:
+            # 변경 여부를 알 수 없는 벤더는 기존 행을 모두 갱신된 것으로 계산
+            updated = existing if plan.insert_suffix else 0
+        return len(rows) - existing, updated, existing - updated, len(collisions)
+
+    def find_key_collisions(self, cursor, plan: ColumnPlan, rows: List[list]) -> Set:
+        """merge_keys 값이 new_db 에서 다른 PK 의 행에 이미 쓰이고 있는 행의 PK 집합"""
+        quote_name = connections['new_db'].ops.quote_name
+        key_indexes = [plan.insert_columns.index(column) for column in plan.key_columns]
+        key_list = ', '.join(quote_name(column) for column in plan.key_columns)
+        key_placeholder = f"({', '.join(['%s'] * len(key_indexes))})"
+        cursor.execute(
+            f"SELECT {quote_name(plan.model._meta.pk.column)}, {key_list} "
+            f"FROM {quote_name(plan.model._meta.db_table)} "
+            f"WHERE ({key_list}) IN ({', '.join([key_placeholder] * len(rows))})",
+            [row[index] for row in rows for index in key_indexes]
+        )
+        owners = {tuple(key): pk for pk, *key in cursor.fetchall()}
+        collisions = set()
+        for row in rows:
+            pk = row[plan.pk_index]
+            if owners.get(tuple(row[index] for index in key_indexes), pk) != pk:
+                collisions.add(pk)
+        return collisions
+
+    def get_copy_format(self, model, columns: List[str]) -> str:
+        """PostgreSQL 간 COPY 포맷 결정
+
+        바이너리 포맷은 타입별 내부 표현을 그대로 전송하므로 양쪽 컬럼 타입(atttypid, atttypmod)이 모두 같을 때만
+        사용한다. 레거시 integer PK/FK 를 BigAutoField(bigint) 로 받는 경우처럼 하나라도 다르면
+        "incorrect binary data format" 오류가 나므로 해당 모델은 텍스트 포맷으로 전송한다.
+        """
+        if not self.copy_binary:
+            return 'text'
+
+        table = model._meta.db_table
+        old_types = self.get_schema('old_db').get_column_types(table)
+        new_types = self.get_schema('new_db').get_column_types(table)
+        mismatched = [column for column in columns
+                      if column not in old_types or old_types.get(column) != new_types.get(column)]
+        if mismatched:
+            print(f"Column types differ for {model._meta.label} ({', '.join(mismatched)}), "
+                  f"falling back to text COPY")
+            return 'text'
+        return 'binary'
+
+    def copy_postgresql_stream(self, model, columns: List[str], copy_format: str) -> int:
+        """old_db COPY TO STDOUT 출력을 파이프로 new_db COPY FROM STDIN 에 바로 연결"""
+        table = connections['new_db'].ops.quote_name(model._meta.db_table)
+        column_list = ', '.join(connections['new_db'].ops.quote_name(column) for column in columns)
+        read_fd, write_fd = os.pipe()
+        export_errors = []
+
+        filter_sql, filter_params = self.get_row_filter_sql(model)
+
+        def export():
+            # 스레드별로 별도의 old_db 연결이 생성됨
+            try:
+                with os.fdopen(write_fd, 'wb') as writer, connections['old_db'].cursor() as cursor:
+                    source = f"{table} ({column_list})"
+                    if filter_sql:
+                        # 행 필터가 있으면 조건을 적용한 쿼리 결과를 내보냄 (COPY 는 파라미터를 받지 않음)
+                        source = cursor.mogrify(
+                            f"(SELECT {column_list} FROM {table} WHERE {filter_sql})", filter_params).decode()
+                    cursor.copy_expert(f"COPY {source} TO STDOUT WITH (FORMAT {copy_format})", writer)
             except Exception as e:
-                print(f"Error processing image fields for profile {instance.id}: {str(e)}")
-                continue
+                export_errors.append(e)
+            finally:
+                connections['old_db'].close()
 
-        print(f"Completed image field migration. Processed {processed} records")
+        exporter = threading.Thread(target=export, daemon=True)
+        exporter.start()
+        try:
+            with os.fdopen(read_fd, 'rb') as reader, connections['new_db'].cursor() as cursor:
+                cursor.copy_expert(f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT {copy_format})", reader)
+                total_count = cursor.rowcount
+        finally:
+            exporter.join()
+
+        if export_errors:
+            raise export_errors[0]
+        return total_count
+
+    def copy_rows_postgresql(self, model, columns: List[str]) -> int:
+        """old_db 행 튜플을 배치별 텍스트 COPY FROM STDIN 으로 new_db 에 적재"""
+        ops = connections['new_db'].ops
+        converters = self.get_copy_converters(model, 'postgresql')
+        sql = (f"COPY {ops.quote_name(model._meta.db_table)} "
+               f"({', '.join(ops.quote_name(column) for column in columns)}) FROM STDIN")
+        total_count = 0
+
+        with connections['new_db'].cursor() as cursor:
+            for rows in self.iter_source_rows(model, columns, self.batch_size):
+                buffer = io.BytesIO(self.encode_copy_rows(rows, converters))
+                cursor.copy_expert(sql, buffer)
+                total_count += len(rows)
+                print(f"{total_count} records copied")
+        return total_count
+
+    def copy_rows_mysql(self, model, columns: List[str]) -> int:
+        """old_db 행 튜플을 임시 파일로 만들어 배치별 LOAD DATA LOCAL INFILE 로 new_db 에 적재"""
+        ops = connections['new_db'].ops
+        converters = self.get_copy_converters(model, 'mysql')
+        total_count = 0
+
+        with connections['new_db'].cursor() as cursor:
+            for rows in self.iter_source_rows(model, columns, self.batch_size):
+                with tempfile.NamedTemporaryFile(suffix='.tsv') as data_file:
+                    data_file.write(self.encode_copy_rows(rows, converters))
+                    data_file.flush()
+                    cursor.execute(
+                        f"LOAD DATA LOCAL INFILE %s IGNORE INTO TABLE {ops.quote_name(model._meta.db_table)} "
+                        f"CHARACTER SET utf8mb4 "
+                        f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' "
+                        f"({', '.join(ops.quote_name(column) for column in columns)})",
+                        [data_file.name]
+                    )
+                total_count += len(rows)
+                print(f"{total_count} records loaded")
+        return total_count
+
+    def iter_source_rows(self, model, columns: List[str], chunk_size, sql: str = None,
+                         params: list = None) -> Iterator[list]:
+        """old_db 에서 서버 사이드 커서로 행 튜플을 청크 단위로 읽음 (chunk_size 는 정수 또는 매번 호출하는 함수)"""
+        connection = connections['old_db']
+        if sql is None:
+            ops = connection.ops
+            sql = (f"SELECT {', '.join(ops.quote_name(column) for column in columns)} "
+                   f"FROM {ops.quote_name(model._meta.db_table)}")
+            filter_sql, params = self.get_row_filter_sql(model)
+            if filter_sql:
+                sql += f" WHERE {filter_sql}"
+
+        with transaction.atomic(using='old_db'):
+            if connection.vendor == 'mysql':
+                from MySQLdb.cursors import SSCursor
+                connection.ensure_connection()
+                cursor = connection.connection.cursor(SSCursor)
+            else:
+                cursor = connection.chunked_cursor()
+
+            try:
+                cursor.execute(sql, params or None)
+                while True:
+                    rows = cursor.fetchmany(chunk_size() if callable(chunk_size) else chunk_size)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                cursor.close()
+
+    def get_copy_converters(self, model, target_vendor: str) -> List[Callable]:
+        """컬럼별 텍스트 변환 함수 목록 (모델당 한 번만 생성)"""
+        converters = []
+        for field in model._meta.concrete_fields:
+            if field.get_internal_type() == 'UUIDField':
+                # MySQL 은 UUID 를 하이픈 없는 char(32)로 저장
+                if target_vendor == 'mysql':
+                    converters.append(lambda value: uuid.UUID(str(value)).hex)
+                else:
+                    converters.append(lambda value: str(uuid.UUID(str(value))))
+            else:
+                converters.append(lambda value: self.encode_copy_value(value, target_vendor))
+        return converters
+
+    def encode_copy_value(self, value, target_vendor: str) -> str:
+        """파이썬 값을 COPY / LOAD DATA 텍스트 포맷 값으로 변환"""
+        if isinstance(value, bool):
+            return '1' if value else '0'
+        if isinstance(value, datetime.datetime):
+            if target_vendor == 'mysql' and value.tzinfo is not None:
+                # MySQL DATETIME 은 타임존 오프셋을 받지 않으므로 UTC 기준 naive 값으로 저장
+                value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            return value.isoformat(sep=' ')
+        if isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False)
+        if isinstance(value, Decimal):
+            return format(value, 'f')
+        return str(value)
+
+    def encode_copy_rows(self, rows, converters: List[Callable]) -> bytes:
+        """행 튜플을 탭 구분 텍스트(NULL 은 \\N)로 인코딩"""
+        lines = []
+        for row in rows:
+            values = []
+            for value, converter in zip(row, converters):
+                if value is None:
+                    values.append('\\N')
+                else:
+                    values.append(converter(value)
+                                  .replace('\\', '\\\\')
+                                  .replace('\t', '\\t')
+                                  .replace('\n', '\\n')
+                                  .replace('\r', '\\r'))
+            lines.append('\t'.join(values))
+        return ('\n'.join(lines) + '\n').encode('utf-8')
 
     def get_app_models(self) -> List[Model]:
         """지정된 앱의 모델만 반환"""
@@ -314,6 +3025,7 @@ class DatabaseMigrator:
     def get_migration_order(self) -> List[Model]:
         """의존성을 고려한 마이그레이션 순서 반환"""
         migration_order = []
+        self.processed_models.clear()
 
         def process_model(model):
             if model in self.processed_models:
@@ -335,23 +3047,68 @@ class DatabaseMigrator:
         """모델의 primary key 필드 이름을 반환"""
         return model._meta.pk.name
 
-    def prepare_auto_increment(self, model, using):
-        """데이터베이스별 AUTO_INCREMENT/시퀀스 값 조정"""
-        table_name = model._meta.db_table
-        pk_name = self.get_primary_key_field(model)
+    def reset_sequences(self, models: List[Model], using='new_db'):
+        """적재한 모든 자동 증가 PK 테이블의 시퀀스/AUTO_INCREMENT 를 최대 PK 이후로 한 번에 조정
 
-        if not self.is_auto_field(model._meta.pk):
+        최대 PK 는 UNION ALL 쿼리 하나로 모으고, 이미 최대 PK 이상인 시퀀스와 빈 테이블은 건너뛴다.
+        PostgreSQL 은 pg_get_serial_sequence 로 실제 시퀀스 이름을 찾아 setval 까지 한 번에 실행하고,
+        MySQL 은 AUTO_INCREMENT 가 뒤처진 테이블에만 ALTER TABLE 을 실행한다.
+        """
+        models = [model for model in models if self.is_auto_field(model._meta.pk)]
+        if not models:
             return
 
-        with connections[using].cursor() as cursor:
-            cursor.execute(f"SELECT MAX({pk_name}) FROM {table_name}")
-            max_id = cursor.fetchone()[0] or 0
+        start_time = time.time()
+        connection = connections[using]
+        quote_name = connection.ops.quote_name
+        max_pk_sql = ' UNION ALL '.join(
+            f"SELECT %s, %s, MAX({quote_name(model._meta.pk.column)}) FROM {quote_name(model._meta.db_table)}"
+            for model in models
+        )
+        params = [value for model in models for value in (model._meta.db_table, model._meta.pk.column)]
+
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(f"""
+                    WITH max_pk (table_name, column_name, max_id) AS ({max_pk_sql}),
+                    sequences AS (
+                        SELECT table_name, max_id,
+                               pg_get_serial_sequence(quote_ident(table_name), column_name) AS sequence_name
+                        FROM max_pk
+                        WHERE max_id IS NOT NULL
+                    )
+                    SELECT table_name,
+                           CASE WHEN max_id > COALESCE(pg_sequence_last_value(sequence_name::regclass), 0)
+                                THEN setval(sequence_name, max_id) END
+                    FROM sequences
+                    WHERE sequence_name IS NOT NULL
+                """, params)
+                reset_tables = [table for table, value in cursor.fetchall() if value is not None]
+            elif connection.vendor == 'mysql':
+                cursor.execute(max_pk_sql, params)
+                max_ids = {table: max_id for table, _, max_id in cursor.fetchall() if max_id is not None}
+                if not max_ids:
+                    return
+
+                # MySQL 8 은 information_schema 통계를 캐시하므로 현재 AUTO_INCREMENT 를 직접 읽도록 설정
+                if not connection.mysql_is_mariadb and connection.mysql_version >= (8,):
+                    cursor.execute("SET SESSION information_schema_stats_expiry = 0")
+                cursor.execute(
+                    f"SELECT TABLE_NAME, AUTO_INCREMENT FROM information_schema.TABLES "
+                    f"WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN ({', '.join(['%s'] * len(max_ids))})",
+                    list(max_ids)
+                )
+                current = dict(cursor.fetchall())
+                reset_tables = [table for table, max_id in max_ids.items() if (current.get(table) or 0) <= max_id]
+                for table in reset_tables:
+                    cursor.execute(f"ALTER TABLE {quote_name(table)} AUTO_INCREMENT = {max_ids[table] + 1}")
+            else:
+                return
 
-            if 'postgresql' in connections[using].vendor:
-                sequence_name = f"{table_name}_{pk_name}_seq"
-                cursor.execute(f"SELECT setval('{sequence_name}', {max_id})")
-            elif 'mysql' in connections[using].vendor:
-                cursor.execute(f"ALTER TABLE {table_name} AUTO_INCREMENT = {max_id + 1}")
+        duration = time.time() - start_time
+        self.telemetry.emit('sequences_reset', seconds=duration, reset=len(reset_tables), total=len(models))
+        print(f"\nReset {len(reset_tables)} of {len(models)} sequences in {duration:.2f}s "
+              f"(others already ahead or empty)")
 
     def disable_foreign_key_checks(self, using):
         """외래키 제약 조건 비활성화"""
@@ -362,10 +3119,11 @@ class DatabaseMigrator:
                 cursor.execute('SET CONSTRAINTS ALL DEFERRED')
 
     def enable_foreign_key_checks(self, using):
-        """외래키 제약 조건 활성화"""
+        """외래키 제약 조건 활성화 (적재 프로파일이 끈 외래키 검사는 프로파일 종료 시 복구)"""
         with connections[using].cursor() as cursor:
             if 'mysql' in connections[using].vendor:
-                cursor.execute('SET FOREIGN_KEY_CHECKS=1')
+                if not (self.load_profile and self.load_profile.manages(connections[using], 'foreign_key_checks')):
+                    cursor.execute('SET FOREIGN_KEY_CHECKS=1')
             elif 'postgresql' in connections[using].vendor:
                 cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
 
@@ -379,7 +3137,7 @@ class DatabaseMigrator:
 
     def get_optimized_queryset(self, model):
         """모델에 맞는 최적화된 쿼리셋 반환"""
-        queryset = model.objects.using('old_db')
+        queryset = self.get_source_queryset(model)
 
         fk_fields = self.get_foreign_key_fields(model)
 
@@ -387,7 +3145,31 @@ class DatabaseMigrator:
             print(f"Applying select_related for fields: {', '.join(fk_fields)}")
             queryset = queryset.select_related(*fk_fields)
 
-        return queryset.iterator(chunk_size=self.batch_size)
+        return queryset
+
+    def get_row_filter(self, model) -> Q:
+        """old_db 에서 옮길 행 조건 (선언되지 않았으면 빈 Q)"""
+        model_identifier = f"{model._meta.app_label}.{model._meta.model_name}"
+        return self.row_filters.get(model_identifier, Q())
+
+    def get_source_queryset(self, model):
+        """행 필터를 적용한 old_db 쿼리셋
+
+        SoftDeletableModel 의 objects 는 삭제 표시된 행을 숨기므로 기본 매니저로 모든 행을 기준으로 하고,
+        삭제 표시된 행을 제외하려면 행 필터에 Q(is_removed=False) 를 선언한다.
+        """
+        return model._base_manager.using('old_db').filter(self.get_row_filter(model))
+
+    def get_row_filter_sql(self, model) -> tuple:
+        """행 필터를 old_db 테이블 컬럼에 대한 WHERE 조건 SQL 과 파라미터로 변환 (필터가 없으면 빈 문자열)"""
+        if not self.get_row_filter(model):
+            return '', []
+
+        query = self.get_source_queryset(model).query
+        if len(query.alias_map) > 1:
+            raise ValueError(f"Row filter for {model._meta.label} must only use columns of its own table")
+        sql, params = query.get_compiler('old_db').compile(query.where)
+        return sql, list(params)
 
     def is_auto_field(self, field):
         """AutoField나 BigAutoField 등 자동 증가 필드인지 확인"""
@@ -395,6 +3177,353 @@ class DatabaseMigrator:
         return isinstance(field, (AutoField, BigAutoField))
 
 
+class MigrationVerifier:
+    """old_db 와 new_db 를 PK 범위 청크 단위 체크섬으로 비교하고 다른 청크만 세분화하여 검사
+
+    같은 벤더끼리는 행 해시 합계(순서 무관)를 DB 에서 계산하고, 벤더가 다르거나 행 해시 SQL 을 지원하지 않는
+    벤더(SQLite 등)는 행 수와 PK 합계만 비교하며 모델 결과를 'count-only' 로 표시한다.
+    """
+
+    # 행 해시 SQL 을 지원하는 벤더
+    CHECKSUM_VENDORS = ('postgresql', 'mysql')
+
+    INTEGER_PK_TYPES = ('AutoField', 'BigAutoField', 'SmallAutoField', 'IntegerField', 'BigIntegerField')
+
+    # 리포트에 남길 불일치 PK 샘플 수
+    SAMPLE_SIZE = 100
+
+    def __init__(self, migrator: DatabaseMigrator, chunk_size=100000, leaf_size=1000, fanout=10, workers=4):
+        self.migrator = migrator
+        self.chunk_size = chunk_size  # 최상위 청크의 PK 범위 크기
+        self.leaf_size = leaf_size  # 이 크기 이하로 좁혀지면 행 단위로 비교
+        self.fanout = fanout  # 불일치 청크를 나누는 하위 범위 수
+        self.workers = workers
+        old_vendor, new_vendor = connections['old_db'].vendor, connections['new_db'].vendor
+        self.row_checksum = old_vendor == new_vendor and old_vendor in self.CHECKSUM_VENDORS
+
+    def run_verification(self, report_path: str) -> dict:
+        """마이그레이션 대상 모델을 병렬로 검증하고 JSON 리포트 작성"""
+        start_time = time.time()
+        models = [model for model in self.migrator.get_migration_order() if self.migrator.should_migrate_model(model)]
+        print(f"\nVerifying {len(models)} models with {self.workers} workers "
+              f"({'row checksum' if self.row_checksum else 'count and pk sum'})...")
+
+        report = {
+            'started': timezone.now().isoformat(),
+            'method': 'checksum' if self.row_checksum else 'count-only',
+            'models': {},
+        }
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for model, result in zip(models, executor.map(self.verify_model, models)):
+                report['models'][model._meta.label] = result
+                print(f"{model._meta.label}: {result['status'].upper()} [{result['method']}] "
+                      f"({result['chunks']} chunks, {len(result['mismatches'])} mismatching ranges)")
+
+        report['duration'] = time.time() - start_time
+        report['mismatching_models'] = [
+            label for label, result in report['models'].items() if result['status'] != 'ok'
+        ]
+
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+
+        print(f"Verification finished in {report['duration']:.2f} seconds, "
+              f"{len(report['mismatching_models'])} mismatching models. Report: {report_path}")
+        return report
+
+    def verify_model(self, model) -> dict:
+        """모델 하나를 최상위 청크부터 검증 (스레드별 DB 연결 사용)"""
+        result = {'status': 'ok', 'method': 'checksum' if self.row_checksum else 'count-only',
+                  'chunks': 0, 'mismatches': []}
+        try:
+            if model._meta.pk.get_internal_type() not in self.INTEGER_PK_TYPES:
+                # PK 범위로 나눌 수 없는 모델은 테이블 전체를 하나의 청크로 비교
+                old = self.get_checksum(model, 'old_db')
+                new = self.get_checksum(model, 'new_db')
+                result['chunks'] = 1
+                if old != new:
+                    result['mismatches'].append({'pk_range': None, 'old': old, 'new': new})
+            else:
+                low, high = self.get_pk_bounds(model)
+                for chunk_low in range(low, high, self.chunk_size):
+                    self.verify_range(model, chunk_low, min(chunk_low + self.chunk_size, high), result)
+        except Exception as e:
+            result['status'] = 'error'
+            result['error'] = str(e)
+        finally:
+            connections.close_all()
+
+        if result['mismatches'] and result['status'] == 'ok':
+            result['status'] = 'mismatch'
+        return result
+
+    def verify_range(self, model, low: int, high: int, result: dict):
+        """[low, high) 체크섬이 다르면 하위 범위로 나누어 다시 비교하고 최소 범위에서 행 단위 비교"""
+        old = self.get_checksum(model, 'old_db', low, high)
+        new = self.get_checksum(model, 'new_db', low, high)
+        result['chunks'] += 1
+        if old == new:
+            return
+
+        if high - low <= self.leaf_size:
+            result['mismatches'].append({
+                'pk_range': [low, high],
+                'old': old,
+                'new': new,
+                **self.diff_rows(model, low, high),
+            })
+            return
+
+        step = -(-(high - low) // self.fanout)
+        for sub_low in range(low, high, step):
+            self.verify_range(model, sub_low, min(sub_low + step, high), result)
+
+    def get_pk_bounds(self, model) -> tuple:
+        """양쪽 DB 를 모두 포함하는 [low, high) PK 범위"""
+        lows, highs = [], []
+        for queryset in (self.migrator.get_source_queryset(model), model._base_manager.using('new_db')):
+            bounds = queryset.aggregate(low=Min('pk'), high=Max('pk'))
+            if bounds['low'] is not None:
+                lows.append(bounds['low'])
+                highs.append(bounds['high'])
+        if not lows:
+            return 0, 0
+        return min(lows), max(highs) + 1
+
+    def get_conditions(self, model, using: str) -> tuple:
+        """old_db 쪽에 적용할 행 필터 조건 목록과 파라미터 (new_db 는 조건 없음)"""
+        if using != 'old_db':
+            return [], []
+        filter_sql, params = self.migrator.get_row_filter_sql(model)
+        return ([filter_sql] if filter_sql else []), params
+
+    def get_row_hash_sql(self, model, using: str) -> str:
+        """행 하나의 해시를 계산하는 SQL 식 (행 체크섬을 쓸 수 없으면 PK 값 자체)"""
+        connection = connections[using]
+        quote_name = connection.ops.quote_name
+        pk_column = quote_name(model._meta.pk.column)
+
+        if not self.row_checksum:
+            if model._meta.pk.get_internal_type() in self.INTEGER_PK_TYPES:
+                return pk_column
+            return '0'
+
+        columns = [quote_name(field.column) for field in model._meta.concrete_fields]
+        if connection.vendor == 'postgresql':
+            return f"('x' || substr(md5(ROW({', '.join(columns)})::text), 1, 16))::bit(64)::bigint"
+        # MySQL (그 외 벤더는 row_checksum 이 False 라 위에서 PK 식을 반환)
+        values = ', '.join(f"COALESCE(CAST({column} AS CHAR), '\\\\N')" for column in columns)
+        return f"CAST(CONV(SUBSTRING(MD5(CONCAT_WS('|', {values})), 1, 16), 16, 10) AS UNSIGNED)"
+
+    def get_checksum(self, model, using: str, low: int = None, high: int = None) -> list:
+        """범위 내 행 수와 순서 무관 해시 합계"""
+        connection = connections[using]
+        quote_name = connection.ops.quote_name
+        sql = (f"SELECT COUNT(*), COALESCE(SUM({self.get_row_hash_sql(model, using)}), 0) "
+               f"FROM {quote_name(model._meta.db_table)}")
+        conditions, params = self.get_conditions(model, using)
+        if low is not None:
+            pk_column = quote_name(model._meta.pk.column)
+            conditions += [f"{pk_column} >= %s", f"{pk_column} < %s"]
+            params += [low, high]
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            count, checksum = cursor.fetchone()
+        return [int(count), str(checksum)]
+
+    def get_row_hashes(self, model, using: str, low: int, high: int) -> dict:
+        connection = connections[using]
+        quote_name = connection.ops.quote_name
+        pk_column = quote_name(model._meta.pk.column)
+        conditions, params = self.get_conditions(model, using)
+        conditions += [f"{pk_column} >= %s", f"{pk_column} < %s"]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT {pk_column}, {self.get_row_hash_sql(model, using)} "
+                f"FROM {quote_name(model._meta.db_table)} WHERE {' AND '.join(conditions)}",
+                params + [low, high]
+            )
+            return {pk: row_hash for pk, row_hash in cursor.fetchall()}
+
+    def diff_rows(self, model, low: int, high: int) -> dict:
+        """최소 범위에서 행 단위 해시를 비교해 누락/추가/변경된 PK 샘플 반환"""
+        old_rows = self.get_row_hashes(model, 'old_db', low, high)
+        new_rows = self.get_row_hashes(model, 'new_db', low, high)
+        missing = sorted(old_rows.keys() - new_rows.keys())
+        extra = sorted(new_rows.keys() - old_rows.keys())
+        different = sorted(pk for pk in old_rows.keys() & new_rows.keys() if old_rows[pk] != new_rows[pk])
+        return {
+            'missing_in_new': missing[:self.SAMPLE_SIZE],
+            'missing_in_old': extra[:self.SAMPLE_SIZE],
+            'different': different[:self.SAMPLE_SIZE],
+        }
+
+
+class MediaSync:
+    """new_db 에 적재된 행이 참조하는 미디어 파일을 원본 저장소에서 대상 저장소로 병렬 복사
+
+    적재된 모델의 모든 FileField(ImageField, ThumbnailerImageField 포함)의 경로를 모아 스레드 풀에서 복사한다.
+    Profile 의 photo_id/card, Category 의 thumbnail, AbstractAttachment 를 상속한 모델의 file 이 대상이다.
+    대상에 크기와 SHA-256 이 같은 파일이 이미 있으면 건너뛰고, 원본에 없는 파일은 리포트에 남긴다.
+    확인/복사한 파일의 원본 크기, 수정 시각, 해시는 상태 파일에 주기적으로 기록하며, 다시 실행하면 크기와 수정 시각이
+    모두 기록과 같은 파일은 해시 계산 없이 건너뛰므로 중단된 지점부터 이어서 진행된다. 같은 크기로 수정된 파일은
+    수정 시각이 달라지므로 다시 해시를 비교한다 (수정 시각을 제공하지 않는 Storage 는 항상 해시를 비교).
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, migrator: DatabaseMigrator, source, target, state_file: str, workers=16, save_every=500):
+        self.migrator = migrator
+        self.source = self.get_storage(source)
+        self.target = self.get_storage(target)
+        self.state_file = state_file
+        self.workers = workers
+        self.save_every = save_every  # 상태 파일을 기록하는 완료 파일 수 간격
+        self.state: Dict[str, list] = {}  # format: {경로: [크기, 원본 수정 시각, sha256], ...}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_storage(location):
+        """디렉터리 경로는 FileSystemStorage 로, Storage 인스턴스(예: storages['media'])는 그대로 사용"""
+        if isinstance(location, (str, os.PathLike)):
+            return FileSystemStorage(location=location)
+        return location
+
+    def collect_paths(self) -> Dict[str, str]:
+        """new_db 의 파일 경로별로 처음 참조한 'app_label.Model.field' (같은 파일은 한 번만 복사)"""
+        paths = {}
+        for model in self.migrator.get_migration_order():
+            if not self.migrator.should_migrate_model(model):
+                continue
+            for field in model._meta.concrete_fields:
+                if not isinstance(field, FileField):
+                    continue
+                queryset = model._base_manager.using('new_db').exclude(**{f"{field.name}__isnull": True}) \
+                    .exclude(**{field.name: ''})
+                for name in queryset.values_list(field.name, flat=True).iterator(chunk_size=10000):
+                    paths.setdefault(name, f"{model._meta.label}.{field.name}")
+        return paths
+
+    def load_state(self):
+        if os.path.exists(self.state_file):
+            with open(self.state_file) as f:
+                self.state = json.load(f)
+
+    def save_state(self):
+        with self.lock:
+            state = dict(self.state)
+        temp_path = f"{self.state_file}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.state_file)
+
+    @staticmethod
+    def get_modified_time(storage, path: str):
+        """파일 수정 시각 (Unix time), Storage 가 지원하지 않으면 None"""
+        try:
+            return storage.get_modified_time(path).timestamp()
+        except NotImplementedError:
+            return None
+
+    def hash_file(self, storage, path: str) -> str:
+        digest = hashlib.sha256()
+        with storage.open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def sync_file(self, path: str) -> tuple:
+        """파일 하나를 확인하고 필요하면 복사 ('copied' | 'skipped' | 'missing', 복사한 바이트 수)"""
+        if not self.source.exists(path):
+            return 'missing', 0
+
+        size = self.source.size(path)
+        modified = self.get_modified_time(self.source, path)
+        target_size = self.target.size(path) if self.target.exists(path) else None
+        source_hash = None
+        if target_size == size:
+            recorded = self.state.get(path)
+            if modified is not None and recorded and recorded[:2] == [size, modified]:
+                # 이전 실행에서 해시까지 확인한 뒤 원본이 바뀌지 않은 파일
+                return 'skipped', 0
+            source_hash = self.hash_file(self.source, path)
+            if self.hash_file(self.target, path) == source_hash:
+                with self.lock:
+                    self.state[path] = [size, modified, source_hash]
+                return 'skipped', 0
+
+        if source_hash is None:
+            source_hash = self.hash_file(self.source, path)
+        # Storage.save 는 같은 이름이 있으면 다른 이름으로 저장하므로 내용이 다른 파일은 먼저 삭제
+        if target_size is not None:
+            self.target.delete(path)
+        with self.source.open(path, 'rb') as f:
+            saved = self.target.save(path, File(f))
+        if saved != path:
+            raise RuntimeError(f"Target storage saved {path} as {saved}")
+
+        with self.lock:
+            self.state[path] = [size, modified, source_hash]
+        return 'copied', size
+
+    def run(self, report_path: str) -> dict:
+        """참조된 모든 파일을 병렬로 동기화하고 JSON 리포트 작성"""
+        start_time = time.time()
+        self.load_state()
+        paths = self.collect_paths()
+        print(f"\nSyncing {len(paths)} media files with {self.workers} workers "
+              f"({len(self.state)} already verified in {self.state_file})...")
+
+        counts = defaultdict(int)
+        copied_bytes = 0
+        missing = []
+        failed = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {executor.submit(self.sync_file, path): path for path in paths}
+                for completed, future in enumerate(as_completed(futures), 1):
+                    path = futures[future]
+                    try:
+                        status, size = future.result()
+                    except Exception as e:
+                        status, size = 'failed', 0
+                        failed.append({'path': path, 'field': paths[path], 'error': str(e)})
+                    counts[status] += 1
+                    copied_bytes += size
+                    if status == 'missing':
+                        missing.append({'path': path, 'field': paths[path]})
+
+                    if completed % self.save_every == 0:
+                        self.save_state()
+                        print(f"{completed}/{len(paths)} media files checked "
+                              f"({counts['copied']} copied, {counts['skipped']} skipped, "
+                              f"{counts['missing']} missing, {counts['failed']} failed)")
+        finally:
+            # 중단되어도 확인한 파일까지는 다음 실행에서 건너뜀
+            self.save_state()
+
+        report = {
+            'started': datetime.datetime.fromtimestamp(start_time, datetime.timezone.utc).isoformat(),
+            'duration': time.time() - start_time,
+            'files': len(paths),
+            'copied': counts['copied'],
+            'skipped': counts['skipped'],
+            'copied_bytes': copied_bytes,
+            'missing': missing,
+            'failed': failed,
+        }
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+
+        print(f"Media sync finished in {report['duration']:.2f} seconds: {counts['copied']} copied "
+              f"({copied_bytes / 1024 / 1024:.1f} MB), {counts['skipped']} skipped, {len(missing)} missing, "
+              f"{len(failed)} failed. Report: {report_path}")
+        return report
+
+
 # 마이그레이션 앱
 target_apps = [
     'contenttypes',  # 모델의 콘텐츠 타입 정보
@@ -418,5 +3547,153 @@ exclude_models = [
     # 'member.newprofile'
 ]
 
-migrator = DatabaseMigrator(app_labels=target_apps, batch_size=5000, exclude_models=exclude_models)
-migrator.run_migration()
+# 병렬 마이그레이션 워커 수 (1 = 순차 실행)
+workers = 1
+
+# 모델별 전송 엔진 지정 ('orm': bulk_create, 'copy': COPY / LOAD DATA, 'stream': 행 튜플 다중 행 INSERT)
+engines = {
+    # 'shop.naveradvertisementlog': 'copy',
+    # 'member.loginlog': 'copy',
+}
+
+# PK 범위로 나누어 병렬 복사할 대용량 모델과 샤드 수
+shards = {
+    # 'shop.naveradvertisementlog': 4,
+    # 'member.loginlog': 4,
+    # 'shop.voucher': 4,
+}
+
+# 마이그레이션 모드 ('full': 전체 복사, 'delta': 이전 실행 워터마크 이후 변경분만 upsert,
+#                  'merge': 전체 행을 upsert 하고 삽입/갱신/변경 없음 행 수 보고)
+mode = 'full'
+delta_state_file = 'migrate_delta.json'
+
+# 진행률 표시에 정확한 COUNT(*) 사용 여부 (False 면 카탈로그 통계 추정치)
+exact_counts = False
+
+# 모델별 처리 속도 기록 파일 (plan 의 예상 소요 시간 계산에 사용)
+stats_file = 'migrate_stats.json'
+
+# True 면 복사하지 않고 예상 행 수, 크기, 소요 시간만 출력
+plan_only = False
+
+# 적재 전 new_db 보조 인덱스 삭제 후 적재 완료 시 병렬 재생성 여부
+rebuild_indexes = False
+
+# 좁은 컬럼을 먼저 복사하고 나중에 별도 단계로 채우는 큰 컬럼 (모델: 필드 이름 목록)
+heavy_fields = {
+    'member.profile': ['photo_id', 'card'],
+    'member.mmsdata': ['data'],
+    'member.phoneverificationlog': ['ci'],
+    'shop.emailtemplate': ['html_content'],
+    'shop.order': ['user_agent', 'message'],
+    'shop.naveradvertisementlog': ['user_agent'],
+}
+
+# 읽기/쓰기 파이프라인 큐 깊이 (배치 수, 0 이면 순차 실행) 및 쓰기 스레드 수
+pipeline_depth = 0
+pipeline_writers = 1
+
+# merge 모드는 PK 로 upsert 하며, 여기 지정한 유니크 키를 다른 PK 의 행이 이미 쓰고 있는 행은 유니크 제약 위반으로
+# 중단되지 않도록 건너뛰고 건너뜀으로 보고 (대상의 오래된 행을 정리한 뒤 다시 실행)
+merge_keys = {
+    'shop.voucher': ['product', 'code'],
+    'shop.order': ['order_no'],
+    'shop.store': ['code'],
+}
+
+# 병렬 워커들이 old_db 를 같은 시점의 스냅샷으로 읽을지 여부 (운영 중인 old_db 에서 Order/OrderProduct/
+# OrderPayment 등의 정합성 유지). PostgreSQL 은 pg_export_snapshot 으로 모든 연결이 하나의 스냅샷을 공유하고,
+# MySQL 은 연결(모델/샤드)마다 START TRANSACTION WITH CONSISTENT SNAPSHOT 으로 시작한다.
+consistent_snapshot = False
+
+# 적재 후 MPTT 모델(Category, MenuItem 등)의 트리 값을 일괄 재계산할지 여부
+rebuild_trees = False
+
+# 행당 메모리와 쓰기 지연을 측정해 배치 크기를 자동 조정할지 여부
+adaptive_batches = False
+
+# 스풀 단계 (None: old_db → new_db 직접 전송, 'export': old_db 를 spool_dir 에 Parquet 로 내보냄,
+# 'import': old_db 에 접속하지 않고 spool_dir 의 파일을 new_db 에 적재, pyarrow 필요)
+spool_stage = None
+spool_dir = 'migrate_spool'
+
+# 모델별로 옮길 행 조건 (보관 기한이 지난 로그, 만료된 세션, 삭제 표시된 행 등 제외). 조건은 모델 자신의
+# 컬럼만 사용해야 하며, 다른 모델이 참조하는 행을 제외하면 참조하는 행의 외래키가 깨지므로 주의
+row_filters = {
+    # 'sessions.session': Q(expire_date__gt=timezone.now()),
+    # 'member.loginlog': Q(created__gte=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)),
+    # 'shop.naveradvertisementlog': Q(created__gte=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)),
+    # 'shop.shortmessageservice': Q(created__gte=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)),
+    # 'shop.noticemessage': Q(is_removed=False),
+}
+
+# 실행 보고서 (모델별 행 수, 바이트, 읽기/쓰기 시간, 배치 지연 백분위수, 인덱스 재생성/시퀀스 조정 시간)
+# JSON 파일 및 Prometheus 텍스트 포맷 파일 경로 (None 이면 기록 안 함)
+report_file = 'migrate_report.json'
+prometheus_file = None
+telemetry_sinks = []
+if report_file:
+    telemetry_sinks.append(JsonReportSink(report_file))
+if prometheus_file:
+    telemetry_sinks.append(PrometheusSink(prometheus_file))
+
+# 적재 동안 new_db 세션 설정 프로파일 (None: 변경 없음,
+# 'bulk': PostgreSQL synchronous_commit=off, maintenance_work_mem=1GB / MySQL unique_checks=0, foreign_key_checks=0,
+# 'unchecked': bulk + PostgreSQL session_replication_role=replica (외래키 트리거 생략, 슈퍼유저 필요) /
+#              MySQL sql_log_bin=0). 실행이 끝나면(실패해도) 세션 기본값으로 복구
+load_profile = None
+
+# PostgreSQL 에서 다른 테이블이 참조하지 않는 테이블(로그 테이블 등)을 full 모드 적재 동안 UNLOGGED 로 전환
+unlogged_tables = False
+
+# 마이그레이션 후 old_db/new_db 체크섬 비교 리포트 (None 이면 검증 생략). 전체 테이블을 양쪽에서 해시하므로
+# delta 모드와 스풀 단계에서는 생략
+verify_report = None  # 예: 'migrate_verify.json'
+
+# 적재 후 모든 외래키의 고아 행(참조 대상이 없는 행) 검사 리포트 (None 이면 검사 생략, full 모드에서만 실행)
+# 고아 행이 있으면 워터마크를 기록하지 않고 실패 처리
+integrity_report = None  # 예: 'migrate_integrity.json'
+
+# 적재 후 행이 참조하는 미디어 파일(Profile 신분증/카드 이미지, 카테고리 썸네일, 첨부 파일 등) 동기화
+# 원본/대상은 디렉터리 경로 또는 Storage 인스턴스 (예: django.core.files.storage.storages['media']),
+# 둘 중 하나라도 None 이면 생략. 상태 파일에 확인한 파일을 기록해 다시 실행하면 이어서 진행
+media_source = None  # 예: '/home/pincoin/www/media'
+media_target = None  # 예: '/home/mango/www/media'
+media_state_file = 'migrate_media.json'
+media_report = 'migrate_media_report.json'
+media_workers = 16
+
+# 체크포인트 디렉터리 (None 이면 사용 안 함) 및 이어하기 여부
+checkpoint_dir = 'migrate_checkpoints'
+resume = False
+
+# manage.py shell 로 실행할 때만 마이그레이션 수행 (벤치마크 등에서 scripts.migrate_db 모듈로 import 하면
+# 클래스만 사용하고 실행하지 않음)
+if __name__ != 'scripts.migrate_db':
+    migrator = DatabaseMigrator(app_labels=target_apps, batch_size=5000, exclude_models=exclude_models,
+                                workers=workers, engines=engines, checkpoint_dir=checkpoint_dir, resume=resume,
+                                shards=shards, mode=mode, delta_state_file=delta_state_file, exact_counts=exact_counts,
+                                stats_file=stats_file, rebuild_indexes=rebuild_indexes, heavy_fields=heavy_fields,
+                                pipeline_depth=pipeline_depth, pipeline_writers=pipeline_writers,
+                                adaptive_batches=adaptive_batches, merge_keys=merge_keys,
+                                rebuild_trees=rebuild_trees, consistent_snapshot=consistent_snapshot,
+                                spool_stage=spool_stage, spool_dir=spool_dir, row_filters=row_filters,
+                                telemetry_sinks=telemetry_sinks, load_profile=load_profile,
+                                unlogged_tables=unlogged_tables, integrity_report=integrity_report)
+
+    if plan_only:
+        migrator.print_plan()
+    else:
+        migrator.run_migration()
+
+        # 스풀 단계는 old_db 와 new_db 를 함께 읽지 않고, delta 는 변경분만 옮기는 짧은 실행이므로 검증 생략
+        if verify_report and spool_stage is None and migrator.mode != 'delta':
+            MigrationVerifier(migrator, workers=max(workers, 4)).run_verification(verify_report)
+        elif verify_report:
+            print("\nSkipping checksum verification (delta mode or spool stage)")
+
+        # 스풀 내보내기 단계는 new_db 에 행이 없으므로 적재 단계에서 동기화
+        if media_source and media_target and spool_stage != 'export':
+            MediaSync(migrator, media_source, media_target, media_state_file,
+                      workers=media_workers).run(media_report)